@@ -1,15 +1,48 @@
 """
-API Dependencies — Authentication
+API Dependencies — Authentication and app-scoped services
 """
-from fastapi import Depends, HTTPException, Header
-from typing import Dict, Optional
+from fastapi import Depends, HTTPException, Header, Request
+from typing import Dict, Optional, Tuple
 from jose import jwt, JWTError
+from app.core.cache import LRUCache
 from app.core.config import get_settings
+from app.services.container import ServiceContainer
+from app.services.database import DatabaseService
+from app.services.health import HealthMonitor
+from app.services.matching import MatchingService
+from app.services.recommendation_queue import RecommendationQueue
+import hashlib
 import logging
+import time
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# sha256(token) -> (claims, exp). Only signature-verified tokens with an exp
+# claim are cached, and only until JWT_CACHE_EXPIRY_SKEW_SECONDS before exp.
+_verified_tokens: LRUCache[Tuple[Dict, float]] = LRUCache(maxsize=max(1, settings.JWT_CACHE_SIZE), name="verified_tokens")
+
+
+def _cached_claims(token_key: bytes) -> Optional[Dict]:
+    entry = _verified_tokens.get(token_key)
+    if entry is None:
+        return None
+    claims, exp = entry
+    # Wall-clock check on every hit, independent of the LRU's own TTL
+    if time.time() >= exp - settings.JWT_CACHE_EXPIRY_SKEW_SECONDS:
+        _verified_tokens.pop(token_key)
+        return None
+    return dict(claims)
+
+
+def _cache_claims(token_key: bytes, claims: Dict):
+    exp = claims.get("exp")
+    if not isinstance(exp, (int, float)):
+        return
+    ttl = exp - settings.JWT_CACHE_EXPIRY_SKEW_SECONDS - time.time()
+    if ttl > 0:
+        _verified_tokens.set(token_key, (dict(claims), float(exp)), ttl=ttl)
+
 
 async def get_current_user(authorization: Optional[str] = Header(None)) -> Dict:
     """
@@ -18,6 +51,9 @@ async def get_current_user(authorization: Optional[str] = Header(None)) -> Dict:
     - When SUPABASE_JWT_SECRET is set (production): full HS256 signature + expiry verification.
     - When not set (local dev only): signature check is skipped with a loud warning.
       This path must never be reached in production.
+
+    Verified claims are cached per token until shortly before `exp`, so a
+    token presented repeatedly is only verified once per worker.
     """
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Authorization header required")
@@ -26,6 +62,13 @@ async def get_current_user(authorization: Optional[str] = Header(None)) -> Dict:
     if not token:
         raise HTTPException(status_code=401, detail="Bearer token is empty")
 
+    cache_enabled = bool(settings.SUPABASE_JWT_SECRET) and settings.JWT_CACHE_SIZE > 0
+    if cache_enabled:
+        token_key = hashlib.sha256(token.encode()).digest()
+        cached = _cached_claims(token_key)
+        if cached is not None:
+            return cached
+
     try:
         if settings.SUPABASE_JWT_SECRET:
             decoded = jwt.decode(
@@ -50,8 +93,35 @@ async def get_current_user(authorization: Optional[str] = Header(None)) -> Dict:
         if not decoded.get("sub"):
             raise HTTPException(status_code=401, detail="Invalid token")
 
+        if cache_enabled:
+            _cache_claims(token_key, decoded)
         return decoded
 
     except JWTError:
         # Do NOT forward the raw JWTError message — it can leak token structure details
         raise HTTPException(status_code=401, detail="Invalid or expired token")
+
+
+def get_services(request: Request) -> ServiceContainer:
+    """The container built in the lifespan hook (app.main)"""
+    return request.app.state.services
+
+
+def get_db(services: ServiceContainer = Depends(get_services)) -> DatabaseService:
+    return services.db
+
+
+def get_matching(services: ServiceContainer = Depends(get_services)) -> MatchingService:
+    return services.matching
+
+
+def get_recommendation_queue(services: ServiceContainer = Depends(get_services)) -> RecommendationQueue:
+    return services.recommendation_queue
+
+
+def get_notifications(services: ServiceContainer = Depends(get_services)):
+    return services.notifications
+
+
+def get_health(services: ServiceContainer = Depends(get_services)) -> HealthMonitor:
+    return services.health
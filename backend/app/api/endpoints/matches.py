@@ -1,73 +1,237 @@
 """
 Matching & Swipe API Endpoints
 """
-from fastapi import APIRouter, HTTPException, Depends, Request
-from typing import Dict
-from app.models.schemas import SwipeAction
+import uuid
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Request
+from typing import Dict, Literal, Optional
+from app.models.schemas import RecommendationView, SwipeAction, SwipeBatch
 from app.services.database import DatabaseService
 from app.services.matching import MatchingService
-from app.api.dependencies import get_current_user
+from app.services.recommendation_queue import RecommendationQueue
+from app.core.config import get_settings
+from app.api.dependencies import get_current_user, get_db, get_matching, get_recommendation_queue
 from app.core.limiter import limiter
+from app.core.pagination import decode_cursor
+from app.core.responses import FastJSONResponse
+from app.core.streaming import StreamFormat, event_stream
 import logging
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 
-@router.get("/recommendations", response_model=dict)
+@router.get("/recommendations", response_class=FastJSONResponse)
 @limiter.limit("20/minute")
 async def get_recommendations(
     request: Request,
     limit: int = 10,
+    view: RecommendationView = "full",
     current_user: Dict = Depends(get_current_user),
+    matching: MatchingService = Depends(get_matching),
+    recommendation_queue: RecommendationQueue = Depends(get_recommendation_queue),
 ):
+    """
+    `view=compact` returns only what the swipe card renders; fetch the rest
+    for a card from /recommendations/{user_id} when it is needed.
+    """
     auth_id = current_user["sub"]
 
     # Clamp limit to prevent overfetching
     limit = max(1, min(limit, 50))
 
-    matching = MatchingService()
     try:
-        recommendations = await matching.get_recommendations(auth_id, limit)
-        return {"recommendations": recommendations, "count": len(recommendations)}
+        if settings.RECOMMENDATION_QUEUE_ENABLED:
+            recommendations = await recommendation_queue.peek(auth_id, limit)
+        else:
+            recommendations = await matching.get_recommendations(auth_id, limit)
+        if view == "compact":
+            recommendations = [matching.compact_recommendation(card) for card in recommendations]
+        return FastJSONResponse({"recommendations": recommendations, "count": len(recommendations)})
     except Exception as e:
         logger.error(f"Recommendations failed for {auth_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch recommendations")
 
 
-@router.post("/swipe", response_model=dict)
+@router.get("/recommendations/stream")
+@limiter.limit("20/minute")
+async def stream_recommendations(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    limit: int = 10,
+    view: RecommendationView = "full",
+    format: StreamFormat = "ndjson",
+    current_user: Dict = Depends(get_current_user),
+    matching: MatchingService = Depends(get_matching),
+    recommendation_queue: RecommendationQueue = Depends(get_recommendation_queue),
+):
+    """
+    /recommendations as a stream (`format=ndjson` or `sse`): a "card" event
+    per card as soon as it is scored, then a "done" event whose `order`
+    is the final ranking. A warm recommendation queue is sent at once; a
+    cold one is filled after the stream, so the next swipes carry next_cards.
+    """
+    auth_id = current_user["sub"]
+
+    # Clamp limit to prevent overfetching
+    limit = max(1, min(limit, 50))
+
+    async def from_queue(cards):
+        for card in cards:
+            yield "card", card
+        yield "done", {"order": [card["user_id"] for card in cards], "count": len(cards)}
+
+    try:
+        queued = await recommendation_queue.ready(auth_id, limit) if settings.RECOMMENDATION_QUEUE_ENABLED else []
+    except Exception as e:
+        logger.error(f"Recommendations failed for {auth_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch recommendations")
+
+    if len(queued) == limit:
+        source = from_queue(queued)
+    else:
+        source = matching.stream_recommendations(auth_id, limit)
+        if settings.RECOMMENDATION_QUEUE_ENABLED:
+            background_tasks.add_task(recommendation_queue.top_up, auth_id)
+
+    async def events():
+        async for event, data in source:
+            if event == "card" and view == "compact":
+                data = matching.compact_recommendation(data)
+            yield event, data
+
+    return event_stream(events(), format)
+
+
+@router.get("/recommendations/{user_id}", response_class=FastJSONResponse)
+@limiter.limit("60/minute")
+async def get_recommendation_details(
+    request: Request,
+    user_id: str,
+    current_user: Dict = Depends(get_current_user),
+    matching: MatchingService = Depends(get_matching),
+):
+    """Full card (answers, category scores, explanation, socials) for one candidate"""
+    auth_id = current_user["sub"]
+
+    try:
+        user_id = str(uuid.UUID(user_id))
+    except ValueError:
+        raise HTTPException(status_code=422, detail="Invalid user_id")
+
+    try:
+        card = await matching.get_recommendation_details(auth_id, user_id)
+    except Exception as e:
+        logger.error(f"Recommendation details failed for {auth_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch recommendation")
+    if card is None:
+        raise HTTPException(status_code=404, detail="Recommendation not found")
+    return FastJSONResponse(card)
+
+
+@router.post("/swipe", response_class=FastJSONResponse)
 @limiter.limit("60/minute")
 async def record_swipe(
     request: Request,
     swipe: SwipeAction,
+    background_tasks: BackgroundTasks,
     current_user: Dict = Depends(get_current_user),
+    matching: MatchingService = Depends(get_matching),
+    recommendation_queue: RecommendationQueue = Depends(get_recommendation_queue),
 ):
+    """
+    With `prefetch` > 0 the response carries `next_cards`: the head of the
+    caller's recommendation queue after this swipe, replacing any cards
+    received earlier. It is served from what is already queued and the queue
+    is topped up after the response is sent.
+    """
     auth_id = current_user["sub"]
 
+    # Canonical form, so the match is announced on the channel its target subscribes to
+    try:
+        target_user_id = str(uuid.UUID(swipe.target_user_id))
+    except ValueError:
+        raise HTTPException(status_code=422, detail="Invalid target_user_id")
+
     # Prevent self-swipe
-    if swipe.target_user_id == auth_id:
+    if target_user_id == auth_id:
         raise HTTPException(status_code=400, detail="Cannot swipe on yourself")
 
-    matching = MatchingService()
     try:
-        result = await matching.process_swipe(auth_id, swipe.target_user_id, swipe.action)
-        return result
+        result = await matching.process_swipe(auth_id, target_user_id, swipe.action)
+        if swipe.prefetch and settings.RECOMMENDATION_QUEUE_ENABLED:
+            next_cards = await recommendation_queue.ready(auth_id, swipe.prefetch)
+            if swipe.view == "compact":
+                next_cards = [matching.compact_recommendation(card) for card in next_cards]
+            result["next_cards"] = next_cards
+            background_tasks.add_task(recommendation_queue.top_up, auth_id)
+        return FastJSONResponse(result)
     except Exception as e:
         logger.error(f"Swipe failed for {auth_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to record swipe")
 
 
-@router.get("/matches", response_model=dict)
+@router.post("/swipes/batch", response_class=FastJSONResponse)
+@limiter.limit("10/minute")
+async def record_swipes_batch(
+    request: Request,
+    batch: SwipeBatch,
+    current_user: Dict = Depends(get_current_user),
+    matching: MatchingService = Depends(get_matching),
+):
+    """
+    Submit queued swipes in order (up to 100). One bulk write and one
+    reciprocity check; returns a result per swipe in the same order.
+    """
+    auth_id = current_user["sub"]
+
+    swipes = []
+    for swipe in batch.swipes:
+        # Prevent self-swipe
+        if swipe.target_user_id == auth_id:
+            raise HTTPException(status_code=400, detail="Cannot swipe on yourself")
+        try:
+            target_user_id = str(uuid.UUID(swipe.target_user_id))
+        except ValueError:
+            raise HTTPException(status_code=422, detail=f"Invalid target_user_id: {swipe.target_user_id[:64]}")
+        swipes.append((target_user_id, swipe.action))
+
+    try:
+        results = await matching.process_swipes_batch(auth_id, swipes)
+        return FastJSONResponse({
+            "results": results,
+            "count": len(results),
+            "matches_created": len({r["match_id"] for r in results if r["match_created"]}),
+        })
+    except Exception as e:
+        logger.error(f"Batch swipe failed for {auth_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to record swipes")
+
+
+@router.get("/matches", response_class=FastJSONResponse)
 @limiter.limit("30/minute")
 async def get_matches(
     request: Request,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    order_by: Literal["created_at", "compatibility_score"] = "created_at",
     current_user: Dict = Depends(get_current_user),
+    db: DatabaseService = Depends(get_db),
 ):
     auth_id = current_user["sub"]
-    db = DatabaseService()
+
+    # Clamp page size
+    limit = max(1, min(limit, 100))
+
+    if cursor:
+        try:
+            decode_cursor(cursor, order_by)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
     try:
-        matches = await db.get_user_matches_by_auth_id(auth_id)
-        return {"matches": matches, "count": len(matches)}
+        matches, next_cursor = await db.get_user_matches_by_auth_id(auth_id, order_by, limit, cursor)
+        return FastJSONResponse({"matches": matches, "count": len(matches), "next_cursor": next_cursor})
     except Exception as e:
         logger.error(f"Matches fetch failed for {auth_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch matches")
@@ -78,17 +242,11 @@ async def get_matches(
 async def get_user_stats(
     request: Request,
     current_user: Dict = Depends(get_current_user),
+    db: DatabaseService = Depends(get_db),
 ):
     auth_id = current_user["sub"]
-    db = DatabaseService()
     try:
-        matches = await db.get_user_matches_by_auth_id(auth_id)
-        super_matches = [m for m in matches if m.get("is_super_match")]
-        return {
-            "total_matches": len(matches),
-            "super_matches": len(super_matches),
-            "regular_matches": len(matches) - len(super_matches),
-        }
+        return await db.get_user_match_stats_by_auth_id(auth_id)
     except Exception as e:
         logger.error(f"Stats fetch failed for {auth_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch stats")
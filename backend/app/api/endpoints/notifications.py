@@ -0,0 +1,53 @@
+"""
+Notification API Endpoints
+"""
+from fastapi import APIRouter, Depends, HTTPException, Request
+from typing import Dict
+from app.services.database import DatabaseService
+from app.services.notifications import user_channel
+from app.core.config import get_settings
+from app.api.dependencies import get_current_user, get_db, get_notifications
+from app.core.limiter import limiter
+from app.core.streaming import StreamFormat, event_stream
+import logging
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+@router.get("/stream")
+@limiter.limit("10/minute")
+async def stream_notifications(
+    request: Request,
+    format: StreamFormat = "sse",
+    current_user: Dict = Depends(get_current_user),
+    db: DatabaseService = Depends(get_db),
+    notifications=Depends(get_notifications),
+):
+    """
+    Long-lived stream of the caller's events (`format=sse` or `ndjson`):
+    "ready" once subscribed, "match" with {match_id, user_id, is_super_match,
+    compatibility_score} whenever a match is created, and "ping" when idle.
+    Events are not replayed; reload /matches after reconnecting.
+    """
+    auth_id = current_user["sub"]
+
+    try:
+        user = await db.get_user_identity(auth_id)
+    except Exception as e:
+        logger.error(f"Notification stream failed for {auth_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to open notification stream")
+    if not user:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    async def events():
+        async with notifications.subscribe(user_channel(user["id"])) as subscription:
+            yield "ready", {}
+            async for message in subscription.messages(settings.NOTIFICATIONS_HEARTBEAT_SECONDS):
+                if message is None:
+                    yield "ping", {}
+                else:
+                    yield message["event"], message["data"]
+
+    return event_stream(events(), format)
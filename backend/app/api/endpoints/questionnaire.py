@@ -7,16 +7,21 @@ from typing import Dict, Any
 from app.services.questionnaire import get_all_questions, validate_answer
 from app.services.database import DatabaseService
 from app.services.matching import MatchingService
-from app.api.dependencies import get_current_user
+from app.api.dependencies import get_current_user, get_db, get_matching
 from app.core.limiter import limiter
+from app.core.static_payload import StaticPayload
 
 router = APIRouter(prefix="/questionnaire", tags=["questionnaire"])
-db = DatabaseService()
 
+# The questionnaire only changes on deploy: serialize it once at import
+_all_questions = get_all_questions()
+QUESTIONS_PAYLOAD = StaticPayload(
+    {"success": True, "questions": _all_questions, "total_questions": len(_all_questions)}
+)
 
-async def _regenerate_embedding(auth_id: str, updated_user: Dict[str, Any]):
+
+async def _regenerate_embedding(matching: MatchingService, auth_id: str, updated_user: Dict[str, Any]):
     try:
-        matching = MatchingService()
         await matching.generate_and_store_embedding(auth_id, updated_user)
     except Exception:
         pass
@@ -25,11 +30,7 @@ async def _regenerate_embedding(auth_id: str, updated_user: Dict[str, Any]):
 @router.get("/questions")
 @limiter.limit("30/minute")
 async def get_questions(request: Request):
-    try:
-        questions = get_all_questions()
-        return {"success": True, "questions": questions, "total_questions": len(questions)}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Failed to fetch questions")
+    return QUESTIONS_PAYLOAD.response(request)
 
 
 @router.post("/submit")
@@ -39,6 +40,8 @@ async def submit_answers(
     answers: Dict[str, Any],
     background_tasks: BackgroundTasks,
     current_user: Dict = Depends(get_current_user),
+    db: DatabaseService = Depends(get_db),
+    matching: MatchingService = Depends(get_matching),
 ):
     auth_id = current_user["sub"]
 
@@ -78,7 +81,7 @@ async def submit_answers(
 
         if updated_user:
             merged_profile = {**user, "question_answers": merged_answers}
-            background_tasks.add_task(_regenerate_embedding, auth_id, merged_profile)
+            background_tasks.add_task(_regenerate_embedding, matching, auth_id, merged_profile)
 
         return {"success": True, "answers_count": len(sanitized)}
 
@@ -93,10 +96,11 @@ async def submit_answers(
 async def get_my_answers(
     request: Request,
     current_user: Dict = Depends(get_current_user),
+    db: DatabaseService = Depends(get_db),
 ):
     auth_id = current_user["sub"]
     try:
-        user = await db.get_user_by_auth_id(auth_id)
+        user = await db.get_user_scoring_view(auth_id)
         if not user:
             raise HTTPException(status_code=404, detail="Profile not found")
 
@@ -8,7 +8,8 @@ from typing import Optional, Dict
 from app.models.schemas import ProfileEmbedding, UserPhoto, PhotoUpload
 from app.services.database import DatabaseService
 from app.services.matching import MatchingService
-from app.api.dependencies import get_current_user
+from app.services.recommendation_queue import RecommendationQueue
+from app.api.dependencies import get_current_user, get_db, get_matching, get_recommendation_queue
 from app.core.limiter import limiter
 import logging
 
@@ -133,9 +134,9 @@ async def create_or_update_profile(
     request: Request,
     profile: ProfileEmbedding,
     current_user: Dict = Depends(get_current_user),
+    db: DatabaseService = Depends(get_db),
+    matching: MatchingService = Depends(get_matching),
 ):
-    db = DatabaseService()
-    matching = MatchingService()
     auth_id = current_user["sub"]
     email = current_user.get("email") or f"{auth_id}@prommatch.app"
 
@@ -144,9 +145,7 @@ async def create_or_update_profile(
         raw_allowed = {k: v for k, v in raw.items() if k in ALLOWED_COLUMNS}
         profile_data = _validate_profile(raw_allowed)
 
-        existing = await db.get_user_by_auth_id(auth_id)
-
-        if existing:
+        if await db.user_exists(auth_id):
             await db.update_user_by_auth_id(auth_id, profile_data)
             action = "updated"
         else:
@@ -171,12 +170,12 @@ async def check_profile_exists(
     request: Request,
     auth_id: str,
     current_user: Dict = Depends(get_current_user),
+    db: DatabaseService = Depends(get_db),
 ):
     """Only the account owner may check their own profile status."""
     if current_user["sub"] != auth_id:
         raise HTTPException(status_code=403, detail="Forbidden")
 
-    db = DatabaseService()
     try:
         exists = await db.user_exists(auth_id)
         return {"exists": exists}
@@ -191,6 +190,7 @@ async def get_profile(
     request: Request,
     auth_id: str,
     current_user: Dict = Depends(get_current_user),
+    db: DatabaseService = Depends(get_db),
 ):
     """
     Fetch a profile. Only the owner may fetch their own full profile
@@ -200,14 +200,12 @@ async def get_profile(
     if current_user["sub"] != auth_id:
         raise HTTPException(status_code=403, detail="Forbidden")
 
-    db = DatabaseService()
     try:
+        # Owner view never includes the vector embedding
         profile = await db.get_user_by_auth_id(auth_id)
         if not profile:
             raise HTTPException(status_code=404, detail="Profile not found")
 
-        # Never return the vector embedding to the client
-        profile.pop("embedding", None)
         return {"profile": profile}
 
     except HTTPException:
@@ -225,9 +223,9 @@ async def add_photo(
     request: Request,
     photo: PhotoUpload,
     current_user: Dict = Depends(get_current_user),
+    db: DatabaseService = Depends(get_db),
 ):
     auth_id = current_user["sub"]
-    db = DatabaseService()
 
     # Validate URL
     url = str(photo.url).strip()
@@ -237,7 +235,7 @@ async def add_photo(
         raise HTTPException(status_code=422, detail="Photo URL too long")
 
     try:
-        user = await db.get_user_by_auth_id(auth_id)
+        user = await db.get_user_identity(auth_id)
         if not user:
             raise HTTPException(status_code=404, detail="Profile not found")
 
@@ -268,12 +266,12 @@ async def delete_photo(
     request: Request,
     photo_id: str,
     current_user: Dict = Depends(get_current_user),
+    db: DatabaseService = Depends(get_db),
 ):
     auth_id = current_user["sub"]
-    db = DatabaseService()
 
     try:
-        user = await db.get_user_by_auth_id(auth_id)
+        user = await db.get_user_identity(auth_id)
         if not user:
             raise HTTPException(status_code=404, detail="Profile not found")
 
@@ -306,14 +304,14 @@ async def get_photos(
     request: Request,
     auth_id: str,
     current_user: Dict = Depends(get_current_user),
+    db: DatabaseService = Depends(get_db),
 ):
     """Only the owner can retrieve their own photos via this endpoint."""
     if current_user["sub"] != auth_id:
         raise HTTPException(status_code=403, detail="Forbidden")
 
-    db = DatabaseService()
     try:
-        user = await db.get_user_by_auth_id(auth_id)
+        user = await db.get_user_identity(auth_id)
         if not user:
             raise HTTPException(status_code=404, detail="Profile not found")
 
@@ -335,6 +333,8 @@ async def delete_account(
     request: Request,
     auth_id: str,
     current_user: Dict = Depends(get_current_user),
+    db: DatabaseService = Depends(get_db),
+    recommendation_queue: RecommendationQueue = Depends(get_recommendation_queue),
 ):
     from app.core.config import get_settings
     from supabase import create_client
@@ -342,7 +342,6 @@ async def delete_account(
     if current_user["sub"] != auth_id:
         raise HTTPException(status_code=403, detail="Forbidden")
 
-    db = DatabaseService()
     cfg = get_settings()
 
     try:
@@ -350,6 +349,8 @@ async def delete_account(
         if not deleted:
             raise HTTPException(status_code=404, detail="Account not found")
 
+        recommendation_queue.invalidate(auth_id)
+
         # Best-effort: delete the Supabase auth user as well
         try:
             admin_client = create_client(cfg.SUPABASE_URL, cfg.SUPABASE_SERVICE_KEY)
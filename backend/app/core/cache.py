@@ -0,0 +1,76 @@
+"""
+Small in-process caches.
+Everything here is per worker process and safe to use from a single event loop.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Optional, Tuple, TypeVar
+
+from app.core.metrics import cache_counters
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class LRUCache(Generic[V]):
+    """
+    Bounded least-recently-used map with an optional per-entry TTL.
+    Expired entries are treated as misses and dropped on access.
+    A `name` also exports hits and misses as cache_requests_total{cache=name}.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None, name: Optional[str] = None):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[V, Optional[float]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._hit_counter = self._miss_counter = None
+        if name is not None:
+            self._hit_counter, self._miss_counter = cache_counters(name)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            self._miss()
+            return default
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            self._miss()
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        if self._hit_counter is not None:
+            self._hit_counter.inc()
+        return value
+
+    def _miss(self):
+        self.misses += 1
+        if self._miss_counter is not None:
+            self._miss_counter.inc()
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None):
+        """Store `value`; `ttl` overrides the cache-wide TTL for this entry."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def clear(self):
+        self._data.clear()
@@ -4,5 +4,17 @@ Import this in main.py and all endpoint files.
 """
 from slowapi import Limiter
 from slowapi.util import get_remote_address
+from app.core.config import get_settings
+import app.core.rate_limit_storage  # noqa: F401 - registers the shm:// storage scheme
 
-limiter = Limiter(key_func=get_remote_address)
+settings = get_settings()
+
+# memory:// counts per worker process; use redis:// (shared across hosts) or
+# shm:// (shared across workers on one host) when running several workers
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI,
+    enabled=settings.RATE_LIMIT_ENABLED,
+    # Keep serving with per-worker limits if a shared store becomes unreachable
+    in_memory_fallback_enabled=not settings.RATE_LIMIT_STORAGE_URI.startswith("memory://"),
+)
@@ -0,0 +1,116 @@
+"""
+Prometheus metrics.
+
+    http_request_duration_seconds{method,route,status}   every request, by route template,
+                                                         except streams
+    http_stream_duration_seconds{route,status}           NDJSON/SSE responses, connect to close
+    pipeline_stage_duration_seconds{stage}               find_matches, compatibility, ai_boost,
+                                                         serialize, compress
+    dependency_call_duration_seconds{dependency,operation}
+    dependency_calls_total{dependency,operation,outcome} database and embedding API calls
+    cache_requests_total{cache,result}                   hit/miss per named LRUCache
+
+An observation is a dict lookup plus a lock-guarded add, so everything stays
+on in production. GET /metrics renders the text format. Under gunicorn,
+PROMETHEUS_MULTIPROC_DIR (set in gunicorn.conf.py) makes each worker write
+its values to a memory-mapped file there, and a scrape of any worker merges
+all of them.
+"""
+import functools
+import os
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest
+from prometheus_client import multiprocess
+
+# Request latencies: 5ms .. 10s
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Streams stay open from seconds (a recommendation deck) to hours (notifications)
+STREAM_BUCKETS = (1.0, 5.0, 30.0, 60.0, 300.0, 900.0, 1800.0, 3600.0, 14400.0)
+# Stages and dependency calls are mostly sub-millisecond to tens of ms
+STAGE_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "Request duration until the last body byte",
+    ["method", "route", "status"], buckets=REQUEST_BUCKETS,
+)
+STREAM_DURATION = Histogram(
+    "http_stream_duration_seconds", "Streaming response lifetime, kept out of request latency",
+    ["route", "status"], buckets=STREAM_BUCKETS,
+)
+STAGE_DURATION = Histogram(
+    "pipeline_stage_duration_seconds", "Time spent per pipeline stage",
+    ["stage"], buckets=STAGE_BUCKETS,
+)
+DEPENDENCY_DURATION = Histogram(
+    "dependency_call_duration_seconds", "Database and embedding API call duration",
+    ["dependency", "operation"], buckets=STAGE_BUCKETS,
+)
+DEPENDENCY_CALLS = Counter(
+    "dependency_calls_total", "Database and embedding API calls",
+    ["dependency", "operation", "outcome"],
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total", "In-process cache lookups",
+    ["cache", "result"],
+)
+
+# Labelled children, resolved once per label set instead of on every observation
+_stage_children: Dict[str, Any] = {}
+
+
+def stage_timer(stage: str):
+    """`with stage_timer("find_matches"):` observes pipeline_stage_duration_seconds"""
+    child = _stage_children.get(stage)
+    if child is None:
+        child = _stage_children[stage] = STAGE_DURATION.labels(stage)
+    return child.time()
+
+
+def cache_counters(cache: str) -> Tuple[Any, Any]:
+    """(hit, miss) counters for one named cache"""
+    return CACHE_REQUESTS.labels(cache, "hit"), CACHE_REQUESTS.labels(cache, "miss")
+
+
+def instrumented(dependency: str, operation: Optional[str] = None) -> Callable:
+    """Decorator for async calls to a dependency: duration plus an ok/error count"""
+
+    def decorator(fn: Callable) -> Callable:
+        name = operation or fn.__name__
+        duration = DEPENDENCY_DURATION.labels(dependency, name)
+        ok = DEPENDENCY_CALLS.labels(dependency, name, "ok")
+        error = DEPENDENCY_CALLS.labels(dependency, name, "error")
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = await fn(*args, **kwargs)
+            except BaseException:
+                error.inc()
+                raise
+            finally:
+                duration.observe(time.perf_counter() - start)
+            ok.inc()
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def observe_request(method: str, route: str, status: int, seconds: float, streaming: bool = False):
+    if streaming:
+        STREAM_DURATION.labels(route, str(status)).observe(seconds)
+    else:
+        REQUEST_DURATION.labels(method, route, str(status)).observe(seconds)
+
+
+def render() -> Tuple[bytes, str]:
+    """(body, content type) for a scrape"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -0,0 +1,32 @@
+"""
+Opaque keyset-pagination cursors.
+A cursor is the (order, sort_key, id) of the last row on the previous page, base64-encoded.
+The order is kept so a cursor can't be replayed against a different sort.
+"""
+import base64
+import json
+import uuid
+from decimal import Decimal
+from typing import Tuple
+
+
+def encode_cursor(order: str, sort_key: str, row_id: str) -> str:
+    raw = json.dumps([order, str(sort_key), str(row_id)], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order: str) -> Tuple[str, str]:
+    """
+    Raises ValueError for anything that is not a cursor we issued,
+    or one issued for a different order.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_order, sort_key, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        Decimal(sort_key)  # sort keys are numeric; reject anything else early
+        sort_key, row_id = str(sort_key), str(uuid.UUID(row_id))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if cursor_order != order:
+        raise ValueError(f"Cursor was issued for order_by={cursor_order}")
+    return sort_key, row_id
@@ -0,0 +1,154 @@
+"""
+Shared-memory rate limit storage for several workers on one host.
+
+Registers the `shm://` scheme with `limits`, so RATE_LIMIT_STORAGE_URI can be
+shm:///dev/shm/prom-ratelimit?slots=65536. Counters live in a memory-mapped
+file that every worker maps MAP_SHARED, so limits hold across processes
+without a network round trip.
+
+Layout: a fixed table of 24-byte slots (key hash, count, window expiry),
+split into stripes of STRIPE_SLOTS. A key only ever lives in its home stripe,
+and each update holds an fcntl byte-range lock on that stripe. Python has no
+atomic compare-and-swap on shared memory, so this lock (one syscall pair, a
+few microseconds) stands in for one; unrelated keys rarely share a stripe.
+When a stripe is full the slot with the earliest expiry is evicted, which
+can only ever reset a counter early, never block a request wrongly.
+
+Supports the fixed-window strategy (slowapi's default).
+"""
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import time
+from typing import Any, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from limits.storage import Storage
+
+SLOT = struct.Struct("<Qqd")  # key hash (0 = empty), count, expiry (epoch seconds)
+STRIPE_SLOTS = 64
+DEFAULT_SLOTS = 65536
+
+
+def _default_path() -> str:
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(base, "prom-ratelimit")
+
+
+class SharedMemoryStorage(Storage):
+    STORAGE_SCHEME = ["shm"]
+
+    def __init__(self, uri: Optional[str] = None, wrap_exceptions: bool = False, **options: Any):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        parsed = urlparse(uri or "shm://")
+        query = parse_qs(parsed.query)
+        self.path = parsed.path or _default_path()
+        slots = int(query.get("slots", [options.get("slots", DEFAULT_SLOTS)])[0])
+        self.stripes = max(1, slots // STRIPE_SLOTS)
+        self.size = self.stripes * STRIPE_SLOTS * SLOT.size
+
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self._fd).st_size < self.size:
+            os.ftruncate(self._fd, self.size)
+        self._map = mmap.mmap(self._fd, self.size, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+
+    @property
+    def base_exceptions(self):
+        return OSError
+
+    # ------------------------------------------
+    # slot helpers
+    # ------------------------------------------
+
+    def _locate(self, key: str) -> Tuple[int, int]:
+        """(key hash, byte offset of its home stripe)"""
+        digest = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little")
+        key_hash = digest or 1
+        return key_hash, (key_hash % self.stripes) * STRIPE_SLOTS * SLOT.size
+
+    def _lock(self, stripe: int, exclusive: bool = True):
+        cmd = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+        fcntl.lockf(self._fd, cmd, STRIPE_SLOTS * SLOT.size, stripe)
+
+    def _unlock(self, stripe: int):
+        fcntl.lockf(self._fd, fcntl.LOCK_UN, STRIPE_SLOTS * SLOT.size, stripe)
+
+    def _find(self, key_hash: int, stripe: int, now: float) -> Tuple[Optional[int], int]:
+        """
+        (offset of the live slot holding key_hash or None, offset to write a new entry).
+        The write offset is the first empty or expired slot, else the one expiring first.
+        """
+        free = None
+        oldest, oldest_expiry = stripe, float("inf")
+        for i in range(STRIPE_SLOTS):
+            offset = stripe + i * SLOT.size
+            slot_hash, _, expiry = SLOT.unpack_from(self._map, offset)
+            if slot_hash == key_hash and expiry > now:
+                return offset, offset
+            if free is None and (slot_hash == 0 or expiry <= now):
+                free = offset
+            elif expiry < oldest_expiry:
+                oldest, oldest_expiry = offset, expiry
+        return None, free if free is not None else oldest
+
+    # ------------------------------------------
+    # limits Storage API
+    # ------------------------------------------
+
+    def incr(self, key: str, expiry: int, amount: int = 1, **_: Any) -> int:
+        key_hash, stripe = self._locate(key)
+        self._lock(stripe)
+        try:
+            now = time.time()
+            found, offset = self._find(key_hash, stripe, now)
+            if found is None:
+                SLOT.pack_into(self._map, offset, key_hash, amount, now + expiry)
+                return amount
+            _, count, window_end = SLOT.unpack_from(self._map, found)
+            SLOT.pack_into(self._map, found, key_hash, count + amount, window_end)
+            return count + amount
+        finally:
+            self._unlock(stripe)
+
+    def get(self, key: str) -> int:
+        key_hash, stripe = self._locate(key)
+        self._lock(stripe, exclusive=False)
+        try:
+            found, _ = self._find(key_hash, stripe, time.time())
+            return SLOT.unpack_from(self._map, found)[1] if found is not None else 0
+        finally:
+            self._unlock(stripe)
+
+    def get_expiry(self, key: str) -> float:
+        key_hash, stripe = self._locate(key)
+        self._lock(stripe, exclusive=False)
+        try:
+            now = time.time()
+            found, _ = self._find(key_hash, stripe, now)
+            return SLOT.unpack_from(self._map, found)[2] if found is not None else now
+        finally:
+            self._unlock(stripe)
+
+    def check(self) -> bool:
+        return not self._map.closed
+
+    def reset(self) -> Optional[int]:
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, self.size, 0)
+        try:
+            self._map[:] = bytes(self.size)
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, self.size, 0)
+        return None
+
+    def clear(self, key: str) -> None:
+        key_hash, stripe = self._locate(key)
+        self._lock(stripe)
+        try:
+            found, _ = self._find(key_hash, stripe, time.time())
+            if found is not None:
+                SLOT.pack_into(self._map, found, 0, 0, 0.0)
+        finally:
+            self._unlock(stripe)
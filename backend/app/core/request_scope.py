@@ -0,0 +1,32 @@
+"""
+Request-scoped memoization.
+RequestScopeMiddleware gives every HTTP request its own dict, reachable from
+any code running inside that request (handlers, services, background tasks)
+via request_cache(). Outside a request it returns None and callers skip memoization.
+"""
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+_request_cache: ContextVar[Optional[Dict[Any, Any]]] = ContextVar("request_cache", default=None)
+
+
+def request_cache() -> Optional[Dict[Any, Any]]:
+    return _request_cache.get()
+
+
+class RequestScopeMiddleware:
+    """Pure ASGI middleware; add it outermost so every inner layer shares the scope."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = _request_cache.set({})
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_cache.reset(token)
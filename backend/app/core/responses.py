@@ -0,0 +1,53 @@
+"""
+Fast JSON responses for heavy endpoints.
+Return FastJSONResponse(content) from a handler to skip FastAPI's response
+validation and jsonable_encoder pass entirely; the content is serialized
+once by orjson, which handles datetimes, UUIDs and NumPy scalars/arrays
+natively. Falls back to the standard library if orjson is not installed.
+"""
+import json
+import uuid
+from decimal import Decimal
+from typing import Any
+
+import numpy as np
+from fastapi.responses import JSONResponse
+
+from app.core.metrics import stage_timer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    """Types neither serializer handles on its own"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        with stage_timer("serialize"):
+            return dumps(content)
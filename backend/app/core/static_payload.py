@@ -0,0 +1,38 @@
+"""
+Pre-serialized payloads for responses that only change on deploy.
+The JSON body and its content-hash ETag are computed once; requests whose
+If-None-Match carries that ETag get an empty 304.
+"""
+import hashlib
+import json
+from typing import Any
+
+from fastapi import Request, Response
+
+
+class StaticPayload:
+    def __init__(self, content: Any, max_age: int = 86400, stale_while_revalidate: int = 604800):
+        self.body = json.dumps(content, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        self.etag = '"' + hashlib.sha256(self.body).hexdigest()[:32] + '"'
+        self.headers = {
+            "ETag": self.etag,
+            # Revalidation is a cheap 304, so caches may keep serving while they check
+            "Cache-Control": f"public, max-age={max_age}, stale-while-revalidate={stale_while_revalidate}",
+        }
+
+    def matches(self, if_none_match: str) -> bool:
+        if if_none_match.strip() == "*":
+            return True
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag.startswith("W/"):
+                tag = tag[2:]  # weak comparison, as RFC 9110 requires for If-None-Match
+            if tag == self.etag:
+                return True
+        return False
+
+    def response(self, request: Request) -> Response:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and self.matches(if_none_match):
+            return Response(status_code=304, headers=self.headers)
+        return Response(content=self.body, media_type="application/json", headers=self.headers)
@@ -0,0 +1,51 @@
+"""
+Event streams over HTTP.
+event_stream() turns an async iterator of (event, data) pairs into a
+StreamingResponse in one of two wire formats:
+
+    ndjson  one JSON object per line: {"event": "card", "data": {...}}
+    sse     Server-Sent Events:       event: card\ndata: {...}\n\n
+
+Each event is written as soon as it is produced. If the iterator raises,
+an "error" event ends the stream, since the status line has already gone out.
+"""
+import logging
+from typing import Any, AsyncIterator, Literal, Tuple
+
+from fastapi.responses import StreamingResponse
+
+from app.core.responses import dumps
+
+logger = logging.getLogger(__name__)
+
+StreamFormat = Literal["ndjson", "sse"]
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "sse": "text/event-stream"}
+# Content-type prefixes that mark a response as a stream (metrics keep them apart)
+STREAM_MEDIA_TYPES = tuple(t.encode() for t in MEDIA_TYPES.values())
+
+
+def encode_event(event: str, data: Any, fmt: StreamFormat) -> bytes:
+    if fmt == "sse":
+        return b"event: " + event.encode() + b"\ndata: " + dumps(data) + b"\n\n"
+    return dumps({"event": event, "data": data}) + b"\n"
+
+
+def event_stream(events: AsyncIterator[Tuple[str, Any]], fmt: StreamFormat = "ndjson") -> StreamingResponse:
+    async def body():
+        try:
+            async for event, data in events:
+                yield encode_event(event, data, fmt)
+        except Exception as e:
+            logger.error(f"Event stream failed: {e}")
+            yield encode_event("error", {"detail": "Stream interrupted"}, fmt)
+
+    return StreamingResponse(
+        body(),
+        media_type=MEDIA_TYPES[fmt],
+        headers={
+            "Cache-Control": "no-cache",
+            # Keep reverse proxies (nginx) from buffering the stream
+            "X-Accel-Buffering": "no",
+        },
+    )
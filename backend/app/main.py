@@ -2,18 +2,26 @@
 Prom Matchmaking API
 FastAPI + Supabase + pgvector
 """
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import JSONResponse, Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from contextlib import asynccontextmanager
+import hmac
 import logging
 import sys
 import time
 
+from app.core.compression import CompressionMiddleware
 from app.core.config import get_settings
 from app.core.limiter import limiter
-from app.api.endpoints import users, matches, questionnaire
+from app.core.metrics import observe_request, render as render_metrics
+from app.core.request_scope import RequestScopeMiddleware
+from app.core.streaming import STREAM_MEDIA_TYPES
+from app.api.dependencies import get_health
+from app.api.endpoints import users, matches, questionnaire, notifications
+from app.services.health import HealthMonitor
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
@@ -28,39 +36,85 @@ settings = get_settings()
 
 
 # ─── Security Headers Middleware ─────────────────────────────────────────────
+# Pure ASGI: headers are set on the http.response.start message, so the body
+# streams through untouched and no extra task wraps the request.
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = "camera=(), microphone=(), geolocation=()"
-        # Only send HSTS if we're behind HTTPS (Render handles TLS termination)
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        return response
+SECURITY_HEADERS = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "Permissions-Policy": "camera=(), microphone=(), geolocation=()",
+    # Only send HSTS if we're behind HTTPS (Render handles TLS termination)
+    "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
+}
+
+
+class SecurityHeadersMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in SECURITY_HEADERS.items():
+                    headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
 
 # ─── Request Logging Middleware ───────────────────────────────────────────────
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        start = time.time()
+class RequestLoggingMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+        streaming = False
+
+        async def send_with_status(message: Message):
+            nonlocal status_code, streaming
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                content_type = next((v for k, v in message.get("headers", ()) if k.lower() == b"content-type"), b"")
+                streaming = content_type.startswith(STREAM_MEDIA_TYPES)
+            await send(message)
+
         # Never log Authorization header values
-        response = await call_next(request)
-        duration_ms = round((time.time() - start) * 1000)
+        await self.app(scope, receive, send_with_status)
+
+        duration = time.perf_counter() - start
+        # Route template, not the raw path, so ids don't explode the label set
+        route = scope.get("route")
+        observe_request(
+            scope["method"], route.path if route is not None else "unmatched", status_code, duration, streaming
+        )
+
+        duration_ms = round(duration * 1000)
+        request = Request(scope)
+        method, path = request.method, request.url.path
         ip = request.headers.get("x-forwarded-for", request.client.host if request.client else "unknown")
         logger.info(
-            f"{request.method} {request.url.path} "
-            f"status={response.status_code} ip={ip} duration={duration_ms}ms"
+            f"{method} {path} "
+            f"status={status_code} ip={ip} duration={duration_ms}ms"
         )
-        if response.status_code >= 400:
+        if status_code >= 400:
             logger.warning(
-                f"Error response: {request.method} {request.url.path} "
-                f"status={response.status_code} ip={ip}"
+                f"Error response: {method} {path} "
+                f"status={status_code} ip={ip}"
             )
-        return response
 
 
 # ─── Lifespan ─────────────────────────────────────────────────────────────────
@@ -71,14 +125,14 @@ async def lifespan(app: FastAPI):
     logger.info(f"Version: {settings.VERSION}")
     # Do NOT log secrets or full URLs at startup
 
-    from app.services.database import DatabaseService
-    from app.services.embeddings import EmbeddingsService
+    from app.services.container import ServiceContainer
 
     try:
-        db = DatabaseService()
-        logger.info("Database service initialized")
-        embeddings = EmbeddingsService()
-        logger.info("Embeddings service initialized")
+        services = ServiceContainer()
+        logger.info("Services initialized")
+        await services.warmup()
+        await services.health.start()
+        app.state.services = services
 
         if not settings.SUPABASE_JWT_SECRET:
             logger.warning(
@@ -91,6 +145,7 @@ async def lifespan(app: FastAPI):
 
     yield
     logger.info("Shutting down Prom Matchmaking API...")
+    await services.close()
 
 
 # ─── App ──────────────────────────────────────────────────────────────────────
@@ -112,7 +167,16 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
-# Security & logging middleware (added first = outermost layer)
+# Middleware added last is outermost. Compression is added first, so it sits
+# innermost and the logged duration includes it
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+)
+
+# Security & logging middleware (outside Compression, inside CORS)
 app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(RequestLoggingMiddleware)
 
@@ -125,6 +189,10 @@ app.add_middleware(
     allow_headers=["Authorization", "Content-Type", "Accept"],
 )
 
+# Request-scoped memo (added last = outermost, so every middleware above, the
+# handlers, services and background tasks share it)
+app.add_middleware(RequestScopeMiddleware)
+
 
 # ─── Global Exception Handler ─────────────────────────────────────────────────
 
@@ -140,6 +208,7 @@ async def global_exception_handler(request: Request, exc: Exception):
 app.include_router(users.router, prefix="/users", tags=["Users"])
 app.include_router(matches.router, prefix="", tags=["Matching"])
 app.include_router(questionnaire.router, prefix="", tags=["Questionnaire"])
+app.include_router(notifications.router, prefix="/notifications", tags=["Notifications"])
 
 
 # ─── Health ───────────────────────────────────────────────────────────────────
@@ -150,22 +219,48 @@ async def root():
 
 
 @app.get("/health", tags=["Health"])
-async def health_check():
-    from app.services.database import DatabaseService
-    try:
-        db = DatabaseService()
-        db.client.table("users").select("id").limit(1).execute()
-        db_status = "healthy"
-    except Exception:
-        db_status = "unhealthy"  # Don't expose error details externally
-
+async def health_check(health: HealthMonitor = Depends(get_health)):
+    """Latest background probe results; never touches a dependency itself"""
+    checks = health.checks()
     return {
-        "status": "healthy" if db_status == "healthy" else "degraded",
+        "status": "healthy" if all(c["status"] == "healthy" for c in checks.values()) else "degraded",
         "version": settings.VERSION,
-        "database": db_status,
+        "database": checks.get("database", {}).get("status", "unknown"),
+        "checks": checks,
     }
 
 
+@app.get("/health/live", tags=["Health"])
+async def liveness():
+    """The worker is up and its event loop is serving requests"""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready", tags=["Health"])
+async def readiness(health: HealthMonitor = Depends(get_health)):
+    """503 while a critical dependency is failing, so the load balancer routes around this instance"""
+    ready = health.ready()
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "ready" if ready else "unavailable", "checks": health.checks()},
+    )
+
+
+# ─── Metrics ──────────────────────────────────────────────────────────────────
+
+@app.get("/metrics", tags=["Health"], include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus text format; needs METRICS_TOKEN as a bearer token (open only with DEBUG on)"""
+    if settings.METRICS_TOKEN:
+        expected = f"Bearer {settings.METRICS_TOKEN}".encode()
+        if not hmac.compare_digest(request.headers.get("authorization", "").encode(), expected):
+            return JSONResponse(status_code=401, content={"detail": "Unauthorized"})
+    elif not settings.DEBUG:
+        return JSONResponse(status_code=403, content={"detail": "Set METRICS_TOKEN to enable /metrics"})
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=settings.DEBUG)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any, Literal
+from typing import List, Optional, Dict, Any, Literal, TypedDict
 from datetime import datetime
 
 class UserPhoto(BaseModel):
@@ -34,9 +34,18 @@ class UserProfile(UserProfileBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+# "compact" cards carry only what the swipe card renders
+RecommendationView = Literal["full", "compact"]
+
 class SwipeAction(BaseModel):
     target_user_id: str
     action: str = Field(..., pattern="^(yes|no|super)$")
+    # Return up to this many upcoming cards with the swipe result
+    prefetch: int = Field(0, ge=0, le=10)
+    view: RecommendationView = "full"
+
+class SwipeBatch(BaseModel):
+    swipes: List[SwipeAction] = Field(..., min_length=1, max_length=100)
 
 class Match(BaseModel):
     match_id: str
@@ -54,3 +63,47 @@ class Recommendation(BaseModel):
 
 class ProfileEmbedding(UserProfileBase):
     user_id: str
+
+
+# ─── User read projections ──────────────────────────────────────────────────
+# Each view is a column projection of the users table; the key order is the
+# SELECT list. None of them include the embedding.
+
+class UserIdentity(TypedDict):
+    id: str
+    auth_id: str
+
+class UserScoringView(TypedDict):
+    id: str
+    auth_id: str
+    question_answers: Optional[Dict[str, Any]]
+    personality: Optional[str]
+
+class UserCardView(TypedDict):
+    id: str
+    name: str
+    bio: Optional[str]
+    gender: str
+    grade: str
+    school: Optional[str]
+    hobbies: Optional[List[str]]
+    socials: Optional[Dict[str, str]]
+    profile_pic_url: Optional[str]
+
+class UserOwnerView(TypedDict):
+    id: str
+    auth_id: str
+    email: str
+    name: str
+    bio: Optional[str]
+    gender: str
+    looking_for: Optional[List[str]]
+    grade: str
+    school: Optional[str]
+    hobbies: Optional[List[str]]
+    personality: Optional[str]
+    question_answers: Optional[Dict[str, Any]]
+    socials: Optional[Dict[str, str]]
+    profile_pic_url: Optional[str]
+    created_at: Optional[str]
+    updated_at: Optional[str]
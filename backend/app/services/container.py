@@ -0,0 +1,91 @@
+"""
+App-scoped service container.
+Built once in the lifespan hook, stored on app.state.services and handed to
+handlers through the get_* dependencies in app.api.dependencies.
+"""
+import logging
+import time
+
+from app.core.config import get_settings
+from app.services.compatibility_engine import CompatibilityEngine
+from app.services.database import DatabaseService
+from app.services.embeddings import EmbeddingsService
+from app.services.health import HealthMonitor
+from app.services.matching import MatchingService
+from app.services.notifications import broker_from_uri
+from app.services.questionnaire import get_all_questions
+from app.services.recommendation_queue import RecommendationQueue
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class ServiceContainer:
+    def __init__(self):
+        self.db = DatabaseService()
+        self.embeddings = EmbeddingsService()
+        self.compatibility = CompatibilityEngine()
+        self.matching = MatchingService(
+            db=self.db,
+            embeddings=self.embeddings,
+            compatibility=self.compatibility,
+        )
+        self.recommendation_queue = RecommendationQueue(
+            self.matching.compute_recommendations,
+            drop_swiped=self.matching.drop_swiped,
+            size=settings.RECOMMENDATION_QUEUE_SIZE,
+            low_water=settings.RECOMMENDATION_QUEUE_LOW_WATER,
+            max_users=settings.RECOMMENDATION_QUEUE_MAX_USERS,
+            ttl=settings.RECOMMENDATION_QUEUE_TTL_SECONDS,
+            max_concurrent_refills=settings.RECOMMENDATION_QUEUE_REFILL_CONCURRENCY,
+        )
+        self.matching.recommendation_queue = self.recommendation_queue
+        self.notifications = broker_from_uri(settings.NOTIFICATIONS_BROKER_URI)
+        self.matching.notifications = self.notifications
+        self.health = HealthMonitor(timeout=settings.HEALTH_PROBE_TIMEOUT_SECONDS)
+        self.health.add("database", self.db.ping, settings.HEALTH_DB_PROBE_INTERVAL_SECONDS)
+        # Only profile saves need embeddings; an outage degrades the service, it doesn't take it out
+        self.health.add(
+            "embeddings", self.embeddings.ping, settings.HEALTH_EMBEDDINGS_PROBE_INTERVAL_SECONDS, critical=False
+        )
+
+    async def warmup(self):
+        """
+        Pay first-request costs at startup: open database connections and the
+        HTTP session, and run the scoring path once. Failures are logged, not
+        raised, so a slow dependency never blocks the deploy.
+        """
+        start = time.perf_counter()
+
+        try:
+            if self.db.pg:
+                await self.db.pg.pool()
+            else:
+                self.db.client.table("users").select("id").limit(1).execute()
+        except Exception as e:
+            logger.warning(f"Database warmup failed: {e}")
+
+        try:
+            self.embeddings.session()
+        except Exception as e:
+            logger.warning(f"HTTP session warmup failed: {e}")
+
+        try:
+            # One answer per question exercises every category and scorer
+            sample = {}
+            for question in get_all_questions():
+                options = question.get("options")
+                sample[question["id"]] = options[0]["value"] if options else question.get("min", 1)
+            self.compatibility.calculate_compatibility(sample, sample)
+        except Exception as e:
+            logger.warning(f"Scoring warmup failed: {e}")
+
+        logger.info(f"Services warmed up in {(time.perf_counter() - start) * 1000:.0f}ms")
+
+    async def close(self):
+        await self.health.close()
+        await self.recommendation_queue.close()
+        await self.matching.close()
+        await self.notifications.close()
+        await self.embeddings.close()
+        await self.db.close()
@@ -3,19 +3,41 @@ Enterprise-grade Supabase Database Service
 Handles all database operations with proper error handling and connection pooling
 """
 from supabase import create_client, Client
-from typing import List, Dict, Any, Optional
+from postgrest.types import CountMethod, ReturnMethod
+from typing import List, Dict, Any, Optional, Set, Tuple, TYPE_CHECKING
 from datetime import datetime
+import asyncio
 import logging
 from tenacity import retry, stop_after_attempt, wait_exponential
 from app.core.config import get_settings
+from app.core.cache import LRUCache
+from app.core.metrics import instrumented
+from app.core.pagination import encode_cursor, decode_cursor
+from app.core.request_scope import request_cache
+from app.core.swiped_set import SwipedSet
+from app.models.schemas import UserIdentity, UserScoringView, UserCardView, UserOwnerView
+
+if TYPE_CHECKING:
+    from app.services.postgres import PostgresRepository
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# ==========================================
+# COLUMN PROJECTIONS
+# The embedding only leaves the database when a caller explicitly selects it.
+# ==========================================
+
+USER_IDENTITY_COLUMNS: Tuple[str, ...] = tuple(UserIdentity.__annotations__)
+USER_SCORING_COLUMNS: Tuple[str, ...] = tuple(UserScoringView.__annotations__)
+USER_CARD_COLUMNS: Tuple[str, ...] = tuple(UserCardView.__annotations__)
+USER_OWNER_COLUMNS: Tuple[str, ...] = tuple(UserOwnerView.__annotations__)
+
 class DatabaseService:
     """Singleton Supabase client with connection management"""
     _instance: Optional['DatabaseService'] = None
     _client: Optional[Client] = None
+    _pg: Optional["PostgresRepository"] = None
     
     def __new__(cls):
         if cls._instance is None:
@@ -34,15 +56,65 @@ class DatabaseService:
         except Exception as e:
             logger.error(f"❌ Supabase initialization failed: {e}")
             raise
+
+        if settings.DATABASE_BACKEND == "postgres":
+            if not settings.DATABASE_URL:
+                raise ValueError("DATABASE_URL is required when DATABASE_BACKEND=postgres")
+            from app.services.postgres import PostgresRepository
+            self._pg = PostgresRepository(
+                settings.DATABASE_URL,
+                min_size=settings.DB_POOL_MIN_SIZE,
+                max_size=settings.DB_POOL_MAX_SIZE,
+                max_inactive_connection_lifetime=settings.DB_POOL_MAX_INACTIVE_LIFETIME,
+                command_timeout=settings.DB_COMMAND_TIMEOUT,
+                statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+            )
+            logger.info("✅ Direct Postgres backend enabled for hot queries")
+
+        # auth_id -> internal id never changes for a live account; entries are
+        # dropped on account deletion and expire so other workers converge too
+        self._identity_map: LRUCache[str] = LRUCache(
+            maxsize=settings.IDENTITY_MAP_SIZE,
+            ttl=settings.IDENTITY_MAP_TTL_SECONDS,
+            name="identity_map",
+        )
+
+        # user id -> targets they have swiped on, for app-side candidate
+        # exclusion; kept current by this worker's swipe writes and expired
+        # so swipes landing on other workers are picked up
+        self._swiped_sets: LRUCache[SwipedSet] = LRUCache(
+            maxsize=settings.SWIPED_SET_CACHE_SIZE,
+            ttl=settings.SWIPED_SET_TTL_SECONDS,
+            name="swiped_sets",
+        )
     
     @property
     def client(self) -> Client:
         return self._client
+
+    @property
+    def pg(self) -> Optional["PostgresRepository"]:
+        """Direct asyncpg repository, or None when running purely on PostgREST"""
+        return self._pg
+
+    async def close(self):
+        """Release pooled connections (direct Postgres backend only)"""
+        if self._pg is not None:
+            await self._pg.close()
+
+    async def ping(self):
+        """Cheapest round trip to the database; raises when it is unreachable"""
+        if self._pg is not None:
+            await self._pg.ping()
+        else:
+            # The Supabase client is synchronous; keep the probe off the event loop
+            await asyncio.to_thread(lambda: self._client.table("users").select("id").limit(1).execute())
     
     # ==========================================
     # USER OPERATIONS
     # ==========================================
     
+    @instrumented("database")
     async def create_user(self, auth_id: str, email: str, profile_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new user profile"""
         data = {
@@ -52,48 +124,126 @@ class DatabaseService:
         }
         
         result = self._client.table("users").insert(data).execute()
+        self._forget_user(auth_id)
         
         if result.data:
             logger.info(f"User created: {auth_id}")
+            self._identity_map.set(auth_id, result.data[0]["id"])
             return result.data[0]
         raise Exception("Failed to create user")
     
     async def update_user(self, user_id: str, profile_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update user profile by internal UUID"""
         result = self._client.table("users").update(profile_data).eq("id", user_id).execute()
+        self._forget_user()
         
         if result.data:
             logger.info(f"User updated: {user_id}")
             return result.data[0]
         raise Exception(f"Failed to update user: {user_id}")
     
+    @instrumented("database")
     async def update_user_by_auth_id(self, auth_id: str, profile_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update user profile by auth_id (from Supabase Auth)"""
         result = self._client.table("users").update(profile_data).eq("auth_id", auth_id).execute()
+        self._forget_user(auth_id)
         
         if result.data:
             logger.info(f"User updated by auth_id: {auth_id}")
             return result.data[0]
         raise Exception(f"Failed to update user by auth_id: {auth_id}")
     
-    async def get_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
-        """Get user by internal UUID"""
+    @instrumented("database", "get_user")
+    async def _fetch_user(self, key: str, value: str, columns: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        """Fetch one user row by `key` ("id" or "auth_id") with an explicit column projection"""
+        if self._pg:
+            return await self._pg.get_user(key, value, columns)
+        result = self._client.table("users").select(",".join(columns)).eq(key, value).limit(1).execute()
+        return result.data[0] if result.data else None
+
+    async def _select_user(self, key: str, value: str, columns: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        """
+        Projected user read. Lookups by auth_id are the request's caller, so
+        inside a request each projection is memoized by its column set and
+        served from any memoized row that already covers it.
+        """
+        if key != "auth_id":
+            return await self._fetch_user(key, value, columns)
+
+        memo = request_cache()
+        if memo is None:
+            user = await self._fetch_user(key, value, columns)
+        else:
+            wanted = frozenset(columns)
+            covering = next(
+                (k for k in memo if k[0] == "user" and k[1] == value and wanted <= k[2]), None
+            )
+            if covering is None:
+                covering = ("user", value, wanted)
+                memo[covering] = await self._fetch_user(key, value, columns)
+            row = memo[covering]
+            user = {c: row[c] for c in columns} if row else None
+
+        if user:
+            self._identity_map.set(value, user["id"])
+        else:
+            # Deleted through another worker: don't keep resolving to the old id
+            self._identity_map.pop(value)
+        return user
+
+    def _forget_user(self, auth_id: Optional[str] = None, drop_identity: bool = False):
+        """Drop memoized rows after a write; auth_id=None clears every memoized user"""
+        memo = request_cache()
+        if memo is not None:
+            for memo_key in [k for k in memo if k[0] == "user" and (auth_id is None or k[1] == auth_id)]:
+                del memo[memo_key]
+        if drop_identity and auth_id is not None:
+            self._identity_map.pop(auth_id)
+
+    async def get_user_by_id(self, user_id: str) -> Optional[UserOwnerView]:
+        """Get user by internal UUID (everything except the embedding)"""
         try:
-            result = self._client.table("users").select("*").eq("id", user_id).single().execute()
-            return result.data
+            return await self._select_user("id", user_id, USER_OWNER_COLUMNS)
         except Exception:
             return None
     
-    async def get_user_by_auth_id(self, auth_id: str) -> Optional[Dict[str, Any]]:
-        """Get user by Supabase Auth ID"""
-        result = self._client.table("users").select("*").eq("auth_id", auth_id).execute()
-        return result.data[0] if result.data else None
+    async def get_user_by_auth_id(self, auth_id: str) -> Optional[UserOwnerView]:
+        """Get user by Supabase Auth ID (everything except the embedding)"""
+        return await self._select_user("auth_id", auth_id, USER_OWNER_COLUMNS)
+
+    async def get_user_identity(self, auth_id: str) -> Optional[UserIdentity]:
+        """Resolve auth_id to the internal user id (identity map first, then the database)"""
+        user_id = self._identity_map.get(auth_id)
+        if user_id is not None:
+            return {"id": user_id, "auth_id": auth_id}
+        return await self._select_user("auth_id", auth_id, USER_IDENTITY_COLUMNS)
+
+    async def get_user_scoring_view(self, auth_id: str) -> Optional[UserScoringView]:
+        """Fields the compatibility engine needs: answers and personality"""
+        return await self._select_user("auth_id", auth_id, USER_SCORING_COLUMNS)
+
+    async def get_user_scoring_view_by_id(self, user_id: str) -> Optional[UserScoringView]:
+        """Scoring fields by internal UUID"""
+        try:
+            return await self._select_user("id", user_id, USER_SCORING_COLUMNS)
+        except Exception:
+            return None
+
+    async def get_user_card(self, user_id: str) -> Optional[UserCardView]:
+        """Public display fields shown on cards and match lists"""
+        try:
+            return await self._select_user("id", user_id, USER_CARD_COLUMNS)
+        except Exception:
+            return None
     
     async def user_exists(self, auth_id: str) -> bool:
-        """Check if user profile exists"""
-        result = self._client.table("users").select("id").eq("auth_id", auth_id).execute()
-        return len(result.data) > 0
+        """
+        Check if user profile exists. Always asks the database: the identity
+        map can't see an account deleted through another worker
+        """
+        return await self._select_user("auth_id", auth_id, USER_IDENTITY_COLUMNS) is not None
     
+    @instrumented("database")
     async def delete_user_by_auth_id(self, auth_id: str) -> bool:
         """
         Delete user account completely.
@@ -105,6 +255,7 @@ class DatabaseService:
         try:
             # Delete user by auth_id (cascade will handle swipes and matches)
             result = self._client.table("users").delete().eq("auth_id", auth_id).execute()
+            self._forget_user(auth_id, drop_identity=True)
             
             # Check if deletion was successful
             # Supabase delete returns empty data array on success
@@ -128,33 +279,78 @@ class DatabaseService:
     async def update_user_embedding(self, user_id: str, embedding: List[float]) -> bool:
         """Update user's embedding vector"""
         # pgvector expects array format - Supabase Python client handles this automatically
-        result = self._client.table("users").update({
-            "embedding": embedding  # Pass as list, Supabase handles conversion
-        }).eq("id", user_id).execute()
+        # returning=minimal keeps PostgREST from echoing the 384-dim vector back
+        result = self._client.table("users").update(
+            {"embedding": embedding},  # Pass as list, Supabase handles conversion
+            count=CountMethod.exact,
+            returning=ReturnMethod.minimal,
+        ).eq("id", user_id).execute()
         
-        return len(result.data) > 0
+        return (result.count or 0) > 0
     
+    @instrumented("database")
     async def update_user_embedding_by_auth_id(self, auth_id: str, embedding: List[float]) -> bool:
         """Update user's embedding vector by auth_id"""
+        if self._pg:
+            return await self._pg.update_user_embedding_by_auth_id(auth_id, embedding)
         # pgvector expects array format
-        result = self._client.table("users").update({
-            "embedding": embedding  # Pass as list, Supabase handles conversion
-        }).eq("auth_id", auth_id).execute()
+        result = self._client.table("users").update(
+            {"embedding": embedding},  # Pass as list, Supabase handles conversion
+            count=CountMethod.exact,
+            returning=ReturnMethod.minimal,
+        ).eq("auth_id", auth_id).execute()
         
-        return len(result.data) > 0
+        return (result.count or 0) > 0
     
     # ==========================================
     # MATCHING OPERATIONS (The MAGIC!)
     # ==========================================
     
-    async def find_matches(self, user_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+    @instrumented("database")
+    async def find_matches(
+        self,
+        user_id: str,
+        limit: int = 10,
+        after: Optional[Tuple[float, str]] = None,
+        ef_search: Optional[int] = None,
+        exclude: Optional[List[str]] = None,
+        skip_swiped: bool = True,
+    ) -> List[Dict[str, Any]]:
         """
         Use pgvector similarity search to find compatible matches.
         This is where Supabase shines - vector search at DB level!
+        Rows come back nearest first; pass a (distance, user_id) as `after` to
+        get the rows strictly after it in that order. `ef_search` overrides the configured
+        HNSW candidate list size (deep pages need it to cover skipped rows).
+        `exclude` drops the given user ids; `skip_swiped=False` leaves swiped
+        users in, for callers that filter them with get_swiped_set().
         """
+        after_distance, after_id = after if after else (None, None)
+        ef_search = ef_search or settings.VECTOR_EF_SEARCH
+
+        if self._pg:
+            return await self._pg.find_matches(
+                user_id,
+                limit,
+                ef_search,
+                settings.VECTOR_IVFFLAT_PROBES,
+                settings.VECTOR_ITERATIVE_SCAN,
+                after_distance,
+                after_id,
+                exclude,
+                skip_swiped,
+            )
+
         result = self._client.rpc("find_matches", {
             "p_user_id": user_id,
-            "p_limit": limit
+            "p_limit": limit,
+            "p_ef_search": ef_search,
+            "p_probes": settings.VECTOR_IVFFLAT_PROBES,
+            "p_iterative_scan": settings.VECTOR_ITERATIVE_SCAN,
+            "p_after_distance": after_distance,
+            "p_after_id": after_id,
+            "p_exclude": exclude,
+            "p_skip_swiped": skip_swiped,
         }).execute()
         
         return result.data or []
@@ -162,7 +358,7 @@ class DatabaseService:
     async def find_matches_by_auth_id(self, auth_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Find matches using auth_id (frontend-friendly)"""
         # First get the user's internal ID
-        user = await self.get_user_by_auth_id(auth_id)
+        user = await self.get_user_identity(auth_id)
         if not user:
             return []
         
@@ -172,20 +368,85 @@ class DatabaseService:
     # SWIPE OPERATIONS
     # ==========================================
     
+    async def get_swiped_set(self, user_id: str) -> SwipedSet:
+        """Every target this user has swiped on, cached per worker"""
+        swiped = self._swiped_sets.get(user_id)
+        if swiped is not None:
+            return swiped
+
+        if self._pg:
+            target_ids = await self._pg.get_swiped_target_ids(user_id)
+        else:
+            target_ids = []
+            page_size = 1000  # PostgREST caps rows per response
+            while True:
+                result = (
+                    self._client.table("swipes")
+                    .select("target_user_id")
+                    .eq("user_id", user_id)
+                    .order("target_user_id")
+                    .range(len(target_ids), len(target_ids) + page_size - 1)
+                    .execute()
+                )
+                rows = result.data or []
+                target_ids.extend(row["target_user_id"] for row in rows)
+                if len(rows) < page_size:
+                    break
+
+        swiped = SwipedSet(target_ids)
+        self._swiped_sets.set(user_id, swiped)
+        return swiped
+
+    @instrumented("database")
+    async def get_swiped_among(self, user_id: str, target_ids: List[str]) -> Set[str]:
+        """
+        Which of `target_ids` this user has swiped on, read from swipes rather
+        than the per-worker swiped set; hits are folded into that set
+        """
+        if not target_ids:
+            return set()
+        if self._pg:
+            found = await self._pg.get_swiped_among(user_id, target_ids)
+        else:
+            found = []
+            chunk = 100  # keep the in.(...) filter well inside URL limits
+            for i in range(0, len(target_ids), chunk):
+                result = (
+                    self._client.table("swipes")
+                    .select("target_user_id")
+                    .eq("user_id", user_id)
+                    .in_("target_user_id", target_ids[i:i + chunk])
+                    .execute()
+                )
+                found.extend(row["target_user_id"] for row in result.data or [])
+        self._remember_swipes(user_id, found)
+        return set(found)
+
+    def _remember_swipes(self, user_id: str, target_ids: List[str]):
+        """Fold new swipes into a cached swiped set; uncached users load fresh later"""
+        swiped = self._swiped_sets.get(user_id)
+        if swiped is not None:
+            swiped.add(target_ids)
+
     async def record_swipe(self, user_id: str, target_user_id: str, action: str) -> Dict[str, Any]:
         """Record a swipe action"""
-        result = self._client.table("swipes").upsert({
-            "user_id": user_id,
-            "target_user_id": target_user_id,
-            "action": action
-        }).execute()
-        
-        return result.data[0] if result.data else None
+        if self._pg:
+            row = await self._pg.record_swipe(user_id, target_user_id, action)
+        else:
+            result = self._client.table("swipes").upsert({
+                "user_id": user_id,
+                "target_user_id": target_user_id,
+                "action": action
+            }).execute()
+            row = result.data[0] if result.data else None
+
+        self._remember_swipes(user_id, [target_user_id])
+        return row
     
     async def record_swipe_by_auth_ids(self, user_auth_id: str, target_auth_id: str, action: str) -> Dict[str, Any]:
         """Record swipe using auth IDs"""
-        user = await self.get_user_by_auth_id(user_auth_id)
-        target = await self.get_user_by_auth_id(target_auth_id)
+        user = await self.get_user_identity(user_auth_id)
+        target = await self.get_user_identity(target_auth_id)
         
         if not user or not target:
             raise Exception("User not found")
@@ -194,6 +455,8 @@ class DatabaseService:
     
     async def get_swipe(self, user_id: str, target_user_id: str) -> Optional[str]:
         """Get swipe action between two users"""
+        if self._pg:
+            return await self._pg.get_swipe(user_id, target_user_id)
         result = self._client.table("swipes").select("action").eq("user_id", user_id).eq("target_user_id", target_user_id).execute()
         
         return result.data[0]["action"] if result.data else None
@@ -201,6 +464,30 @@ class DatabaseService:
     async def check_mutual_swipe(self, user_id: str, target_user_id: str) -> Optional[str]:
         """Check if target user has swiped on current user"""
         return await self.get_swipe(target_user_id, user_id)
+
+    @instrumented("database")
+    async def process_swipe(self, user_id: str, target_user_id: str, action: str) -> Dict[str, Any]:
+        """
+        Record a swipe, check reciprocity and create the match in one
+        transaction (process_swipe RPC). When a match exists the target's
+        scoring fields come back with it.
+        """
+        if self._pg:
+            row = await self._pg.process_swipe(user_id, target_user_id, action)
+        else:
+            result = self._client.rpc("process_swipe", {
+                "p_user_id": user_id,
+                "p_target_user_id": target_user_id,
+                "p_action": action,
+            }).execute()
+            row = result.data[0] if result.data else None
+
+        self._remember_swipes(user_id, [target_user_id])
+
+        if not row:
+            # Mutual swipe but the target row is gone (deleted mid-swipe)
+            return {"match_created": False, "match_id": None, "is_super_match": False}
+        return row
     
     # ==========================================
     # MATCH OPERATIONS
@@ -231,50 +518,142 @@ class DatabaseService:
         logger.info(f"Match created: {id1} <-> {id2} (super: {is_super_match}, score: {compatibility_score})")
         return result.data[0] if result.data else None
     
-    async def get_user_matches(self, user_id: str) -> List[Dict[str, Any]]:
-        """Get all matches for a user with full profile data"""
-        # Query matches where user is either user1 or user2
-        result1 = self._client.table("matches").select("*").eq("user1_id", user_id).execute()
-        result2 = self._client.table("matches").select("*").eq("user2_id", user_id).execute()
-        
-        matches = []
-        
-        # Process matches where user is user1
-        for match in result1.data or []:
-            other_user_id = match["user2_id"]
-            other_user = await self.get_user_by_id(other_user_id)
-            if other_user:
-                # Remove embedding from response
-                other_user.pop("embedding", None)
-                matches.append({
-                    "match_id": match["id"],
-                    "is_super_match": match.get("is_super_match", False),
-                    "created_at": match["created_at"],
-                    "other_user": other_user
-                })
-        
-        # Process matches where user is user2
-        for match in result2.data or []:
-            other_user_id = match["user1_id"]
-            other_user = await self.get_user_by_id(other_user_id)
-            if other_user:
-                # Remove embedding from response
-                other_user.pop("embedding", None)
-                matches.append({
-                    "match_id": match["id"],
-                    "is_super_match": match.get("is_super_match", False),
-                    "created_at": match["created_at"],
-                    "other_user": other_user
-                })
-        
-        return matches
+    @instrumented("database")
+    async def process_swipes_batch(self, user_id: str, swipes: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Record an ordered list of (target_user_id, action) swipes in one round trip
+        (process_swipes_batch RPC). Returns one row per distinct target; for
+        repeated targets the last action wins.
+        """
+        target_ids = [target for target, _ in swipes]
+        actions = [action for _, action in swipes]
+
+        if self._pg:
+            rows = await self._pg.process_swipes_batch(user_id, target_ids, actions)
+        else:
+            result = self._client.rpc("process_swipes_batch", {
+                "p_user_id": user_id,
+                "p_target_user_ids": target_ids,
+                "p_actions": actions,
+            }).execute()
+            rows = result.data or []
+
+        self._remember_swipes(user_id, [row["target_user_id"] for row in rows])
+        return rows
+
+    @instrumented("database")
+    async def set_match_scores(self, scores: Dict[str, float]) -> None:
+        """Write back compatibility scores for several matches in one statement"""
+        if not scores:
+            return
+        match_ids = list(scores)
+        values = [round(scores[m], 2) for m in match_ids]
+        if self._pg:
+            await self._pg.set_match_scores(match_ids, values)
+            return
+        self._client.rpc("set_match_scores", {"p_match_ids": match_ids, "p_scores": values}).execute()
+
+    async def update_match_score(self, match_id: str, compatibility_score: float) -> bool:
+        """Store the app-computed compatibility score on an existing match"""
+        if self._pg:
+            return await self._pg.update_match_score(match_id, round(compatibility_score, 2))
+        result = self._client.table("matches").update(
+            {"compatibility_score": round(compatibility_score, 2)},
+            count=CountMethod.exact,
+            returning=ReturnMethod.minimal,
+        ).eq("id", match_id).execute()
+        return (result.count or 0) > 0
+
+    @instrumented("database")
+    async def get_user_matches(
+        self,
+        user_id: str,
+        order_by: str = "created_at",
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get a page of matches for a user, joined with the other user's display
+        columns in a single query (get_user_matches RPC).
+        Returns (matches, next_cursor); next_cursor is None on the last page.
+        """
+        cursor_sort, cursor_id = decode_cursor(cursor, order_by) if cursor else (None, None)
+
+        if self._pg:
+            rows = await self._pg.get_user_matches(user_id, order_by, limit, cursor_sort, cursor_id)
+        else:
+            result = self._client.rpc("get_user_matches", {
+                "p_user_id": user_id,
+                "p_order": order_by,
+                "p_limit": limit,
+                "p_cursor_sort": cursor_sort,
+                "p_cursor_id": cursor_id,
+            }).execute()
+            rows = result.data or []
+
+        matches = [
+            {
+                "match_id": row["match_id"],
+                "is_super_match": row["is_super_match"],
+                "compatibility_score": row["compatibility_score"],
+                "created_at": row["created_at"],
+                "other_user": {
+                    "id": row["other_user_id"],
+                    "name": row["name"],
+                    "bio": row["bio"],
+                    "gender": row["gender"],
+                    "grade": row["grade"],
+                    "school": row["school"],
+                    "hobbies": row["hobbies"] or [],
+                    "socials": row["socials"] or {},
+                    "profile_pic_url": row["profile_pic_url"],
+                },
+            }
+            for row in rows
+        ]
+
+        next_cursor = None
+        if limit is not None and len(rows) == limit:
+            next_cursor = encode_cursor(order_by, rows[-1]["sort_key"], rows[-1]["match_id"])
+
+        return matches, next_cursor
     
-    async def get_user_matches_by_auth_id(self, auth_id: str) -> List[Dict[str, Any]]:
+    async def get_user_matches_by_auth_id(
+        self,
+        auth_id: str,
+        order_by: str = "created_at",
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
         """Get matches using auth_id"""
-        user = await self.get_user_by_auth_id(auth_id)
+        user = await self.get_user_identity(auth_id)
         if not user:
-            return []
-        return await self.get_user_matches(user["id"])
+            return [], None
+        return await self.get_user_matches(user["id"], order_by, limit, cursor)
+
+    @instrumented("database")
+    async def get_user_match_stats(self, user_id: str) -> Dict[str, int]:
+        """Match counts for a user from a single aggregate query"""
+        if self._pg:
+            row = await self._pg.get_user_match_stats(user_id)
+        else:
+            result = self._client.rpc("get_user_match_stats", {"p_user_id": user_id}).execute()
+            row = result.data[0] if result.data else None
+
+        total = (row or {}).get("total_matches") or 0
+        super_matches = (row or {}).get("super_matches") or 0
+        return {
+            "total_matches": total,
+            "super_matches": super_matches,
+            "regular_matches": total - super_matches,
+        }
+
+    async def get_user_match_stats_by_auth_id(self, auth_id: str) -> Dict[str, int]:
+        """Match counts using auth_id"""
+        user = await self.get_user_identity(auth_id)
+        if not user:
+            return {"total_matches": 0, "super_matches": 0, "regular_matches": 0}
+        return await self.get_user_match_stats(user["id"])
 
     # ==========================================
     # PHOTO OPERATIONS
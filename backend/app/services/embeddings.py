@@ -1,36 +1,54 @@
 import os
-from typing import List
+from typing import List, Optional
 import aiohttp
 from tenacity import retry, stop_after_attempt, wait_exponential
 from app.core.config import get_settings
+from app.core.metrics import instrumented
 
 settings = get_settings()
 
 class EmbeddingsService:
     def __init__(self):
         self.api_key = settings.HUGGINGFACE_API_KEY
-        self.api_url = "https://api-inference.huggingface.co/pipeline/feature-extraction/sentence-transformers/all-MiniLM-L6-v2"
+        self.api_url = settings.EMBEDDINGS_API_URL
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def session(self) -> aiohttp.ClientSession:
+        """Shared client session, so connections to the API are reused across calls"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def ping(self):
+        """Reachability of the inference API without running the model: any non-5xx reply"""
+        async with self.session().get(self.api_url, headers={"Authorization": f"Bearer {self.api_key}"}) as response:
+            if response.status >= 500:
+                raise Exception(f"Hugging Face API error: {response.status}")
         
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+    @instrumented("embeddings")  # inside the retry: one count per HTTP attempt
     async def get_embedding(self, text: str) -> List[float]:
         """Get embedding with retry logic"""
         headers = {"Authorization": f"Bearer {self.api_key}"}
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.api_url,
-                headers=headers,
-                json={"inputs": text, "options": {"wait_for_model": True}}
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    # Handle case where API returns list of list
-                    if isinstance(result, list) and isinstance(result[0], list):
-                        return result[0]
-                    return result
-                else:
-                    error_text = await response.text()
-                    raise Exception(f"Hugging Face API error: {response.status} - {error_text}")
+        async with self.session().post(
+            self.api_url,
+            headers=headers,
+            json={"inputs": text, "options": {"wait_for_model": True}}
+        ) as response:
+            if response.status == 200:
+                result = await response.json()
+                # Handle case where API returns list of list
+                if isinstance(result, list) and isinstance(result[0], list):
+                    return result[0]
+                return result
+            else:
+                error_text = await response.text()
+                raise Exception(f"Hugging Face API error: {response.status} - {error_text}")
     
     def cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         import math
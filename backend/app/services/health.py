@@ -0,0 +1,113 @@
+"""
+Background dependency probes.
+Each probe (database, embedding API) runs on its own interval in a
+background task; /health, /health/live and /health/ready only read the
+latest results, so load balancer and uptime pings never touch a dependency
+and a slow dependency can't make the health check itself slow.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CheckFn = Callable[[], Awaitable[Any]]
+
+# A result older than this many intervals means the prober itself is stuck
+STALE_AFTER_INTERVALS = 3
+
+
+class _Probe:
+    __slots__ = ("name", "check", "interval", "critical", "status", "latency_ms", "checked_at", "failures")
+
+    def __init__(self, name: str, check: CheckFn, interval: float, critical: bool):
+        self.name = name
+        self.check = check
+        self.interval = interval
+        # Readiness fails while a critical probe is unhealthy; others only degrade /health
+        self.critical = critical
+        self.status = "pending"
+        self.latency_ms: Optional[float] = None
+        self.checked_at: Optional[float] = None
+        self.failures = 0
+
+    def stale(self, now: float, timeout: float) -> bool:
+        if self.checked_at is None:
+            return False
+        return now - self.checked_at > self.interval * STALE_AFTER_INTERVALS + timeout
+
+    def to_dict(self, now: float, timeout: float) -> Dict[str, Any]:
+        return {
+            "status": "stale" if self.stale(now, timeout) else self.status,
+            "critical": self.critical,
+            "latency_ms": self.latency_ms,
+            "checked_at": self.checked_at,
+            "age_seconds": round(now - self.checked_at, 1) if self.checked_at is not None else None,
+            "consecutive_failures": self.failures,
+        }
+
+
+class HealthMonitor:
+    """Per worker process; every worker probes on its own"""
+
+    def __init__(self, timeout: float = 2.0):
+        self.timeout = timeout
+        self._probes: Dict[str, _Probe] = {}
+        self._tasks: List[asyncio.Task] = []
+
+    def add(self, name: str, check: CheckFn, interval: float, critical: bool = True):
+        """Register a probe; an interval <= 0 disables it"""
+        if interval > 0:
+            self._probes[name] = _Probe(name, check, interval, critical)
+
+    async def start(self):
+        """One round inline so readiness is known before the first request, then the loops"""
+        await asyncio.gather(*(self._run(probe) for probe in self._probes.values()))
+        self._tasks = [asyncio.create_task(self._loop(probe)) for probe in self._probes.values()]
+
+    async def close(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _loop(self, probe: _Probe):
+        while True:
+            await asyncio.sleep(probe.interval)
+            await self._run(probe)
+
+    async def _run(self, probe: _Probe):
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(probe.check(), self.timeout)
+            status, error = "healthy", None
+        except asyncio.TimeoutError:
+            status, error = "unhealthy", f"timed out after {self.timeout}s"
+        except Exception as e:
+            status, error = "unhealthy", str(e)
+
+        probe.latency_ms = round((time.perf_counter() - start) * 1000, 1)
+        probe.checked_at = time.time()
+        probe.failures = 0 if error is None else probe.failures + 1
+        # Log transitions only, not every probe
+        if status != probe.status:
+            if error is None:
+                logger.info(f"Health probe {probe.name} is healthy ({probe.latency_ms}ms)")
+            else:
+                logger.warning(f"Health probe {probe.name} failed: {error}")
+        probe.status = status
+
+    def ready(self) -> bool:
+        """Every critical probe has a fresh healthy result"""
+        now = time.time()
+        return all(
+            probe.status == "healthy" and not probe.stale(now, self.timeout)
+            for probe in self._probes.values()
+            if probe.critical
+        )
+
+    def checks(self) -> Dict[str, Dict[str, Any]]:
+        """Latest result per probe; error details stay in the server log"""
+        now = time.time()
+        return {name: probe.to_dict(now, self.timeout) for name, probe in self._probes.items()}
@@ -3,20 +3,92 @@ Enterprise Matching Service
 Combines Hugging Face embeddings with Supabase pgvector search
 + Advanced compatibility scoring engine
 """
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional, Set, Tuple
+from app.core.cache import LRUCache
+from app.core.config import get_settings
+from app.core.metrics import stage_timer
 from app.services.database import DatabaseService
 from app.services.embeddings import EmbeddingsService
 from app.services.compatibility_engine import CompatibilityEngine, AIEnhancementLayer
+from app.services.notifications import user_channel
+from app.services.recommendation_queue import RecommendationQueue
+import asyncio
 import logging
+import math
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# pgvector refuses hnsw.ef_search above this
+MAX_EF_SEARCH = 1000
+
+# Sorts after every user id: a keyset of (distance, MAX_UUID) skips the whole distance
+MAX_UUID = "ffffffff-ffff-ffff-ffff-ffffffffffff"
+
+
+class OverFetchTracker:
+    """
+    Learns, per user, what share of vector-search candidates their
+    deal-breakers reject, and turns that into how many candidates to fetch
+    per surviving recommendation. Bounded and per worker process.
+    """
+
+    def __init__(self, maxsize: int = 10000, smoothing: float = 0.3):
+        self._rates: LRUCache[float] = LRUCache(maxsize)
+        self.smoothing = smoothing
+
+    def record(self, key: str, seen: int, rejected: int):
+        if seen <= 0:
+            return
+        observed = rejected / seen
+        previous = self._rates.get(key)
+        if previous is None:
+            self._rates.set(key, observed)
+        else:
+            self._rates.set(key, previous + self.smoothing * (observed - previous))
+
+    def rejection_rate(self, key: str) -> Optional[float]:
+        return self._rates.get(key)
+
+    def factor(self, key: str) -> float:
+        rate = self._rates.get(key)
+        if rate is None:
+            return settings.RECOMMENDATION_OVERFETCH_DEFAULT
+        return self.factor_for_rate(rate)
+
+    @staticmethod
+    def factor_for_rate(rate: float) -> float:
+        """Candidates per survivor at this rejection rate, with 20% headroom"""
+        if rate >= 1.0:
+            return settings.RECOMMENDATION_OVERFETCH_MAX
+        factor = 1.2 / (1.0 - rate)
+        return min(settings.RECOMMENDATION_OVERFETCH_MAX, max(settings.RECOMMENDATION_OVERFETCH_MIN, factor))
+
+
+overfetch_tracker = OverFetchTracker()
+
+# What a swipe card renders; the rest of a card is fetched per card on demand
+COMPACT_PROFILE_FIELDS = ("name", "bio", "grade", "hobbies", "profile_pic_url")
+
 
 class MatchingService:
-    def __init__(self):
-        self.db = DatabaseService()
-        self.embeddings = EmbeddingsService()
-        self.compatibility = CompatibilityEngine()
+    def __init__(
+        self,
+        db: Optional[DatabaseService] = None,
+        embeddings: Optional[EmbeddingsService] = None,
+        compatibility: Optional[CompatibilityEngine] = None,
+        recommendation_queue: Optional[RecommendationQueue] = None,
+    ):
+        self.db = db or DatabaseService()
+        self.embeddings = embeddings or EmbeddingsService()
+        self.compatibility = compatibility or CompatibilityEngine()
         self.ai_enhancement = AIEnhancementLayer(self.embeddings)
+        # Set by ServiceContainer; decks are only kept when the app owns one
+        self.recommendation_queue = recommendation_queue
+        # Broker for match events (app.services.notifications); set by ServiceContainer
+        self.notifications = None
+        # Match announcements run off the swipe's response path
+        self._announcements: Set[asyncio.Task] = set()
     
     async def generate_and_store_embedding(self, auth_id: str, profile_data: Dict[str, Any]) -> bool:
         """
@@ -39,6 +111,9 @@ class MatchingService:
             
             if success:
                 logger.info(f"✅ Embedding stored for user {auth_id} (dim: {len(embedding)})")
+                # Queued cards were ranked against the old profile
+                if self.recommendation_queue:
+                    self.recommendation_queue.invalidate(auth_id)
             
             return success
             
@@ -80,177 +155,430 @@ class MatchingService:
         return " ".join(parts)
     
     async def get_recommendations(self, auth_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """compute_recommendations, with any failure logged and returned as no cards"""
+        try:
+            return await self.compute_recommendations(auth_id, limit)
+        except Exception as e:
+            logger.error(f"❌ Recommendation fetch failed for {auth_id}: {e}")
+            return []
+
+    async def compute_recommendations(self, auth_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get profile recommendations using HYBRID approach:
         1. pgvector similarity search (fast, semantic)
         2. Compatibility engine scoring (questionnaire-based)
         3. AI enhancement (NLP boost)
+        Candidates are paged through the vector ranking until `limit` of them
+        survive deal-breaker filtering or the candidate budget runs out.
+        Errors propagate, so callers can tell a failure from running out.
         """
-        try:
-            # Step 1: Get initial matches from vector search
-            vector_matches = await self.db.find_matches_by_auth_id(auth_id, limit * 2)  # Get more for filtering
-            
-            if not vector_matches:
-                return []
-            
-            # Step 2: Get current user's data
-            current_user = await self.db.get_user_by_auth_id(auth_id)
-            if not current_user:
-                return []
-            
-            current_answers = current_user.get("question_answers", {}) or {}
+        # Step 1: Get current user's data
+        current_user = await self.db.get_user_scoring_view(auth_id)
+        if not current_user:
+            return []
+
+        # Step 2: Score candidates page by page
+        scored_recommendations = [
+            card async for card in self._scored_candidates(auth_id, current_user, limit)
+        ]
+
+        # Step 3: Sort by final compatibility score and return top N
+        scored_recommendations.sort(
+            key=lambda x: x["compatibility_percentage"],
+            reverse=True
+        )
+        return scored_recommendations[:limit]
+
+    async def stream_recommendations(self, auth_id: str, limit: int = 10) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        get_recommendations as it happens: ("card", card) for each of the
+        first `limit` candidates to survive scoring, in scoring order, then
+        ("card", card) for any later candidate that made the final top
+        `limit`, then ("done", {"order": [user_id, ...], "count": n}) with
+        the final ranking. Clients show cards as they arrive and reorder
+        the ones not yet shown when "done" comes in.
+        """
+        current_user = await self.db.get_user_scoring_view(auth_id)
+        if not current_user:
+            yield "done", {"order": [], "count": 0}
+            return
+        
+        scored_recommendations = []
+        sent = set()
+        async for card in self._scored_candidates(auth_id, current_user, limit):
+            scored_recommendations.append(card)
+            if len(sent) < limit:
+                sent.add(card["user_id"])
+                yield "card", card
+        
+        scored_recommendations.sort(key=lambda x: x["compatibility_percentage"], reverse=True)
+        top = scored_recommendations[:limit]
+        for card in top:
+            if card["user_id"] not in sent:
+                yield "card", card
+        yield "done", {"order": [card["user_id"] for card in top], "count": len(top)}
+    
+    async def _scored_candidates(
+        self, auth_id: str, current_user: Dict[str, Any], limit: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Recommendation cards in vector-search order, as each is scored.
+        Pages through the ranking until `limit` cards survive deal-breaker
+        filtering, the last page comes back short or the budget runs out.
+        """
+        scored = 0
+        seen_ids = set()
+        seen = rejected = 0
+        after = None
+        tied_ids: List[str] = []
+        budget = settings.RECOMMENDATION_CANDIDATE_BUDGET
+        page_size = self._page_size(limit, overfetch_tracker.factor(auth_id), budget)
+        
+        # Outside "db" mode swiped users are excluded from the cached set
+        # rather than by a per-candidate probe against swipes; each page is
+        # checked with one query for swipes made through other workers
+        mode = settings.SWIPE_EXCLUSION_MODE
+        swiped = await self.db.get_swiped_set(current_user["id"]) if mode != "db" else None
+        swiped_ids = swiped.to_list() if mode == "array" else []
+        
+        for _ in range(settings.RECOMMENDATION_MAX_PAGES):
+            ef_search = min(MAX_EF_SEARCH, max(settings.VECTOR_EF_SEARCH or 0, seen + page_size))
+            with stage_timer("find_matches"):
+                vector_matches = await self.db.find_matches(
+                    current_user["id"],
+                    page_size,
+                    after=after,
+                    ef_search=ef_search,
+                    exclude=(swiped_ids + tied_ids) or None,
+                    skip_swiped=swiped is None,
+                )
+            seen += len(vector_matches)
             
-            # Step 3: Calculate compatibility scores for each match
-            scored_recommendations = []
+            page_ids = [match["user_id"] for match in vector_matches]
+            if swiped is not None and page_ids:
+                swiped.add(await self.db.get_swiped_among(current_user["id"], page_ids))
+            already_swiped = swiped.contains_many(page_ids) if swiped is not None else [False] * len(page_ids)
             
-            for match in vector_matches:
-                target_answers = match.get("question_answers", {}) or {}
+            for match, was_swiped in zip(vector_matches, already_swiped):
+                # Never show a card twice, whatever the database hands back
+                if match["user_id"] in seen_ids:
+                    continue
+                seen_ids.add(match["user_id"])
+                
+                # Swiped users cost a slot just like deal-breakers
+                if was_swiped:
+                    rejected += 1
+                    continue
                 
-                # Calculate compatibility score
-                compatibility_result = self.compatibility.calculate_compatibility(
-                    current_answers,
-                    target_answers
+                # Compatibility score * AI boost (NLP boost from personality)
+                compatibility_result, ai_boost, final_score = await self._score_pair(
+                    current_user, match, boost_deal_breakers=False
                 )
                 
                 # Skip if deal-breakers found
                 if compatibility_result["deal_breakers"]:
+                    rejected += 1
                     continue
                 
-                # Apply AI enhancement (NLP boost from personality)
-                ai_boost = 1.0
-                if current_user.get("personality") and match.get("personality"):
-                    try:
-                        ai_boost = await self.ai_enhancement.enhance_with_nlp(
-                            current_user["personality"],
-                            match["personality"]
-                        )
-                    except Exception as e:
-                        logger.warning(f"AI enhancement failed: {e}")
-                
-                # Final score = compatibility score * AI boost
-                final_score = compatibility_result["overall_score"] * ai_boost
-                final_score = min(100.0, max(0.0, final_score))  # Clamp to 0-100
-                
-                scored_recommendations.append({
-                    "user_id": match["user_id"],
-                    "profile": {
-                        "name": match["name"],
-                        "bio": match["bio"],
-                        "gender": match["gender"],
-                        "grade": match["grade"],
-                        "hobbies": match["hobbies"] or [],
-                        "personality": match["personality"],
-                        "question_answers": match["question_answers"] or {},
-                        "socials": match["socials"] or {},
-                        "profile_pic_url": match["profile_pic_url"]
-                    },
-                    "similarity_score": match["similarity"],
-                    "compatibility_percentage": round(final_score, 1),
-                    "compatibility_details": {
-                        "score": compatibility_result["overall_score"],
-                        "confidence": compatibility_result["confidence"],
-                        "category_scores": compatibility_result["category_scores"],
-                        "strengths": compatibility_result["strengths"],
-                        "explanation": compatibility_result["explanation"],
-                        "ai_boost": round(ai_boost, 2)
-                    }
-                })
+                scored += 1
+                yield self._recommendation(match, compatibility_result, ai_boost, final_score)
             
-            # Step 4: Sort by final compatibility score and return top N
-            scored_recommendations.sort(
-                key=lambda x: x["compatibility_percentage"], 
-                reverse=True
-            )
-            
-            recommendations = scored_recommendations[:limit]
+            remaining = limit - scored
+            if remaining <= 0 or len(vector_matches) < page_size or seen >= budget:
+                break
             
-            logger.info(f"Found {len(recommendations)} scored recommendations for {auth_id}")
-            return recommendations
+            # Rows tied on distance come back in index order, not by id, so a
+            # keyset can't split a tie group. Resume past the last complete
+            # distance on this page and exclude the tied rows already seen.
+            last_distance = vector_matches[-1]["distance"]
+            earlier = [m["distance"] for m in vector_matches if m["distance"] < last_distance]
+            if earlier:
+                after = (max(earlier), MAX_UUID)
+                tied_ids = []
+            tied_ids += [m["user_id"] for m in vector_matches if m["distance"] == last_distance]
             
-        except Exception as e:
-            logger.error(f"❌ Recommendation fetch failed for {auth_id}: {e}")
-            return []
+            # Size the next page from what this request has rejected so far
+            factor = overfetch_tracker.factor_for_rate(rejected / seen)
+            page_size = self._page_size(remaining, factor, budget - seen)
+        
+        overfetch_tracker.record(auth_id, seen, rejected)
+        logger.info(
+            f"Found {min(scored, limit)} scored recommendations for {auth_id} "
+            f"({seen} candidates, {rejected} rejected)"
+        )
+    
+    @staticmethod
+    def _page_size(wanted: int, factor: float, budget: int) -> int:
+        """Candidates to request for `wanted` survivors, capped by the remaining budget"""
+        return max(1, min(budget, math.ceil(wanted * factor)))
+    
+    @staticmethod
+    def _recommendation(
+        match: Dict[str, Any],
+        compatibility_result: Dict[str, Any],
+        ai_boost: float,
+        final_score: float,
+    ) -> Dict[str, Any]:
+        return {
+            "user_id": match["user_id"],
+            "profile": {
+                "name": match["name"],
+                "bio": match["bio"],
+                "gender": match["gender"],
+                "grade": match["grade"],
+                "hobbies": match["hobbies"] or [],
+                "personality": match["personality"],
+                "question_answers": match["question_answers"] or {},
+                "socials": match["socials"] or {},
+                "profile_pic_url": match["profile_pic_url"]
+            },
+            "similarity_score": match["similarity"],
+            "compatibility_percentage": round(final_score, 1),
+            "compatibility_details": {
+                "score": compatibility_result["overall_score"],
+                "confidence": compatibility_result["confidence"],
+                "category_scores": compatibility_result["category_scores"],
+                "strengths": compatibility_result["strengths"],
+                "explanation": compatibility_result["explanation"],
+                "ai_boost": round(ai_boost, 2)
+            }
+        }
     
+    @staticmethod
+    def compact_recommendation(card: Dict[str, Any]) -> Dict[str, Any]:
+        """The fields a swipe card renders, from a full recommendation card"""
+        profile = card["profile"]
+        return {
+            "user_id": card["user_id"],
+            "profile": {field: profile[field] for field in COMPACT_PROFILE_FIELDS},
+            "compatibility_percentage": card["compatibility_percentage"],
+        }
+
+    async def drop_swiped(self, auth_id: str, cards: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        `cards` minus users the caller has already swiped on, checked against
+        the swipes table, for cards held since before swipes that may have
+        gone through another worker
+        """
+        if not cards:
+            return cards
+        user = await self.db.get_user_identity(auth_id)
+        if not user:
+            return []
+        swiped = await self.db.get_swiped_among(user["id"], [card["user_id"] for card in cards])
+        return [card for card in cards if card["user_id"] not in swiped] if swiped else cards
+
+    async def get_recommendation_details(self, auth_id: str, target_user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Full card for one candidate, for clients that fetched the compact view.
+        Served from the caller's recommendation queue when the card is there,
+        otherwise scored on the spot. None if the target doesn't exist, is
+        the caller, or fails the caller's deal-breakers.
+        """
+        if self.recommendation_queue:
+            card = self.recommendation_queue.find(auth_id, target_user_id)
+            if card is not None:
+                return card
+
+        current_user = await self.db.get_user_scoring_view(auth_id)
+        if not current_user or current_user["id"] == target_user_id:
+            return None
+        target, target_card = await asyncio.gather(
+            self.db.get_user_scoring_view_by_id(target_user_id),
+            self.db.get_user_card(target_user_id),
+        )
+        if not target or not target_card:
+            return None
+
+        compatibility_result, ai_boost, final_score = await self._score_pair(
+            current_user, target, boost_deal_breakers=False
+        )
+        if compatibility_result["deal_breakers"]:
+            return None
+        match = {
+            **target_card,
+            "user_id": target_card["id"],
+            "personality": target["personality"],
+            "question_answers": target["question_answers"],
+            "similarity": None,  # only known from a vector search
+        }
+        return self._recommendation(match, compatibility_result, ai_boost, final_score)
+
+    async def _score_pair(
+        self, user: Dict[str, Any], target: Dict[str, Any], boost_deal_breakers: bool = True
+    ) -> Tuple[Dict[str, Any], float, float]:
+        """
+        Questionnaire compatibility plus AI personality boost for two users.
+        Returns (compatibility_result, ai_boost, final_score clamped to 0-100).
+        Callers that drop deal-breaker pairs pass boost_deal_breakers=False to
+        skip the embedding calls; stored match scores always include the boost.
+        """
+        with stage_timer("compatibility"):
+            compatibility_result = self.compatibility.calculate_compatibility(
+                user.get("question_answers", {}) or {},
+                target.get("question_answers", {}) or {}
+            )
+
+        ai_boost = 1.0
+        wants_boost = boost_deal_breakers or not compatibility_result["deal_breakers"]
+        if wants_boost and user.get("personality") and target.get("personality"):
+            try:
+                with stage_timer("ai_boost"):
+                    ai_boost = await self.ai_enhancement.enhance_with_nlp(
+                        user["personality"],
+                        target["personality"]
+                    )
+            except Exception as e:
+                logger.warning(f"AI enhancement failed: {e}")
+
+        final_score = compatibility_result["overall_score"] * ai_boost
+        final_score = min(100.0, max(0.0, final_score))  # Clamp to 0-100
+        return compatibility_result, ai_boost, final_score
+
+    async def _score_new_matches(self, user: Dict[str, Any], rows: List[Dict[str, Any]]) -> Dict[str, Tuple[Dict[str, Any], float]]:
+        """Score every matched row returned by a swipe RPC; keyed by match_id"""
+        scored = {}
+        for row in rows:
+            if not row["match_created"]:
+                continue
+            target_user = {
+                "question_answers": row["target_question_answers"],
+                "personality": row["target_personality"],
+            }
+            compatibility_result, _, final_score = await self._score_pair(user, target_user)
+            scored[row["match_id"]] = (compatibility_result, round(final_score, 1))
+        return scored
+
+    def _announce_later(
+        self, user_id: str, rows: List[Dict[str, Any]], scored: Dict[str, Tuple[Dict[str, Any], float]]
+    ):
+        """Publish match events in the background so a slow broker never delays the swipe"""
+        if not self.notifications:
+            return
+        task = asyncio.create_task(self._announce_matches(user_id, rows, scored))
+        self._announcements.add(task)
+        task.add_done_callback(self._announcements.discard)
+
+    async def close(self):
+        """Let pending match announcements finish before the broker closes"""
+        if self._announcements:
+            _, pending = await asyncio.wait(list(self._announcements), timeout=5)
+            for task in pending:
+                task.cancel()
+
+    async def _announce_matches(
+        self, user_id: str, rows: List[Dict[str, Any]], scored: Dict[str, Tuple[Dict[str, Any], float]]
+    ):
+        """Push a "match" event to both users of every new match; never fails the swipe"""
+        if not self.notifications:
+            return
+        for row in rows:
+            if not row["match_created"] or row["match_id"] not in scored:
+                continue
+            _, final_score = scored[row["match_id"]]
+            target_user_id = str(row["target_user_id"])
+            for recipient, other in ((user_id, target_user_id), (target_user_id, user_id)):
+                try:
+                    await self.notifications.publish(user_channel(recipient), {
+                        "event": "match",
+                        "data": {
+                            "match_id": str(row["match_id"]),
+                            "user_id": other,
+                            "is_super_match": row["is_super_match"],
+                            "compatibility_score": final_score,
+                        },
+                    })
+                except Exception as e:
+                    logger.warning(f"Match notification failed for {recipient}: {e}")
+
+    @staticmethod
+    def _swipe_result(row: Dict[str, Any], scored: Dict[str, Tuple[Dict[str, Any], float]]) -> Dict[str, Any]:
+        result = {
+            "swipe_recorded": True,
+            "match_created": False,
+            "match_id": None,
+            "is_super_match": False,
+            "compatibility_score": None
+        }
+        if row["match_created"] and row["match_id"] in scored:
+            compatibility_result, final_score = scored[row["match_id"]]
+            result["match_created"] = True
+            result["match_id"] = row["match_id"]
+            result["is_super_match"] = row["is_super_match"]
+            result["compatibility_score"] = final_score
+            result["compatibility_details"] = {
+                "explanation": compatibility_result["explanation"],
+                "strengths": compatibility_result["strengths"],
+                "category_scores": compatibility_result["category_scores"]
+            }
+        return result
+
     async def process_swipe(self, user_auth_id: str, target_user_id: str, action: str) -> Dict[str, Any]:
         """
         Process a swipe action and check for matches.
+        The swipe, reciprocity check and match creation happen atomically in
+        one database round trip; only the compatibility score is computed here.
         Returns match info if a mutual match is created, including compatibility score.
         """
         try:
-            # Get user's internal ID
-            user = await self.db.get_user_by_auth_id(user_auth_id)
+            # Get user's internal ID and scoring fields
+            user = await self.db.get_user_scoring_view(user_auth_id)
             if not user:
                 raise Exception("User not found")
             
             user_id = user["id"]
             
-            # Record the swipe
-            await self.db.record_swipe(user_id, target_user_id, action)
+            swipe = await self.db.process_swipe(user_id, target_user_id, action)
+            scored = await self._score_new_matches(user, [swipe])
             
-            result = {
-                "swipe_recorded": True,
-                "match_created": False,
-                "match_id": None,
-                "is_super_match": False,
-                "compatibility_score": None
-            }
+            if swipe["match_created"]:
+                _, final_score = scored[swipe["match_id"]]
+                await self.db.update_match_score(swipe["match_id"], final_score)
+                logger.info(f"🎉 Match created! {user_id} <-> {target_user_id} (Score: {final_score:.1f}%)")
+                self._announce_later(user_id, [{**swipe, "target_user_id": target_user_id}], scored)
             
-            # Check for mutual match (only if yes or super)
-            if action in ["yes", "super"]:
-                # Check if target already swiped on us
-                target_action = await self.db.check_mutual_swipe(user_id, target_user_id)
-                
-                if target_action in ["yes", "super"]:
-                    # It's a match! Calculate compatibility
-                    target_user = await self.db.get_user_by_id(target_user_id)
-                    
-                    if target_user:
-                        # Calculate compatibility score for the match
-                        user_answers = user.get("question_answers", {}) or {}
-                        target_answers = target_user.get("question_answers", {}) or {}
-                        
-                        compatibility_result = self.compatibility.calculate_compatibility(
-                            user_answers,
-                            target_answers
-                        )
-                        
-                        # Apply AI enhancement
-                        ai_boost = 1.0
-                        if user.get("personality") and target_user.get("personality"):
-                            try:
-                                ai_boost = await self.ai_enhancement.enhance_with_nlp(
-                                    user["personality"],
-                                    target_user["personality"]
-                                )
-                            except:
-                                pass
-                        
-                        final_score = compatibility_result["overall_score"] * ai_boost
-                        final_score = min(100.0, max(0.0, final_score))
-                        
-                        # It's a match!
-                        is_super = action == "super" or target_action == "super"
-                        match = await self.db.create_match(
-                            user_id, 
-                            target_user_id, 
-                            is_super,
-                            compatibility_score=round(final_score, 1)
-                        )
-                        
-                        if match:
-                            result["match_created"] = True
-                            result["match_id"] = match["id"]
-                            result["is_super_match"] = is_super
-                            result["compatibility_score"] = round(final_score, 1)
-                            result["compatibility_details"] = {
-                                "explanation": compatibility_result["explanation"],
-                                "strengths": compatibility_result["strengths"],
-                                "category_scores": compatibility_result["category_scores"]
-                            }
-                            logger.info(f"🎉 Match created! {user_id} <-> {target_user_id} (Score: {final_score:.1f}%)")
-            
-            return result
+            if self.recommendation_queue:
+                self.recommendation_queue.consume(user_auth_id, [target_user_id])
+            return self._swipe_result(swipe, scored)
             
         except Exception as e:
             logger.error(f"❌ Swipe processing failed: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    async def process_swipes_batch(self, user_auth_id: str, swipes: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Process an ordered list of (target_user_id, action) swipes with one
+        bulk upsert and one reciprocity check. Returns one result per input
+        swipe, in input order, shaped like process_swipe's result.
+        """
+        try:
+            user = await self.db.get_user_scoring_view(user_auth_id)
+            if not user:
+                raise Exception("User not found")
+
+            user_id = user["id"]
+
+            rows = await self.db.process_swipes_batch(user_id, swipes)
+            scored = await self._score_new_matches(user, rows)
+
+            if scored:
+                await self.db.set_match_scores({match_id: score for match_id, (_, score) in scored.items()})
+                logger.info(f"🎉 {len(scored)} match(es) created in swipe batch for {user_id}")
+                self._announce_later(user_id, rows, scored)
+
+            if self.recommendation_queue:
+                self.recommendation_queue.consume(user_auth_id, [target for target, _ in swipes])
+
+            by_target = {row["target_user_id"]: row for row in rows}
+            results = []
+            for target_user_id, action in swipes:
+                row = by_target.get(target_user_id.lower())
+                if row is None:
+                    results.append({"target_user_id": target_user_id, "swipe_recorded": False, "match_created": False})
+                    continue
+                results.append({"target_user_id": target_user_id, **self._swipe_result(row, scored)})
+            return results
+
+        except Exception as e:
+            logger.error(f"❌ Batch swipe processing failed: {e}")
+            raise
@@ -0,0 +1,115 @@
+"""
+Per-user event channels (match notifications).
+The matching service publishes small events to a user's channel; the
+/notifications/stream endpoint relays that channel to the user's open
+connections. The broker is picked by NOTIFICATIONS_BROKER_URI:
+
+    memory://               in-process; only connections on the same worker see an event
+    redis://host:6379/0     Redis pub/sub; every worker on every host sees it
+
+Delivery is best effort: an event published while a user has no open
+connection is dropped, and clients reload /matches when they reconnect.
+"""
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+from app.core.responses import dumps
+
+logger = logging.getLogger(__name__)
+
+Message = Dict[str, Any]  # {"event": str, "data": {...}}
+
+
+def user_channel(user_id: str) -> str:
+    return f"notifications:{user_id}"
+
+
+class InProcessBroker:
+    """Channels are sets of per-connection queues in this process"""
+
+    def __init__(self, max_pending: int = 100):
+        self.max_pending = max_pending
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+
+    async def publish(self, channel: str, message: Message):
+        for queue in list(self._subscribers.get(channel, ())):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                logger.warning(f"Dropping event for slow subscriber on {channel}")
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator["_LocalSubscription"]:
+        queue: asyncio.Queue = asyncio.Queue(self.max_pending)
+        self._subscribers[channel].add(queue)
+        try:
+            yield _LocalSubscription(queue)
+        finally:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[channel]
+
+    async def close(self):
+        self._subscribers.clear()
+
+
+class _LocalSubscription:
+    def __init__(self, queue: asyncio.Queue):
+        self._queue = queue
+
+    async def messages(self, heartbeat: float) -> AsyncIterator[Optional[Message]]:
+        """Messages as they arrive; None after `heartbeat` seconds of silence"""
+        while True:
+            try:
+                yield await asyncio.wait_for(self._queue.get(), heartbeat)
+            except asyncio.TimeoutError:
+                yield None
+
+
+class RedisBroker:
+    """Redis pub/sub; the connection pool is opened on first use"""
+
+    def __init__(self, uri: str):
+        import redis.asyncio as redis  # only needed for redis:// brokers
+
+        self._client = redis.from_url(uri)
+
+    async def publish(self, channel: str, message: Message):
+        await self._client.publish(channel, dumps(message))
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator["_RedisSubscription"]:
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(channel)
+        try:
+            yield _RedisSubscription(pubsub)
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
+
+    async def close(self):
+        await self._client.aclose()
+
+
+class _RedisSubscription:
+    def __init__(self, pubsub):
+        self._pubsub = pubsub
+
+    async def messages(self, heartbeat: float) -> AsyncIterator[Optional[Message]]:
+        while True:
+            message = await self._pubsub.get_message(timeout=heartbeat)
+            yield json.loads(message["data"]) if message else None
+
+
+def broker_from_uri(uri: str):
+    if uri.startswith("memory://"):
+        return InProcessBroker()
+    if uri.startswith(("redis://", "rediss://")):
+        return RedisBroker(uri)
+    raise ValueError(f"Unsupported NOTIFICATIONS_BROKER_URI: {uri}")
@@ -0,0 +1,279 @@
+"""
+Direct Postgres repository (asyncpg)
+Serves the hot queries straight from Postgres instead of going through PostgREST
+"""
+import asyncio
+import json
+import logging
+import struct
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Dict, Any, Optional, Tuple
+
+import asyncpg
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# ==========================================
+# HOT QUERIES
+# asyncpg prepares each statement on first use and keeps it in the
+# per-connection statement cache, so these are parsed/planned once per connection.
+# ==========================================
+
+# Each (key, projection) pair is its own prepared statement
+USER_LOOKUP_KEYS = ("id", "auth_id")
+
+GET_SWIPE = "SELECT action FROM swipes WHERE user_id = $1 AND target_user_id = $2"
+
+RECORD_SWIPE = """
+    INSERT INTO swipes (user_id, target_user_id, action)
+    VALUES ($1, $2, $3)
+    ON CONFLICT (user_id, target_user_id)
+    DO UPDATE SET action = EXCLUDED.action
+    RETURNING *
+"""
+
+PROCESS_SWIPE = "SELECT * FROM process_swipe($1, $2, $3)"
+
+PROCESS_SWIPES_BATCH = "SELECT * FROM process_swipes_batch($1, $2, $3)"
+
+SET_MATCH_SCORES = "SELECT set_match_scores($1, $2)"
+
+UPDATE_MATCH_SCORE = "UPDATE matches SET compatibility_score = $2 WHERE id = $1"
+
+FIND_MATCHES = "SELECT * FROM find_matches($1, $2, $3, $4, $5, $6, $7, $8, $9)"
+
+GET_SWIPED_TARGET_IDS = "SELECT target_user_id FROM swipes WHERE user_id = $1"
+
+GET_SWIPED_AMONG = "SELECT target_user_id FROM swipes WHERE user_id = $1 AND target_user_id = ANY($2)"
+
+GET_USER_MATCHES = "SELECT * FROM get_user_matches($1, $2, $3, $4, $5)"
+
+GET_USER_MATCH_STATS = "SELECT * FROM get_user_match_stats($1)"
+
+UPDATE_EMBEDDING_BY_AUTH_ID = "UPDATE users SET embedding = $2 WHERE auth_id = $1"
+
+
+# ==========================================
+# TYPE CODECS
+# ==========================================
+
+def _encode_vector(value) -> bytes:
+    """pgvector binary format: int16 dim, int16 unused, dim x float32 (big-endian)"""
+    arr = np.asarray(value, dtype=">f4")
+    return struct.pack(">HH", arr.shape[0], 0) + arr.tobytes()
+
+
+def _decode_vector(data: bytes) -> List[float]:
+    dim, _ = struct.unpack_from(">HH", data)
+    return np.frombuffer(data, dtype=">f4", count=dim, offset=4).astype(np.float32).tolist()
+
+
+def _to_jsonable(value: Any) -> Any:
+    """Normalize asyncpg values to what the PostgREST client returns"""
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _record_to_dict(record: Optional[asyncpg.Record]) -> Optional[Dict[str, Any]]:
+    if record is None:
+        return None
+    return {key: _to_jsonable(value) for key, value in record.items()}
+
+
+async def _init_connection(conn: asyncpg.Connection):
+    """Register JSON and binary pgvector codecs on every new pool connection"""
+    await conn.set_type_codec("jsonb", encoder=json.dumps, decoder=json.loads, schema="pg_catalog")
+    await conn.set_type_codec("json", encoder=json.dumps, decoder=json.loads, schema="pg_catalog")
+
+    # Supabase installs pgvector into the "extensions" schema, plain Postgres into "public"
+    vector_schema = await conn.fetchval(
+        "SELECT n.nspname FROM pg_type t JOIN pg_namespace n ON n.oid = t.typnamespace "
+        "WHERE t.typname = 'vector' LIMIT 1"
+    )
+    if vector_schema:
+        await conn.set_type_codec(
+            "vector",
+            schema=vector_schema,
+            encoder=_encode_vector,
+            decoder=_decode_vector,
+            format="binary",
+        )
+    else:
+        logger.warning("pgvector type not found - embeddings will not be decoded")
+
+
+class PostgresRepository:
+    """asyncpg pool for the hot read/write paths. The pool is created lazily on first use."""
+
+    def __init__(
+        self,
+        dsn: str,
+        min_size: int = 2,
+        max_size: int = 10,
+        max_inactive_connection_lifetime: float = 300.0,
+        command_timeout: float = 10.0,
+        statement_cache_size: int = 100,
+    ):
+        self._dsn = dsn
+        self._pool_kwargs = {
+            "min_size": min_size,
+            "max_size": max_size,
+            "max_inactive_connection_lifetime": max_inactive_connection_lifetime,
+            "command_timeout": command_timeout,
+            "statement_cache_size": statement_cache_size,
+        }
+        self._pool: Optional[asyncpg.Pool] = None
+        self._lock = asyncio.Lock()
+
+    async def pool(self) -> asyncpg.Pool:
+        if self._pool is None:
+            async with self._lock:
+                if self._pool is None:
+                    self._pool = await asyncpg.create_pool(
+                        self._dsn,
+                        init=_init_connection,
+                        **self._pool_kwargs,
+                    )
+                    logger.info(
+                        f"✅ Postgres pool ready (min={self._pool_kwargs['min_size']}, "
+                        f"max={self._pool_kwargs['max_size']})"
+                    )
+        return self._pool
+
+    async def close(self):
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    async def ping(self):
+        pool = await self.pool()
+        await pool.fetchval("SELECT 1")
+
+    async def _fetchrow(self, query: str, *args) -> Optional[Dict[str, Any]]:
+        pool = await self.pool()
+        return _record_to_dict(await pool.fetchrow(query, *args))
+
+    async def _fetch(self, query: str, *args) -> List[Dict[str, Any]]:
+        pool = await self.pool()
+        return [_record_to_dict(r) for r in await pool.fetch(query, *args)]
+
+    async def _execute(self, query: str, *args) -> str:
+        pool = await self.pool()
+        return await pool.execute(query, *args)
+
+    # ==========================================
+    # USERS
+    # ==========================================
+
+    async def get_user(self, key: str, value: str, columns: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        """One user row by "id" or "auth_id"; `columns` comes from the fixed projections in database.py"""
+        if key not in USER_LOOKUP_KEYS:
+            raise ValueError(f"Unsupported user lookup key: {key}")
+        query = f"SELECT {', '.join(columns)} FROM users WHERE {key} = $1"
+        return await self._fetchrow(query, uuid.UUID(value) if key == "id" else value)
+
+    async def update_user_embedding_by_auth_id(self, auth_id: str, embedding: List[float]) -> bool:
+        status = await self._execute(UPDATE_EMBEDDING_BY_AUTH_ID, auth_id, embedding)
+        return status != "UPDATE 0"
+
+    # ==========================================
+    # MATCHING
+    # ==========================================
+
+    async def find_matches(
+        self,
+        user_id: str,
+        limit: int = 10,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        iterative_scan: bool = True,
+        after_distance: Optional[float] = None,
+        after_id: Optional[str] = None,
+        exclude: Optional[List[str]] = None,
+        skip_swiped: bool = True,
+    ) -> List[Dict[str, Any]]:
+        return await self._fetch(
+            FIND_MATCHES,
+            uuid.UUID(user_id),
+            limit,
+            ef_search,
+            probes,
+            iterative_scan,
+            after_distance,
+            uuid.UUID(after_id) if after_id is not None else None,
+            exclude,
+            skip_swiped,
+        )
+
+    async def get_swiped_target_ids(self, user_id: str) -> List[str]:
+        pool = await self.pool()
+        rows = await pool.fetch(GET_SWIPED_TARGET_IDS, uuid.UUID(user_id))
+        return [str(row[0]) for row in rows]
+
+    async def get_swiped_among(self, user_id: str, target_ids: List[str]) -> List[str]:
+        pool = await self.pool()
+        rows = await pool.fetch(GET_SWIPED_AMONG, uuid.UUID(user_id), [uuid.UUID(t) for t in target_ids])
+        return [str(row[0]) for row in rows]
+
+    async def get_user_matches(
+        self,
+        user_id: str,
+        order_by: str,
+        limit: Optional[int],
+        cursor_sort: Optional[str],
+        cursor_id: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        return await self._fetch(
+            GET_USER_MATCHES,
+            uuid.UUID(user_id),
+            order_by,
+            limit,
+            Decimal(cursor_sort) if cursor_sort is not None else None,
+            uuid.UUID(cursor_id) if cursor_id is not None else None,
+        )
+
+    async def get_user_match_stats(self, user_id: str) -> Optional[Dict[str, Any]]:
+        return await self._fetchrow(GET_USER_MATCH_STATS, uuid.UUID(user_id))
+
+    # ==========================================
+    # SWIPES
+    # ==========================================
+
+    async def get_swipe(self, user_id: str, target_user_id: str) -> Optional[str]:
+        pool = await self.pool()
+        return await pool.fetchval(GET_SWIPE, uuid.UUID(user_id), uuid.UUID(target_user_id))
+
+    async def record_swipe(self, user_id: str, target_user_id: str, action: str) -> Optional[Dict[str, Any]]:
+        return await self._fetchrow(RECORD_SWIPE, uuid.UUID(user_id), uuid.UUID(target_user_id), action)
+
+    async def process_swipe(self, user_id: str, target_user_id: str, action: str) -> Optional[Dict[str, Any]]:
+        return await self._fetchrow(PROCESS_SWIPE, uuid.UUID(user_id), uuid.UUID(target_user_id), action)
+
+    async def update_match_score(self, match_id: str, compatibility_score: float) -> bool:
+        status = await self._execute(UPDATE_MATCH_SCORE, uuid.UUID(match_id), Decimal(str(compatibility_score)))
+        return status != "UPDATE 0"
+
+    async def process_swipes_batch(
+        self, user_id: str, target_user_ids: List[str], actions: List[str]
+    ) -> List[Dict[str, Any]]:
+        return await self._fetch(
+            PROCESS_SWIPES_BATCH,
+            uuid.UUID(user_id),
+            [uuid.UUID(t) for t in target_user_ids],
+            actions,
+        )
+
+    async def set_match_scores(self, match_ids: List[str], scores: List[float]):
+        await self._execute(
+            SET_MATCH_SCORES,
+            [uuid.UUID(m) for m in match_ids],
+            [Decimal(str(v)) for v in scores],
+        )
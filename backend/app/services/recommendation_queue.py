@@ -0,0 +1,173 @@
+"""
+Materialized per-user recommendation queues.
+Each active user keeps a ranked deck of scored cards in process memory.
+Reads serve the head of the deck; swipes remove cards; a background task
+recomputes the deck when it runs low. Profile changes drop the deck.
+Decks are per worker, so cards served from a deck are first checked
+against the swipes table for swipes handled by other workers.
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from app.core.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+ComputeFn = Callable[[str, int], Awaitable[List[Dict[str, Any]]]]
+FilterFn = Callable[[str, List[Dict[str, Any]]], Awaitable[List[Dict[str, Any]]]]
+
+
+class _Deck:
+    __slots__ = ("cards", "exhausted", "consumed")
+
+    def __init__(self, cards: List[Dict[str, Any]], exhausted: bool):
+        self.cards = cards
+        # The last compute came back short: no more candidates to refill from
+        self.exhausted = exhausted
+        # Swiped while a refill was running; filtered out of its result
+        self.consumed: set = set()
+
+
+class RecommendationQueue:
+    """
+    `compute(auth_id, n)` produces up to n ranked cards (the full pipeline)
+    and raises on failure: an empty result means the user has run out.
+    `drop_swiped(auth_id, cards)` returns the cards the user hasn't swiped
+    on; queued cards pass through it before they are served, since swipes
+    can go through other workers. Per worker process; decks expire after
+    `ttl` so other users' profile changes are eventually picked up.
+    """
+
+    def __init__(
+        self,
+        compute: ComputeFn,
+        drop_swiped: Optional[FilterFn] = None,
+        size: int = 30,
+        low_water: int = 10,
+        max_users: int = 10000,
+        ttl: Optional[float] = 600.0,
+        max_concurrent_refills: int = 4,
+    ):
+        self._compute = compute
+        self._drop_swiped = drop_swiped
+        self.size = size
+        self.low_water = low_water
+        self._decks: LRUCache[_Deck] = LRUCache(max_users, ttl, name="recommendation_decks")
+        self._refills: Dict[str, asyncio.Task] = {}
+        self._refill_slots = asyncio.Semaphore(max_concurrent_refills)
+
+    async def peek(self, auth_id: str, limit: int) -> List[Dict[str, Any]]:
+        """Top `limit` cards; computes synchronously only on a cold or short deck"""
+        if limit > self.size:
+            return await self._compute(auth_id, limit)
+
+        deck = self._decks.get(auth_id)
+        computed = deck is None or (len(deck.cards) < limit and not deck.exhausted)
+        if deck is None:
+            cards = await self._compute(auth_id, limit)
+            if not cards:
+                return cards  # nothing to queue; don't pin an empty deck
+            deck = _Deck(cards, exhausted=len(cards) < limit)
+            self._decks.set(auth_id, deck)
+        elif computed:
+            # Shielded: a client disconnect must not cancel the shared refill
+            await asyncio.shield(self._refill_task(auth_id))
+            deck = self._decks.get(auth_id)
+            if deck is None:
+                return []
+
+        self._maybe_refill(auth_id, deck)
+        if computed:
+            return deck.cards[:limit]  # just computed, already checked against swipes
+        return await self._unswiped(auth_id, deck.cards[:limit])
+
+    async def ready(self, auth_id: str, limit: int) -> List[Dict[str, Any]]:
+        """Top `limit` cards already in the deck; never computes"""
+        deck = self._decks.get(auth_id)
+        return await self._unswiped(auth_id, deck.cards[:limit]) if deck else []
+
+    def find(self, auth_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        """The queued card for `user_id`, if the deck holds one"""
+        deck = self._decks.get(auth_id)
+        if deck is None:
+            return None
+        return next((c for c in deck.cards if c["user_id"] == user_id), None)
+
+    async def top_up(self, auth_id: str):
+        """Refill the deck if it is cold or at the low-water mark; meant to run after a response"""
+        deck = self._decks.get(auth_id)
+        if deck is None:
+            # Placeholder so the refill has somewhere to land
+            self._decks.set(auth_id, _Deck([], exhausted=False))
+        elif len(deck.cards) > self.low_water or deck.exhausted:
+            return
+        await asyncio.shield(self._refill_task(auth_id))
+
+    def consume(self, auth_id: str, target_user_ids: Iterable[str]):
+        """Drop swiped cards so they never resurface"""
+        deck = self._decks.get(auth_id)
+        if deck is None:
+            return
+        swiped = {str(t).lower() for t in target_user_ids}
+        deck.consumed |= swiped
+        deck.cards = [c for c in deck.cards if c["user_id"] not in swiped]
+        self._maybe_refill(auth_id, deck)
+
+    async def _unswiped(self, auth_id: str, cards: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Queued cards minus those swiped elsewhere; those are dropped from the deck too"""
+        if self._drop_swiped is None or not cards:
+            return cards
+        fresh = await self._drop_swiped(auth_id, cards)
+        if len(fresh) < len(cards):
+            kept = {c["user_id"] for c in fresh}
+            self.consume(auth_id, [c["user_id"] for c in cards if c["user_id"] not in kept])
+        return fresh
+
+    def invalidate(self, auth_id: str):
+        """Profile changed: the next read recomputes from scratch"""
+        self._decks.pop(auth_id)
+
+    async def close(self):
+        tasks = list(self._refills.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._decks.clear()
+
+    def _maybe_refill(self, auth_id: str, deck: _Deck):
+        if len(deck.cards) <= self.low_water and not deck.exhausted:
+            self._refill_task(auth_id)
+
+    def _refill_task(self, auth_id: str) -> asyncio.Task:
+        task = self._refills.get(auth_id)
+        if task is None:
+            task = asyncio.create_task(self._refill(auth_id))
+            self._refills[auth_id] = task
+            task.add_done_callback(lambda _: self._refills.pop(auth_id, None))
+        return task
+
+    async def _refill(self, auth_id: str):
+        async with self._refill_slots:
+            deck = self._decks.get(auth_id)
+            if deck is None:
+                return
+            deck.consumed = set()
+            try:
+                cards = await self._compute(auth_id, self.size)
+            except Exception as e:
+                # Keep whatever the deck still holds; an empty placeholder is
+                # dropped so the next peek computes (and reports the error) itself
+                logger.warning(f"Recommendation refill failed for {auth_id}: {e}")
+                if not deck.cards and self._decks.get(auth_id) is deck:
+                    self._decks.pop(auth_id)
+                return
+
+            # Invalidated (or evicted) while computing: drop the stale result
+            if self._decks.get(auth_id) is not deck:
+                return
+            if not cards:
+                self._decks.pop(auth_id)
+                return
+            deck.cards = [c for c in cards if c["user_id"] not in deck.consumed]
+            deck.exhausted = len(cards) < self.size
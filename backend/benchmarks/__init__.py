@@ -0,0 +1 @@
+"""Standalone performance benchmarks. Run from backend/: python -m benchmarks.<name> --help"""
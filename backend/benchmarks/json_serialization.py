@@ -0,0 +1,111 @@
+"""
+Response serialization benchmark for a 50-card recommendations payload.
+
+Compares FastAPI's default path for a `response_model=dict` endpoint
+(response validation + jsonable_encoder + json.dumps) with FastJSONResponse
+(one orjson pass, NumPy values serialized natively). No database or
+network involved. Run from backend/:
+
+    python -m benchmarks.json_serialization
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.core import responses
+from app.core.responses import FastJSONResponse
+from app.services.questionnaire import get_all_questions
+
+
+def _card(rng: np.random.Generator, numpy_values: bool) -> Dict[str, Any]:
+    num = (lambda x: np.float32(x)) if numpy_values else float
+    questions = get_all_questions()
+    return {
+        "user_id": str(uuid.uuid4()),
+        "profile": {
+            "name": "Jordan Example",
+            "bio": "Theatre kid, robotics team, will talk about space for hours. " * 3,
+            "gender": "female",
+            "grade": "senior",
+            "hobbies": ["robotics", "theatre", "astronomy", "baking", "hiking"],
+            "personality": "Curious and upbeat, loves planning group outings and late-night diner runs. " * 2,
+            "question_answers": {q["id"]: q.get("options", ["yes"])[0] if q.get("options") else 5 for q in questions},
+            "socials": {"instagram": "@jordan", "snapchat": "jordan.ex"},
+            "profile_pic_url": "https://example.supabase.co/storage/v1/object/public/photos/abc.jpg",
+        },
+        "similarity_score": num(rng.random()),
+        "compatibility_percentage": round(float(rng.random() * 100), 1),
+        "compatibility_details": {
+            "score": num(rng.random() * 100),
+            "confidence": num(rng.random()),
+            "category_scores": {f"category_{i}": num(rng.random() * 100) for i in range(8)},
+            "strengths": ["Shared love of music", "Similar social energy", "Both want a fun night"],
+            "explanation": "You two line up on most of what matters for prom night.",
+            "ai_boost": num(1 + rng.random() / 10),
+        },
+    }
+
+
+def _payload(cards: int, numpy_values: bool, seed: int) -> Dict[str, Any]:
+    rng = np.random.default_rng(seed)
+    recs = [_card(rng, numpy_values) for _ in range(cards)]
+    return {"recommendations": recs, "count": len(recs)}
+
+
+def _time(fn: Callable[[], bytes], iterations: int) -> List[float]:
+    fn()  # warm up
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def run(cards: int, iterations: int, seed: int):
+    plain = _payload(cards, numpy_values=False, seed=seed)
+    with_numpy = _payload(cards, numpy_values=True, seed=seed)
+    field = create_model_field(name="Response_get_recommendations", type_=dict, mode="serialization")
+    loop = asyncio.new_event_loop()
+
+    def default_path() -> bytes:
+        content = loop.run_until_complete(serialize_response(field=field, response_content=plain))
+        return JSONResponse(content).body
+
+    def encoder_only() -> bytes:
+        return JSONResponse(jsonable_encoder(plain)).body
+
+    cases = {
+        "default (response_model=dict)": default_path,
+        "default (no response_model)": encoder_only,
+        "FastJSONResponse": lambda: FastJSONResponse(plain).body,
+        "FastJSONResponse, NumPy values": lambda: FastJSONResponse(with_numpy).body,
+    }
+
+    print(f"{cards} cards, {len(FastJSONResponse(plain).body) / 1024:.1f} KiB of JSON, "
+          f"orjson {'enabled' if responses.orjson is not None else 'NOT installed (stdlib fallback)'}\n")
+    for label, fn in cases.items():
+        samples = _time(fn, iterations)
+        print(f"{label:<34} p50={np.percentile(samples, 50):7.3f}ms  p95={np.percentile(samples, 95):7.3f}ms")
+    loop.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cards", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    run(args.cards, args.iterations, args.seed)
+
+
+if __name__ == "__main__":
+    main()
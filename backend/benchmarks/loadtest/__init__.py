@@ -0,0 +1,4 @@
+"""
+End-to-end load test: the whole API under realistic user journeys, on one
+box with no network access. See `python -m benchmarks.loadtest --help`.
+"""
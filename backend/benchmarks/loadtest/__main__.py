@@ -0,0 +1,265 @@
+"""
+End-to-end load test with local stand-ins.
+
+`run` starts the stand-in server (benchmarks/loadtest/stand_ins.py: an
+in-memory Supabase/PostgREST and embedding endpoint), starts the real app
+with `gunicorn app.main:app` pointed at it, drives it with virtual users
+(benchmarks/loadtest/journey.py) and writes a JSON report. It reports
+p50/p95/p99 latency, errors and requests per second per endpoint. It also
+includes the server's own per-stage timings, scraped from /metrics (these
+cover the warm-up too). Nothing leaves the machine. Rate limits are
+switched off for the server under test, since every virtual user shares
+one client address.
+
+`compare` prints two reports side by side with the change in each number.
+Reports record the commit and every parameter. Compare runs made with the
+same parameters on the same machine.
+
+Run from backend/:
+
+    python -m benchmarks.loadtest run --users 20 --duration 60 --out /tmp/base.json
+    python -m benchmarks.loadtest run --users 20 --duration 60 --out /tmp/head.json
+    python -m benchmarks.loadtest compare /tmp/base.json /tmp/head.json
+
+The load generator, the stand-ins and the server share the host. Keep
+--workers at or below half the cores. More than one worker needs a shared
+match broker, e.g. --broker redis://localhost:6379/0.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+import httpx
+from prometheus_client.parser import text_string_to_metric_families
+
+from benchmarks.loadtest.journey import Recorder, VirtualUser
+
+JWT_SECRET = "loadtest-secret"
+METRICS_TOKEN = "loadtest-metrics"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for(url: str, proc: subprocess.Popen, name: str, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"{name} exited with {proc.returncode}")
+        try:
+            if httpx.get(url, timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"{name} was not ready in time")
+
+
+def _stop(proc: subprocess.Popen):
+    if proc.poll() is None:
+        proc.send_signal(signal.SIGTERM)
+        try:
+            proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def _git(*args: str) -> str:
+    try:
+        return subprocess.run(["git", *args], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def _stage_timings(metrics_text: str) -> Dict[str, Dict[str, float]]:
+    """Mean per pipeline stage and dependency call, from the server's /metrics"""
+    sums: Dict[str, Dict[str, float]] = {}
+    for family in text_string_to_metric_families(metrics_text):
+        if family.name not in ("pipeline_stage_duration_seconds", "dependency_call_duration_seconds"):
+            continue
+        for sample in family.samples:
+            if sample.name.endswith(("_sum", "_count")):
+                labels = sample.labels
+                key = labels.get("stage") or f"{labels['dependency']}.{labels['operation']}"
+                sums.setdefault(key, {})[sample.name.rsplit("_", 1)[1]] = sample.value
+    return {
+        key: {"count": int(v["count"]), "mean_ms": round(v["sum"] / v["count"] * 1000, 3)}
+        for key, v in sorted(sums.items())
+        if v.get("count")
+    }
+
+
+async def _drive(base_url: str, args) -> Dict[str, Any]:
+    start = time.monotonic()
+    measure_from = start + args.warmup
+    stop_at = measure_from + args.duration
+    recorder = Recorder(measure_from, stop_at)
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        users = [
+            VirtualUser(client, recorder, JWT_SECRET, seed=args.seed * 100003 + n,
+                        rounds_per_user=args.rounds_per_user, deck_size=args.deck_size,
+                        details_rate=args.details_rate, think=args.think_ms / 1000)
+            for n in range(args.users)
+        ]
+
+        async def staggered(n: int, user: VirtualUser):
+            await asyncio.sleep(args.ramp * n / max(1, args.users))
+            await user.run(stop_at)
+
+        await asyncio.gather(*(staggered(n, user) for n, user in enumerate(users)))
+        metrics = await client.get("/metrics", headers={"Authorization": f"Bearer {METRICS_TOKEN}"})
+    return {"endpoints": recorder.summary(), "stages": _stage_timings(metrics.text)}
+
+
+def run(args):
+    stand_in_port, app_port = _free_port(), _free_port()
+    stand_in_url = f"http://127.0.0.1:{stand_in_port}"
+    env = {
+        **os.environ,
+        "SUPABASE_URL": stand_in_url,
+        "SUPABASE_ANON_KEY": "eyJhbGciOiJIUzI1NiJ9.e30.loadtest",
+        "SUPABASE_SERVICE_KEY": "eyJhbGciOiJIUzI1NiJ9.e30.loadtest",
+        "SUPABASE_JWT_SECRET": JWT_SECRET,
+        "HUGGINGFACE_API_KEY": "loadtest",
+        "EMBEDDINGS_API_URL": f"{stand_in_url}/embed",
+        "DATABASE_BACKEND": "supabase",
+        "RATE_LIMIT_ENABLED": "false",
+        "RATE_LIMIT_STORAGE_URI": "memory://",
+        "NOTIFICATIONS_BROKER_URI": args.broker,
+        "METRICS_TOKEN": METRICS_TOKEN,
+        "DEBUG": "false",
+        "WEB_CONCURRENCY": str(args.workers),
+        "PORT": str(app_port),
+    }
+    stand_ins = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.loadtest.stand_ins", "--port", str(stand_in_port),
+         "--seed-users", str(args.seed_users), "--seed", str(args.seed),
+         "--db-latency-ms", str(args.db_latency_ms), "--embedding-latency-ms", str(args.embedding_latency_ms)],
+        env=env,
+    )
+    server = None
+    with tempfile.TemporaryDirectory() as metrics_dir:
+        try:
+            _wait_for(f"{stand_in_url}/healthz", stand_ins, "stand-ins")
+            server = subprocess.Popen(
+                [sys.executable, "-m", "gunicorn", "app.main:app", "--bind", f"127.0.0.1:{app_port}"],
+                env={**env, "PROMETHEUS_MULTIPROC_DIR": metrics_dir},
+                stdout=subprocess.DEVNULL, stderr=None if args.server_logs else subprocess.DEVNULL,
+            )
+            _wait_for(f"http://127.0.0.1:{app_port}/health/ready", server, "gunicorn")
+            results = asyncio.run(_drive(f"http://127.0.0.1:{app_port}", args))
+        finally:
+            if server is not None:
+                _stop(server)
+            _stop(stand_ins)
+
+    report = {
+        "meta": {
+            "commit": _git("rev-parse", "--short", "HEAD"),
+            "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "cpus": os.cpu_count(),
+            "params": {k: v for k, v in sorted(vars(args).items()) if k not in ("command", "func", "out", "server_logs")},
+        },
+        **results,
+    }
+    print_report(report)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nreport written to {args.out}")
+
+
+def print_report(report: Dict[str, Any]):
+    meta = report["meta"]
+    print(f"commit {meta['commit']}{' (dirty)' if meta['dirty'] else ''}, {meta['params']}\n")
+    print(f"{'endpoint':<34} {'count':>7} {'err':>5} {'rps':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for label, row in report["endpoints"].items():
+        print(f"{label:<34} {row['count']:>7} {row['errors']:>5} {row['rps']:>8.1f} "
+              f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f}")
+    total = sum(row["rps"] for row in report["endpoints"].values())
+    print(f"{'total':<34} {'':>7} {'':>5} {total:>8.1f}")
+    if report.get("stages"):
+        print(f"\n{'server stage':<44} {'count':>8} {'mean ms':>9}")
+        for key, row in report["stages"].items():
+            print(f"{key:<44} {row['count']:>8} {row['mean_ms']:>9.3f}")
+
+
+def _delta(old: float, new: float) -> str:
+    if not old:
+        return "    n/a"
+    return f"{(new - old) / old * 100:+6.1f}%"
+
+
+def compare(args):
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.head) as f:
+        head = json.load(f)
+    print(f"base {base['meta']['commit']} vs head {head['meta']['commit']}")
+    if base["meta"]["params"] != head["meta"]["params"]:
+        changed = sorted(k for k in set(base["meta"]["params"]) | set(head["meta"]["params"])
+                         if base["meta"]["params"].get(k) != head["meta"]["params"].get(k))
+        print(f"warning: runs used different parameters ({', '.join(changed)}); numbers are not comparable")
+    print()
+    columns = [("rps", "rps"), ("p50_ms", "p50"), ("p95_ms", "p95"), ("p99_ms", "p99")]
+    print(f"{'endpoint':<34}" + "".join(f" {name + ' base':>10} {name + ' head':>10} {'change':>8}" for _, name in columns))
+    labels: List[str] = sorted(set(base["endpoints"]) | set(head["endpoints"]))
+    for label in labels:
+        old, new = base["endpoints"].get(label, {}), head["endpoints"].get(label, {})
+        line = f"{label:<34}"
+        for key, _ in columns:
+            a, b = old.get(key, 0.0), new.get(key, 0.0)
+            line += f" {a:>10.1f} {b:>10.1f} {_delta(a, b):>8}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run a load test and write a report")
+    run_parser.add_argument("--users", type=int, default=20, help="concurrent virtual users")
+    run_parser.add_argument("--duration", type=float, default=60.0, help="measured seconds")
+    run_parser.add_argument("--warmup", type=float, default=10.0, help="seconds of load before measuring")
+    run_parser.add_argument("--ramp", type=float, default=5.0, help="seconds over which users start")
+    run_parser.add_argument("--workers", type=int, default=1, help="gunicorn workers")
+    run_parser.add_argument("--broker", default="memory://",
+                            help="NOTIFICATIONS_BROKER_URI; a redis:// one is needed with --workers > 1")
+    run_parser.add_argument("--think-ms", type=float, default=0.0, help="mean pause between a user's requests")
+    run_parser.add_argument("--rounds-per-user", type=int, default=5, help="decks before signing up again")
+    run_parser.add_argument("--deck-size", type=int, default=10)
+    run_parser.add_argument("--details-rate", type=float, default=0.2, help="share of cards opened in full")
+    run_parser.add_argument("--seed-users", type=int, default=2000, help="candidates in the stand-in database")
+    run_parser.add_argument("--seed", type=int, default=7)
+    run_parser.add_argument("--db-latency-ms", type=float, default=2.0)
+    run_parser.add_argument("--embedding-latency-ms", type=float, default=20.0)
+    run_parser.add_argument("--out", help="write the JSON report here")
+    run_parser.add_argument("--server-logs", action="store_true", help="show gunicorn's stderr")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser("compare", help="compare two reports")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("head")
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
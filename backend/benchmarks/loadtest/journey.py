@@ -0,0 +1,141 @@
+"""
+Virtual users and per-endpoint latency bookkeeping.
+
+Each virtual user signs up (POST /users/profile), loads and submits the
+questionnaire, then runs rounds of: fetch a compact deck, open some
+cards' details, swipe through the deck, poll matches and stats. After
+--rounds-per-user rounds it starts over as a new user, so sign-ups keep
+happening throughout the run. All choices come from a per-user seeded
+RNG, so two runs with the same parameters send the same traffic.
+"""
+import asyncio
+import math
+import random
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+import httpx
+from jose import jwt
+
+from benchmarks.loadtest.stand_ins import GENDERS, HOBBIES, PERSONALITY, random_answers
+
+# Swipe mix: mostly passes, like a real deck
+SWIPE_ACTIONS = ["no"] * 11 + ["yes"] * 8 + ["super"]
+
+
+class Recorder:
+    """Latencies per endpoint label, for requests started inside the measured window"""
+
+    def __init__(self, measure_from: float, measure_until: float):
+        self.measure_from = measure_from
+        self.measure_until = measure_until
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+
+    def record(self, label: str, started: float, seconds: float, ok: bool):
+        if not self.measure_from <= started < self.measure_until:
+            return
+        self.latencies.setdefault(label, []).append(seconds)
+        if not ok:
+            self.errors[label] = self.errors.get(label, 0) + 1
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        window = self.measure_until - self.measure_from
+        endpoints = {}
+        for label, samples in sorted(self.latencies.items()):
+            samples = sorted(samples)
+            endpoints[label] = {
+                "count": len(samples),
+                "errors": self.errors.get(label, 0),
+                "rps": round(len(samples) / window, 2),
+                "mean_ms": round(sum(samples) / len(samples) * 1000, 2),
+                "p50_ms": round(percentile(samples, 50) * 1000, 2),
+                "p95_ms": round(percentile(samples, 95) * 1000, 2),
+                "p99_ms": round(percentile(samples, 99) * 1000, 2),
+                "max_ms": round(samples[-1] * 1000, 2),
+            }
+        return endpoints
+
+
+def percentile(sorted_samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    rank = max(1, math.ceil(pct / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+class VirtualUser:
+    def __init__(self, client: httpx.AsyncClient, recorder: Recorder, secret: str, seed: int,
+                 rounds_per_user: int, deck_size: int, details_rate: float, think: float):
+        self.client = client
+        self.recorder = recorder
+        self.secret = secret
+        self.rng = random.Random(seed)
+        self.rounds_per_user = rounds_per_user
+        self.deck_size = deck_size
+        self.details_rate = details_rate
+        self.think = think
+        self.headers: Dict[str, str] = {}
+
+    async def request(self, label: str, method: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        started = time.monotonic()
+        try:
+            response = await self.client.request(method, url, headers=self.headers, **kwargs)
+            ok = response.status_code < 400
+        except httpx.HTTPError:
+            response, ok = None, False
+        self.recorder.record(label, started, time.monotonic() - started, ok)
+        if self.think:
+            await asyncio.sleep(self.rng.expovariate(1 / self.think))
+        return response if ok else None
+
+    def sign_in(self):
+        auth_id = str(uuid.UUID(int=self.rng.getrandbits(128)))
+        claims = {"sub": auth_id, "email": f"{auth_id}@loadtest.local", "role": "authenticated",
+                  "exp": int(time.time()) + 24 * 3600}
+        self.headers = {"Authorization": f"Bearer {jwt.encode(claims, self.secret, algorithm='HS256')}",
+                        "Accept-Encoding": "gzip, br"}
+        return auth_id
+
+    def profile(self, auth_id: str) -> Dict[str, Any]:
+        personality = " ".join(self.rng.sample(PERSONALITY, 3))
+        return {
+            "user_id": auth_id,
+            "name": f"Load {auth_id[:8]}",
+            "bio": personality,
+            "gender": self.rng.choice(GENDERS),
+            "grade": self.rng.choice(["junior", "senior"]),
+            "hobbies": self.rng.sample(HOBBIES, 4),
+            "socials": {"instagram": f"@load{auth_id[:8]}"},
+            "personality": personality,
+        }
+
+    async def run(self, stop_at: float):
+        while time.monotonic() < stop_at:
+            auth_id = self.sign_in()
+            if await self.request("POST /users/profile", "POST", "/users/profile", json=self.profile(auth_id)) is None:
+                await asyncio.sleep(0.1)  # don't spin while the server is failing
+                continue
+            await self.request("GET /questionnaire/questions", "GET", "/questionnaire/questions")
+            await self.request("POST /questionnaire/submit", "POST", "/questionnaire/submit",
+                               json=random_answers(self.rng))
+
+            for _ in range(self.rounds_per_user):
+                if time.monotonic() >= stop_at:
+                    return
+                response = await self.request("GET /recommendations", "GET", "/recommendations",
+                                              params={"limit": self.deck_size, "view": "compact"})
+                cards = response.json()["recommendations"] if response is not None else []
+                for card in cards:
+                    if time.monotonic() >= stop_at:
+                        return
+                    if self.rng.random() < self.details_rate:
+                        await self.request("GET /recommendations/{user_id}", "GET",
+                                           f"/recommendations/{card['user_id']}")
+                    await self.request("POST /swipe", "POST", "/swipe", json={
+                        "target_user_id": card["user_id"], "action": self.rng.choice(SWIPE_ACTIONS),
+                    })
+                await self.request("GET /matches", "GET", "/matches", params={"limit": 20})
+                await self.request("GET /stats", "GET", "/stats")
+                if not cards:
+                    break  # deck exhausted: sign up as someone new
@@ -0,0 +1,416 @@
+"""
+Local stand-ins for the API's remote dependencies, in one aiohttp server:
+
+    /rest/v1/...   an in-memory PostgREST (Supabase database): the table
+                   queries DatabaseService issues and the RPCs from database/*.sql
+    /embed         the Hugging Face feature-extraction endpoint: a
+                   deterministic unit vector per input text
+
+Every request waits --db-latency-ms or --embedding-latency-ms first, to
+stand in for the network hop to the real service. A seeded population of
+candidates is created at startup; a seeded user "already liked" a caller
+with probability --like-back, so yes-swipes turn into matches.
+
+Started by the load-test harness; to run it on its own from backend/:
+
+    python -m benchmarks.loadtest.stand_ins --port 9100 --seed-users 2000
+"""
+import argparse
+import asyncio
+import datetime
+import random
+import uuid
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from aiohttp import web
+
+from app.core.responses import dumps
+from app.services.questionnaire import get_all_questions
+
+EMBEDDING_DIM = 384
+GENDERS = ["female", "male", "non-binary"]
+HOBBIES = ["robotics", "theatre", "astronomy", "baking", "hiking", "soccer", "photography", "gaming", "choir", "debate"]
+PERSONALITY = [
+    "I love late-night conversations about space and the future.", "Always the first one on the dance floor.",
+    "Quiet at first, loud once I know you.", "I plan everything, down to the playlist.",
+    "Happiest outdoors, hiking or at the beach.", "Bookworm with a soft spot for bad movies.",
+]
+
+USER_DEFAULTS = {
+    "bio": None, "school": None, "looking_for": ["male", "female", "non-binary", "other"], "hobbies": [],
+    "personality": None, "question_answers": {}, "socials": {}, "profile_pic_url": None,
+}
+# Unique keys an upsert merges on, per table
+CONFLICT_KEYS = {"swipes": ("user_id", "target_user_id"), "matches": ("user1_id", "user2_id")}
+
+
+def embed(text: str) -> List[float]:
+    rng = np.random.default_rng(zlib.crc32(text.encode()))
+    vector = rng.standard_normal(EMBEDDING_DIM)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+def random_answers(rng: random.Random) -> Dict[str, Any]:
+    answers = {}
+    for question in get_all_questions():
+        if question.get("options"):
+            answers[question["id"]] = rng.choice(question["options"])["value"]
+        else:
+            answers[question["id"]] = rng.randint(question["min"], question["max"])
+    return answers
+
+
+def _now() -> str:
+    return datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+
+class Store:
+    """
+    Tables as lists of dicts, with dict indexes on the lookups the hot RPCs
+    make; embeddings kept apart as a matrix for find_matches
+    """
+
+    def __init__(self, like_back: float):
+        self.tables: Dict[str, List[Dict[str, Any]]] = {"users": [], "swipes": [], "matches": [], "user_photos": []}
+        self.embeddings: Dict[str, np.ndarray] = {}
+        self._users: Dict[str, Dict[str, Any]] = {}
+        self._swipes: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._swiped_by: Dict[str, set] = {}
+        self.seeded: set = set()
+        self.like_back = like_back
+        self._index: Optional[Tuple[List[str], np.ndarray]] = None
+
+    # ─── Rows ────────────────────────────────────────────────────────────────
+
+    def user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        return self._users.get(user_id)
+
+    def insert(self, table: str, row: Dict[str, Any], upsert: bool = False) -> Dict[str, Any]:
+        row = dict(row)
+        keys = CONFLICT_KEYS.get(table)
+        if upsert and keys:
+            existing = self._swipes.get((row["user_id"], row["target_user_id"])) if table == "swipes" else next(
+                (r for r in self.tables[table] if all(str(r[k]) == str(row[k]) for k in keys)), None
+            )
+            if existing is not None:
+                existing.update(row)
+                return existing
+        row.setdefault("id", str(uuid.uuid4()))
+        row.setdefault("created_at", _now())
+        if table == "users":
+            row = {**USER_DEFAULTS, **row}
+            if "embedding" in row:
+                self._set_embedding(row["id"], row.pop("embedding"))
+            self._users[row["id"]] = row
+        elif table == "swipes":
+            self._swipes[(row["user_id"], row["target_user_id"])] = row
+            self._swiped_by.setdefault(row["user_id"], set()).add(row["target_user_id"])
+        self.tables[table].append(row)
+        return row
+
+    def update(self, table: str, rows: List[Dict[str, Any]], values: Dict[str, Any]):
+        values = dict(values)
+        embedding = values.pop("embedding", None)
+        for row in rows:
+            row.update(values)
+            if embedding is not None and table == "users":
+                self._set_embedding(row["id"], embedding)
+
+    def delete(self, table: str, rows: List[Dict[str, Any]]):
+        ids = {row["id"] for row in rows}
+        self.tables[table] = [row for row in self.tables[table] if row["id"] not in ids]
+        if table == "users":  # ON DELETE CASCADE
+            for user_id in ids:
+                self.embeddings.pop(user_id, None)
+                self._users.pop(user_id, None)
+            self._index = None
+            self.delete("swipes", [s for s in self.tables["swipes"] if s["user_id"] in ids or s["target_user_id"] in ids])
+            self.tables["matches"] = [
+                m for m in self.tables["matches"] if m["user1_id"] not in ids and m["user2_id"] not in ids
+            ]
+        elif table == "swipes":
+            for row in rows:
+                self._swipes.pop((row["user_id"], row["target_user_id"]), None)
+                self._swiped_by.get(row["user_id"], set()).discard(row["target_user_id"])
+
+    def _set_embedding(self, user_id: str, embedding):
+        if embedding is None:
+            self.embeddings.pop(user_id, None)
+        else:
+            self.embeddings[user_id] = np.asarray(embedding, dtype=np.float32)
+        self._index = None
+
+    def swipe(self, user_id: str, target_id: str) -> Optional[str]:
+        row = self._swipes.get((user_id, target_id))
+        return row["action"] if row else None
+
+    # ─── RPCs ────────────────────────────────────────────────────────────────
+
+    def find_matches(self, p_user_id, p_limit=10, p_after_distance=None, p_after_id=None,
+                     p_exclude=None, p_skip_swiped=True, **_) -> List[Dict[str, Any]]:
+        me = self.user(p_user_id)
+        if me is None or p_user_id not in self.embeddings:
+            return []
+        if self._index is None:
+            ids = list(self.embeddings)
+            self._index = (ids, np.stack([self.embeddings[i] for i in ids]))
+        ids, matrix = self._index
+        distances = 1.0 - matrix @ self.embeddings[p_user_id]
+
+        excluded = set(p_exclude or ())
+        if p_skip_swiped:
+            excluded |= self._swiped_by.get(p_user_id, set())
+        rows = []
+        for i in np.argsort(distances, kind="stable"):
+            user_id, distance = ids[i], float(distances[i])
+            if user_id == p_user_id or user_id in excluded:
+                continue
+            if p_after_distance is not None and (distance, user_id) <= (p_after_distance, p_after_id):
+                continue
+            user = self._users[user_id]
+            if user["gender"] not in (me["looking_for"] or []) or me["gender"] not in (user["looking_for"] or []):
+                continue
+            rows.append({
+                "user_id": user_id,
+                **{c: user[c] for c in ("name", "bio", "gender", "grade", "hobbies", "personality",
+                                        "question_answers", "socials", "profile_pic_url")},
+                "similarity": 1.0 - distance,
+                "compatibility_percentage": max(0, min(100, int((2.0 - distance) * 50))),
+                "distance": distance,
+            })
+            if len(rows) >= p_limit:
+                break
+        return rows
+
+    def _record_swipe(self, user_id: str, target_id: str, action: str):
+        self.insert("swipes", {"user_id": user_id, "target_user_id": target_id, "action": action}, upsert=True)
+        # A seeded candidate may have liked this user before they signed up
+        if (
+            action in ("yes", "super")
+            and target_id in self.seeded
+            and self.swipe(target_id, user_id) is None
+            and random.Random(f"{target_id}:{user_id}").random() < self.like_back
+        ):
+            self.insert("swipes", {"user_id": target_id, "target_user_id": user_id, "action": "yes"})
+
+    def _match_if_mutual(self, user_id: str, target_id: str, action: str) -> Optional[Dict[str, Any]]:
+        theirs = self.swipe(target_id, user_id)
+        if action not in ("yes", "super") or theirs not in ("yes", "super"):
+            return None
+        user1, user2 = sorted([user_id, target_id])
+        is_super = action == "super" or theirs == "super"
+        existing = next((m for m in self.tables["matches"] if (m["user1_id"], m["user2_id"]) == (user1, user2)), None)
+        if existing is not None:
+            # Like the RPCs: upgrade to super, but only a new match counts as created
+            existing["is_super_match"] = existing["is_super_match"] or is_super
+            return None
+        return self.insert("matches", {
+            "user1_id": user1, "user2_id": user2, "is_super_match": is_super, "compatibility_score": None,
+        })
+
+    def process_swipe(self, p_user_id, p_target_user_id, p_action, **_) -> List[Dict[str, Any]]:
+        self._record_swipe(p_user_id, p_target_user_id, p_action)
+        match = self._match_if_mutual(p_user_id, p_target_user_id, p_action)
+        target = self.user(p_target_user_id)
+        if match is None or target is None:
+            return [{"match_created": False, "match_id": None, "is_super_match": False,
+                     "target_question_answers": None, "target_personality": None}]
+        return [{"match_created": True, "match_id": match["id"], "is_super_match": match["is_super_match"],
+                 "target_question_answers": target["question_answers"], "target_personality": target["personality"]}]
+
+    def process_swipes_batch(self, p_user_id, p_target_user_ids, p_actions, **_) -> List[Dict[str, Any]]:
+        last = {t: a for t, a in zip(p_target_user_ids, p_actions) if t != p_user_id and self.user(t)}
+        for target_id, action in last.items():
+            self._record_swipe(p_user_id, target_id, action)
+        rows = []
+        for target_id, action in last.items():
+            match = self._match_if_mutual(p_user_id, target_id, action)
+            target = self.user(target_id) if match else None
+            rows.append({
+                "target_user_id": target_id, "action": action,
+                "match_created": match is not None, "match_id": match["id"] if match else None,
+                "is_super_match": bool(match and match["is_super_match"]),
+                "target_question_answers": target["question_answers"] if target else None,
+                "target_personality": target["personality"] if target else None,
+            })
+        return rows
+
+    def set_match_scores(self, p_match_ids, p_scores, **_):
+        scores = dict(zip(p_match_ids, p_scores))
+        for match in self.tables["matches"]:
+            if match["id"] in scores:
+                match["compatibility_score"] = scores[match["id"]]
+        return None
+
+    def get_user_matches(self, p_user_id, p_order="created_at", p_limit=None,
+                         p_cursor_sort=None, p_cursor_id=None, **_) -> List[Dict[str, Any]]:
+        rows = []
+        for m in self.tables["matches"]:
+            if p_user_id not in (m["user1_id"], m["user2_id"]):
+                continue
+            other = self.user(m["user2_id"] if m["user1_id"] == p_user_id else m["user1_id"])
+            if other is None:
+                continue
+            if p_order == "compatibility_score":
+                sort_value = m["compatibility_score"] if m["compatibility_score"] is not None else -1
+            else:
+                sort_value = datetime.datetime.fromisoformat(m["created_at"]).timestamp()
+            rows.append((float(sort_value), m["id"], {
+                "match_id": m["id"], "is_super_match": bool(m["is_super_match"]),
+                "compatibility_score": m["compatibility_score"], "created_at": m["created_at"],
+                "sort_key": str(sort_value), "other_user_id": other["id"],
+                **{c: other[c] for c in ("name", "bio", "gender", "grade", "school", "hobbies", "socials",
+                                         "profile_pic_url")},
+            }))
+        if p_cursor_sort is not None:
+            rows = [r for r in rows if (r[0], r[1]) < (float(p_cursor_sort), p_cursor_id)]
+        rows.sort(key=lambda r: (r[0], r[1]), reverse=True)
+        return [r[2] for r in rows[:p_limit]]
+
+    def get_user_match_stats(self, p_user_id, **_) -> List[Dict[str, int]]:
+        mine = [m for m in self.tables["matches"] if p_user_id in (m["user1_id"], m["user2_id"])]
+        return [{"total_matches": len(mine), "super_matches": sum(1 for m in mine if m["is_super_match"])}]
+
+    def seed(self, count: int, seed: int):
+        rng = random.Random(seed)
+        for n in range(count):
+            personality = " ".join(rng.sample(PERSONALITY, 3))
+            row = self.insert("users", {
+                "id": str(uuid.UUID(int=rng.getrandbits(128))),
+                "auth_id": f"seed-{n}",
+                "email": f"seed-{n}@loadtest.local",
+                "name": f"Seed {n}",
+                "bio": personality,
+                "gender": rng.choice(GENDERS),
+                "grade": rng.choice(["junior", "senior"]),
+                "hobbies": rng.sample(HOBBIES, 4),
+                "personality": personality,
+                "question_answers": random_answers(rng),
+                "socials": {"instagram": f"@seed{n}"},
+                "profile_pic_url": f"https://example.invalid/photos/{n}.jpg",
+            })
+            self._set_embedding(row["id"], embed(f"{row['name']} {personality}"))
+            self.seeded.add(row["id"])
+
+
+RPCS = ("find_matches", "process_swipe", "process_swipes_batch", "set_match_scores",
+        "get_user_matches", "get_user_match_stats")
+
+
+def _filters(request: web.Request) -> List[Tuple[str, set]]:
+    """(column, accepted values) per eq.x / in.(x,y) filter"""
+    reserved = {"select", "limit", "offset", "order", "on_conflict", "columns"}
+    filters = []
+    for column, value in request.query.items():
+        if column in reserved:
+            continue
+        op, _, operand = value.partition(".")
+        if op == "eq":
+            filters.append((column, {operand}))
+        elif op == "in":
+            filters.append((column, set(operand.strip("()").split(","))))
+        else:
+            raise web.HTTPBadRequest(text=f"unsupported filter {column}={value}")
+    return filters
+
+
+def _project(row: Dict[str, Any], select: str) -> Dict[str, Any]:
+    if select in ("", "*"):
+        return dict(row)
+    return {c: row.get(c) for c in select.split(",")}
+
+
+def _respond(rows: List[Dict[str, Any]], request: web.Request, total: Optional[int] = None) -> web.Response:
+    prefer = request.headers.get("Prefer", "")
+    headers = {}
+    if "count=" in prefer:
+        headers["Content-Range"] = f"*/{len(rows) if total is None else total}"
+    if "return=minimal" in prefer:
+        return web.Response(status=204 if request.method != "POST" else 201, headers=headers)
+    select = request.query.get("select", "*")
+    body = dumps([_project(row, select) for row in rows])
+    return web.Response(body=body, content_type="application/json", headers=headers)
+
+
+def build_app(store: Store, db_latency: float, embedding_latency: float) -> web.Application:
+    async def table(request: web.Request) -> web.Response:
+        await asyncio.sleep(db_latency)
+        name = request.match_info["table"]
+        if name not in store.tables:
+            raise web.HTTPNotFound(text=f"unknown table {name}")
+        if request.method == "POST":
+            payload = await request.json()
+            upsert = "merge-duplicates" in request.headers.get("Prefer", "")
+            rows = [store.insert(name, row, upsert) for row in (payload if isinstance(payload, list) else [payload])]
+            return _respond(rows, request)
+
+        filters = _filters(request)
+        rows = [r for r in store.tables[name] if all(str(r.get(c)) in v for c, v in filters)]
+        if request.method == "PATCH":
+            store.update(name, rows, await request.json())
+        elif request.method == "DELETE":
+            store.delete(name, rows)
+        else:
+            if "order" in request.query:
+                column, _, direction = request.query["order"].partition(".")
+                rows.sort(key=lambda r: str(r.get(column)), reverse=direction.startswith("desc"))
+            start = int(request.query.get("offset", 0))
+            end = None
+            if "Range" in request.headers:
+                first, _, last = request.headers["Range"].partition("-")
+                start, end = int(first), int(last) + 1
+            if "limit" in request.query:
+                end = start + int(request.query["limit"]) if end is None else min(end, start + int(request.query["limit"]))
+            rows = rows[start:end]
+        return _respond(rows, request)
+
+    async def rpc(request: web.Request) -> web.Response:
+        await asyncio.sleep(db_latency)
+        name = request.match_info["function"]
+        if name not in RPCS:
+            raise web.HTTPNotFound(text=f"unknown function {name}")
+        result = getattr(store, name)(**(await request.json()))
+        return web.Response(body=dumps(result), content_type="application/json")
+
+    async def embedding(request: web.Request) -> web.Response:
+        await asyncio.sleep(embedding_latency)
+        payload = await request.json()
+        return web.Response(body=dumps(embed(payload["inputs"])), content_type="application/json")
+
+    async def probe(request: web.Request) -> web.Response:
+        # EmbeddingsService.ping: the real endpoint answers GET without running the model
+        return web.Response(status=405)
+
+    async def healthz(request: web.Request) -> web.Response:
+        return web.json_response({"users": len(store.tables["users"])})
+
+    app = web.Application(client_max_size=8 * 1024 * 1024)
+    app.router.add_route("*", "/rest/v1/rpc/{function}", rpc)
+    app.router.add_route("*", "/rest/v1/{table}", table)
+    app.router.add_post("/embed", embedding)
+    app.router.add_get("/embed", probe)
+    app.router.add_get("/healthz", healthz)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--seed-users", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--like-back", type=float, default=0.3)
+    parser.add_argument("--db-latency-ms", type=float, default=2.0)
+    parser.add_argument("--embedding-latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    store = Store(like_back=args.like_back)
+    store.seed(args.seed_users, args.seed)
+    app = build_app(store, args.db_latency_ms / 1000, args.embedding_latency_ms / 1000)
+    web.run_app(app, host=args.host, port=args.port, print=None, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Cost of the metrics layer (app.core.metrics) per observation.
+
+Times each primitive the request path uses against the same work without
+it: a stage timer, a dependency-call wrapper, a named vs unnamed LRUCache
+lookup, and one request-duration observation. Each mode runs in its own
+process, because prometheus_client picks in-memory or memory-mapped values
+at import:
+
+    single   one worker, values in process memory (uvicorn, WEB_CONCURRENCY=1)
+    multi    PROMETHEUS_MULTIPROC_DIR set, values in mmap files (gunicorn)
+
+No database or network involved. Run from backend/:
+
+    python -m benchmarks.metrics_overhead --iterations 200000
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def _per_op_ns(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e9
+
+
+def measure(iterations: int):
+    from app.core.cache import LRUCache
+    from app.core.metrics import instrumented, observe_request, stage_timer
+
+    def bare_stage():
+        pass
+
+    def timed_stage():
+        with stage_timer("bench"):
+            pass
+
+    plain, named = LRUCache(1024), LRUCache(1024, name="bench")
+    for cache in (plain, named):
+        cache.set("k", 1)
+
+    async def call():
+        return 1
+
+    wrapped = instrumented("bench")(call)
+
+    async def run_calls(fn, n):
+        start = time.perf_counter()
+        for _ in range(n):
+            await fn()
+        return (time.perf_counter() - start) / n * 1e9
+
+    rows = [
+        ("stage timer", _per_op_ns(timed_stage, iterations) - _per_op_ns(bare_stage, iterations)),
+        ("dependency wrapper", asyncio.run(run_calls(wrapped, iterations)) - asyncio.run(run_calls(call, iterations))),
+        ("cache hit counter", _per_op_ns(lambda: named.get("k"), iterations) - _per_op_ns(lambda: plain.get("k"), iterations)),
+        ("request observation", _per_op_ns(lambda: observe_request("GET", "/bench", 200, 0.01), iterations)),
+    ]
+    for name, ns in rows:
+        print(f"{name:<22} {max(ns, 0.0):8.0f} ns")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200000)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        measure(args.iterations)
+        return
+
+    for mode in ("single", "multi"):
+        env = dict(os.environ)
+        env.pop("PROMETHEUS_MULTIPROC_DIR", None)
+        with tempfile.TemporaryDirectory() as metrics_dir:
+            if mode == "multi":
+                env["PROMETHEUS_MULTIPROC_DIR"] = metrics_dir
+            print(f"[{mode}] added cost per operation, {args.iterations} iterations")
+            subprocess.run(
+                [sys.executable, "-m", "benchmarks.metrics_overhead", "--child", "--iterations", str(args.iterations)],
+                env=env, check=True,
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Middleware throughput: BaseHTTPMiddleware vs pure ASGI.
+
+Serves a trivial endpoint through the security-headers and request-logging
+middlewares, once implemented on Starlette's BaseHTTPMiddleware (the previous
+versions, reproduced below) and once with the pure ASGI versions in
+app.main, and reports requests per second. Requests go straight into the
+ASGI app through httpx's ASGITransport, so the numbers isolate the
+middleware stack from socket and HTTP parsing costs. Log output is discarded
+(formatting still happens). Run from backend/ with the usual .env present:
+
+    python -m benchmarks.middleware_rps
+"""
+import argparse
+import asyncio
+import logging
+import time
+
+import httpx
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.main import SECURITY_HEADERS, RequestLoggingMiddleware, SecurityHeadersMiddleware
+
+logger = logging.getLogger("app.main")
+
+
+class LegacySecurityHeadersMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        for name, value in SECURITY_HEADERS.items():
+            response.headers[name] = value
+        return response
+
+
+class LegacyRequestLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        start = time.time()
+        response = await call_next(request)
+        duration_ms = round((time.time() - start) * 1000)
+        ip = request.headers.get("x-forwarded-for", request.client.host if request.client else "unknown")
+        logger.info(
+            f"{request.method} {request.url.path} "
+            f"status={response.status_code} ip={ip} duration={duration_ms}ms"
+        )
+        return response
+
+
+def _app(security, logging_mw) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    app.add_middleware(security)
+    app.add_middleware(logging_mw)
+    return app
+
+
+async def _rps(app: FastAPI, requests: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.get("/ping")
+        response.raise_for_status()
+
+        remaining = requests
+
+        async def worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                await client.get("/ping")
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return requests / (time.perf_counter() - start)
+
+
+async def run(requests: int, concurrency: int, rounds: int):
+    logging.getLogger().handlers = [logging.NullHandler()]
+    apps = {
+        "BaseHTTPMiddleware": _app(LegacySecurityHeadersMiddleware, LegacyRequestLoggingMiddleware),
+        "pure ASGI": _app(SecurityHeadersMiddleware, RequestLoggingMiddleware),
+        "no middleware": _app(lambda app: app, lambda app: app),
+    }
+    results = {label: [] for label in apps}
+    for _ in range(rounds):  # interleave rounds so drift hits every variant
+        for label, app in apps.items():
+            results[label].append(await _rps(app, requests, concurrency))
+
+    print(f"{requests} requests x {rounds} rounds, concurrency {concurrency}\n")
+    for label, samples in results.items():
+        print(f"{label:<20} {max(samples):8.0f} req/s (best)  {sorted(samples)[len(samples) // 2]:8.0f} req/s (median)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests, args.concurrency, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
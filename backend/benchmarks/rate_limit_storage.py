@@ -0,0 +1,94 @@
+"""
+Rate limit storage benchmark: per-check latency and cross-worker correctness.
+
+Times FixedWindowRateLimiter.hit() (what slowapi runs per request and
+limit) against memory://, shm:// and, if --redis is given, a Redis server.
+Then starts --workers processes that all hammer one key of a shared
+storage and checks that exactly the configured number of hits got through.
+Run from backend/:
+
+    python -m benchmarks.rate_limit_storage
+    python -m benchmarks.rate_limit_storage --redis redis://localhost:6379/15
+"""
+import argparse
+import multiprocessing as mp
+import os
+import tempfile
+import time
+import uuid
+from typing import List, Optional
+
+import numpy as np
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter
+
+import app.core.rate_limit_storage  # noqa: F401 - registers shm://
+
+
+def _latency(uri: str, iterations: int) -> List[float]:
+    limiter = FixedWindowRateLimiter(storage_from_string(uri))
+    item = parse("1000000/minute")
+    keys = [f"10.0.{i // 256}.{i % 256}" for i in range(1024)]  # many clients
+    samples = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        limiter.hit(item, keys[i % len(keys)], "/swipe")
+        samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def _hammer(uri: str, key: str, limit: str, attempts: int, results):
+    limiter = FixedWindowRateLimiter(storage_from_string(uri))
+    item = parse(limit)
+    results.put(sum(limiter.hit(item, key) for _ in range(attempts)))
+
+
+def _shared_check(uri: str, workers: int, limit: int, attempts: int) -> int:
+    ctx = mp.get_context("spawn")
+    results = ctx.Queue()
+    key = uuid.uuid4().hex
+    procs = [ctx.Process(target=_hammer, args=(uri, key, f"{limit}/hour", attempts, results)) for _ in range(workers)]
+    for p in procs:
+        p.start()
+    allowed = sum(results.get() for _ in procs)
+    for p in procs:
+        p.join()
+    return allowed
+
+
+def run(iterations: int, workers: int, limit: int, redis_uri: Optional[str]):
+    shm_path = os.path.join(tempfile.gettempdir(), f"bench-ratelimit-{os.getpid()}")
+    uris = {"memory://": "memory://", "shm://": f"shm://{shm_path}"}
+    if redis_uri:
+        uris["redis://"] = redis_uri
+
+    try:
+        print(f"limiter.hit() latency over {iterations} checks, 1024 client keys\n")
+        for label, uri in uris.items():
+            samples = _latency(uri, iterations)
+            print(f"{label:<10} p50={np.percentile(samples, 50):7.1f}µs  p99={np.percentile(samples, 99):7.1f}µs")
+
+        attempts = limit  # every worker alone would exhaust the limit
+        print(f"\n{workers} workers x {attempts} attempts against a {limit}/hour limit (allowed should be {limit})\n")
+        for label, uri in uris.items():
+            allowed = _shared_check(uri, workers, limit, attempts)
+            shared = "shared" if allowed == limit else "NOT shared"
+            print(f"{label:<10} allowed={allowed:5d}  ({shared})")
+    finally:
+        if os.path.exists(shm_path):
+            os.remove(shm_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--redis", help="Redis URI to include, e.g. redis://localhost:6379/15")
+    args = parser.parse_args()
+    run(args.iterations, args.workers, args.limit, args.redis)
+
+
+if __name__ == "__main__":
+    main()
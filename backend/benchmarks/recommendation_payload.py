@@ -0,0 +1,152 @@
+"""
+Recommendations payload size and delivery time: full vs compact view,
+uncompressed vs gzip vs br.
+
+Builds decks of realistic cards (real compatibility results for random
+questionnaire answers), serves them through FastJSONResponse and
+CompressionMiddleware over httpx's ASGITransport, and reports the bytes on
+the wire, server time (serialize + compress), and an end-to-end estimate
+on slow and typical mobile links: server time + one round trip + transfer
+at the link's bandwidth + client decompression. No database or network
+involved. Run from backend/:
+
+    python -m benchmarks.recommendation_payload --cards 10 50
+"""
+import argparse
+import asyncio
+import gzip
+import random
+import time
+import uuid
+from typing import Any, Dict, List
+
+import httpx
+from fastapi import FastAPI
+
+from app.core.compression import CompressionMiddleware, brotli
+from app.core.responses import FastJSONResponse
+from app.services.compatibility_engine import CompatibilityEngine
+from app.services.matching import MatchingService
+from app.services.questionnaire import get_all_questions
+
+# (name, bandwidth in Mbit/s, round trip in ms)
+LINKS = [("3G", 1.6, 300), ("4G", 12.0, 80)]
+
+BIO_SENTENCES = [
+    "Theatre kid and robotics team captain.", "Will talk about space for hours.", "Looking for a fun prom night!",
+    "Varsity soccer, AP everything.", "Best playlist in the senior class, no contest.", "Coffee snob in training.",
+    "Ask me about my sourdough starter.", "Half the yearbook photos are mine.", "Debate team, so be ready.",
+    "Dog person, but open to cats.", "Always down for a late-night diner run.", "Learning guitar (slowly).",
+]
+HOBBIES = ["robotics", "theatre", "astronomy", "baking", "hiking", "soccer", "photography", "gaming", "choir", "debate"]
+
+
+def _answers(rng: random.Random) -> Dict[str, Any]:
+    answers = {}
+    for question in get_all_questions():
+        if question.get("options"):
+            answers[question["id"]] = rng.choice(question["options"])["value"]
+        else:
+            answers[question["id"]] = rng.randint(question["min"], question["max"])
+    return answers
+
+
+def _deck(cards: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    engine = CompatibilityEngine()
+    me = _answers(rng)
+    deck = []
+    while len(deck) < cards:
+        answers = _answers(rng)
+        result = engine.calculate_compatibility(me, answers)
+        if result["deal_breakers"]:
+            continue
+        name = f"Student {len(deck)}"
+        match = {
+            "user_id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "name": name,
+            "bio": " ".join(rng.sample(BIO_SENTENCES, 3)),
+            "gender": rng.choice(["female", "male", "non-binary"]),
+            "grade": rng.choice(["junior", "senior"]),
+            "hobbies": rng.sample(HOBBIES, 5),
+            "personality": " ".join(rng.sample(BIO_SENTENCES, 4)),
+            "question_answers": answers,
+            "socials": {"instagram": f"@student{len(deck)}", "snapchat": f"student.{len(deck)}"},
+            "profile_pic_url": f"https://example.supabase.co/storage/v1/object/public/photos/{uuid.uuid4()}.jpg",
+            "similarity": rng.random(),
+        }
+        boost = 1 + rng.random() / 10
+        deck.append(MatchingService._recommendation(match, result, boost, min(100.0, result["overall_score"] * boost)))
+    deck.sort(key=lambda card: card["compatibility_percentage"], reverse=True)
+    return deck
+
+
+def _app(payloads: Dict[str, Dict[str, Any]]) -> CompressionMiddleware:
+    app = FastAPI()
+
+    @app.get("/{view}")
+    async def recommendations(view: str):
+        return FastJSONResponse(payloads[view])
+
+    return CompressionMiddleware(app)
+
+
+def _decompress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.decompress(body)
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    return body
+
+
+async def _measure(app, view: str, encoding: str, rounds: int):
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Accept-Encoding": encoding}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        server, decode = [], []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            async with client.stream("GET", f"/{view}", headers=headers) as response:
+                raw = b"".join([chunk async for chunk in response.aiter_raw()])
+            server.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            _decompress(raw, response.headers.get("content-encoding", "identity"))
+            decode.append(time.perf_counter() - start)
+    median = lambda xs: sorted(xs)[len(xs) // 2] * 1000
+    return len(raw), median(server), median(decode)
+
+
+async def run(card_counts: List[int], rounds: int, seed: int):
+    encodings = ["identity", "gzip"] + (["br"] if brotli is not None else [])
+    print(f"median of {rounds} rounds; end-to-end = server + RTT + transfer + decompress\n")
+    header = f"{'cards':>5} {'view':<8} {'encoding':<9} {'bytes':>9} {'server ms':>10} {'decode ms':>10}"
+    print(header + "".join(f" {name + ' e2e ms':>11}" for name, _, _ in LINKS))
+    for cards in card_counts:
+        deck = _deck(cards, seed)
+        payloads = {
+            "full": {"recommendations": deck, "count": len(deck)},
+            "compact": {"recommendations": [MatchingService.compact_recommendation(c) for c in deck], "count": len(deck)},
+        }
+        app = _app(payloads)
+        for view in ("full", "compact"):
+            for encoding in encodings:
+                size, server_ms, decode_ms = await _measure(app, view, encoding, rounds)
+                line = f"{cards:>5} {view:<8} {encoding:<9} {size:>9} {server_ms:>10.2f} {decode_ms:>10.2f}"
+                for _, mbit, rtt_ms in LINKS:
+                    transfer_ms = size * 8 / (mbit * 1000)
+                    line += f" {server_ms + rtt_ms + transfer_ms + decode_ms:>11.0f}"
+                print(line)
+        print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cards", type=int, nargs="+", default=[10, 50])
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    asyncio.run(run(args.cards, args.rounds, args.seed))
+
+
+if __name__ == "__main__":
+    main()
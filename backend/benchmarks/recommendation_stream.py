@@ -0,0 +1,82 @@
+"""
+Time to first card: GET /recommendations vs the streaming variant.
+
+Runs MatchingService.get_recommendations (what the JSON endpoint waits for)
+and MatchingService.stream_recommendations (what /recommendations/stream
+sends) for the same users, and reports the median time until the whole
+response is ready and until the first card event. Both paths share the
+same scoring code, so the difference is purely when cards are released.
+
+The AI boost is an HTTP call to Hugging Face per candidate; by default it
+is replaced with a fixed delay (--ai-latency-ms) so results are
+reproducible. Pass --ai-latency-ms -1 to call the real API.
+
+Needs DATABASE_BACKEND=postgres and DATABASE_URL pointing at a database
+with users that have embeddings. Run from backend/ with the usual .env present:
+
+    python -m benchmarks.recommendation_stream --users 10 --limit 10
+"""
+import argparse
+import asyncio
+import time
+from typing import List
+
+from app.services.container import ServiceContainer
+
+
+async def _sample_users(services: ServiceContainer, count: int) -> List[str]:
+    pool = await services.db.pg.pool()
+    rows = await pool.fetch(
+        "SELECT auth_id FROM users WHERE embedding IS NOT NULL ORDER BY random() LIMIT $1", count
+    )
+    return [row["auth_id"] for row in rows]
+
+
+async def run(users: int, limit: int, ai_latency_ms: float, rounds: int):
+    services = ServiceContainer()
+    matching = services.matching
+    if ai_latency_ms >= 0:
+        async def fake_boost(*_):
+            await asyncio.sleep(ai_latency_ms / 1000)
+            return 1.0
+        matching.ai_enhancement.enhance_with_nlp = fake_boost
+
+    try:
+        auth_ids = await _sample_users(services, users)
+        full, first, stream_total = [], [], []
+        for _ in range(rounds):
+            for auth_id in auth_ids:
+                start = time.perf_counter()
+                await matching.get_recommendations(auth_id, limit)
+                full.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                first_at = None
+                async for event, _ in matching.stream_recommendations(auth_id, limit):
+                    if event == "card" and first_at is None:
+                        first_at = time.perf_counter() - start
+                stream_total.append(time.perf_counter() - start)
+                first.append(first_at if first_at is not None else stream_total[-1])
+    finally:
+        await services.close()
+
+    median = lambda xs: sorted(xs)[len(xs) // 2] * 1000
+    label = "real API" if ai_latency_ms < 0 else f"{ai_latency_ms:.0f} ms"
+    print(f"{len(auth_ids)} users x {rounds} rounds, limit {limit}, AI boost latency {label}\n")
+    print(f"{'JSON response ready':<28} {median(full):8.1f} ms")
+    print(f"{'stream: first card':<28} {median(first):8.1f} ms")
+    print(f"{'stream: done event':<28} {median(stream_total):8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--ai-latency-ms", type=float, default=30.0)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.users, args.limit, args.ai_latency_ms, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
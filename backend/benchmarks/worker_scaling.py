@@ -0,0 +1,159 @@
+"""
+Throughput vs worker count for the production server (gunicorn.conf.py).
+
+For each worker count, starts `gunicorn app.main:app` with WEB_CONCURRENCY
+set to it, drives it with keep-alive HTTP/1.1 connections from several
+client processes for a fixed duration, and reports requests per second
+and the speedup over one worker, plus each worker's resident (RSS) and
+proportional (PSS) memory; PSS well below RSS means the preloaded pages are
+shared rather than copied. The load generator runs on the same host
+and takes CPU from the server, so give it at most half the cores
+(--clients) and expect the curve to flatten before the core count.
+Run from backend/ with the usual .env present:
+
+    python -m benchmarks.worker_scaling --workers 1 2 4 8 --path /
+
+Use a path without a rate limit (/ is), or set RATE_LIMIT_STORAGE_URI high
+enough that 429s don't dominate; non-2xx responses are counted separately.
+gunicorn refuses more than one worker with memory:// rate limits or match
+broker, so set RATE_LIMIT_STORAGE_URI=shm:///dev/shm/prom-ratelimit and a
+redis:// NOTIFICATIONS_BROKER_URI in .env first.
+"""
+import argparse
+import asyncio
+import multiprocessing as mp
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_ready(port: int, proc: subprocess.Popen, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with {proc.returncode}")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("gunicorn did not start listening in time")
+
+
+def _worker_memory_mb(master_pid: int):
+    """Mean (RSS, PSS) of the master's children in MB, from /proc (Linux only)"""
+    try:
+        with open(f"/proc/{master_pid}/task/{master_pid}/children") as f:
+            pids = f.read().split()
+        samples = []
+        for pid in pids:
+            fields = {}
+            with open(f"/proc/{pid}/smaps_rollup") as f:
+                for line in f:
+                    name, _, value = line.partition(":")
+                    fields[name] = value
+            samples.append((int(fields["Rss"].split()[0]) / 1024, int(fields["Pss"].split()[0]) / 1024))
+    except (OSError, KeyError, ValueError):
+        return None
+    if not samples:
+        return None
+    return sum(r for r, _ in samples) / len(samples), sum(p for _, p in samples) / len(samples)
+
+
+async def _connection(port: int, request: bytes, stop_at: float, counts: list):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        while time.monotonic() < stop_at:
+            writer.write(request)
+            status_line = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.partition(b":")
+                if name.strip().lower() == b"content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            counts[0 if status_line[9:10] == b"2" else 1] += 1
+    finally:
+        writer.close()
+
+
+def _client(port: int, path: str, connections: int, duration: float, results):
+    request = f"GET {path} HTTP/1.1\r\nHost: bench\r\nConnection: keep-alive\r\n\r\n".encode()
+    counts = [0, 0]
+    stop_at = time.monotonic() + duration
+
+    async def run():
+        await asyncio.gather(*(_connection(port, request, stop_at, counts) for _ in range(connections)))
+
+    asyncio.run(run())
+    results.put(counts)
+
+
+def measure(workers: int, path: str, clients: int, connections: int, duration: float, warmup: float):
+    port = _free_port()
+    env = {**os.environ, "WEB_CONCURRENCY": str(workers), "PORT": str(port)}
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "app.main:app", "--bind", f"127.0.0.1:{port}"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        _wait_ready(port, proc)
+        time.sleep(warmup)  # let every worker finish its lifespan warmup
+        results = mp.Queue()
+        procs = [
+            mp.Process(target=_client, args=(port, path, connections, duration, results))
+            for _ in range(clients)
+        ]
+        start = time.perf_counter()
+        for p in procs:
+            p.start()
+        totals = [0, 0]
+        for _ in procs:
+            ok, other = results.get()
+            totals[0] += ok
+            totals[1] += other
+        for p in procs:
+            p.join()
+        elapsed = time.perf_counter() - start
+        return totals[0] / elapsed, totals[1], _worker_memory_mb(proc.pid)
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        proc.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--path", default="/")
+    parser.add_argument("--clients", type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help="load generator processes")
+    parser.add_argument("--connections", type=int, default=32, help="keep-alive connections per client")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per worker count")
+    parser.add_argument("--warmup", type=float, default=2.0)
+    args = parser.parse_args()
+
+    print(f"GET {args.path}: {args.clients} client processes x {args.connections} connections, "
+          f"{args.duration:.0f}s per run, {os.cpu_count()} CPUs\n")
+    print(f"{'workers':>7} {'req/s':>10} {'speedup':>8} {'non-2xx':>8} {'RSS MB':>8} {'PSS MB':>8}")
+    baseline = None
+    for workers in args.workers:
+        rps, errors, memory = measure(workers, args.path, args.clients, args.connections, args.duration, args.warmup)
+        baseline = baseline or rps
+        rss, pss = memory or (float("nan"), float("nan"))
+        print(f"{workers:>7} {rps:>10.0f} {rps / baseline:>7.2f}x {errors:>8} {rss:>8.1f} {pss:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Production server configuration.
+Run from backend/ with:
+
+    gunicorn app.main:app
+
+One gunicorn master imports the app once (preload_app), then forks
+uvicorn workers that share the imported modules and read-only data
+(questionnaire payload, scoring tables, compiled code) copy-on-write.
+Per-worker state (database pools, HTTP sessions, caches, recommendation
+queues) is created after the fork by the app's lifespan hook.
+
+Environment:
+    PORT                       listen port (default 8000)
+    WEB_CONCURRENCY            worker count (default: one per usable CPU, or one while
+                               NOTIFICATIONS_BROKER_URI is memory://)
+    PROMETHEUS_MULTIPROC_DIR   where workers write metrics for /metrics to merge
+                               (default: prom-metrics under /dev/shm or the temp dir)
+"""
+import gc
+import glob
+import logging
+import os
+import tempfile
+
+from app.core.config import get_settings
+
+logger = logging.getLogger("gunicorn.error")
+
+
+def _usable_cpus() -> int:
+    try:
+        cpus = len(os.sched_getaffinity(0))  # respects taskset/cpuset limits
+    except AttributeError:  # not available on macOS
+        cpus = os.cpu_count() or 1
+    # Container CPU quota (cgroup v2), e.g. docker run --cpus=2
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, int(quota) // int(period)))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+settings = get_settings()
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+# Workers are async, so one per CPU keeps every core busy without oversubscribing.
+# An in-process broker only reaches streams on its own worker, so it gets one.
+workers = int(os.environ.get("WEB_CONCURRENCY", 0)) or (
+    1 if settings.NOTIFICATIONS_BROKER_URI.startswith("memory://") else _usable_cpus()
+)
+# uvloop and httptools are used when installed (uvicorn[standard])
+worker_class = "uvicorn_worker.UvicornWorker"
+preload_app = True
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
+accesslog = None  # RequestLoggingMiddleware already logs every request
+
+# Must be set before preload_app imports the app (and prometheus_client).
+# Files from a previous run are dropped so counters start from zero.
+os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR",
+    os.path.join("/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(), "prom-metrics"),
+)
+os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+for _stale in glob.glob(os.path.join(os.environ["PROMETHEUS_MULTIPROC_DIR"], "*.db")):
+    os.remove(_stale)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
+
+
+def when_ready(server):
+    """Runs in the master after the app is imported and before workers fork"""
+    # Move everything imported so far out of the collector's reach; otherwise
+    # each worker's first collections touch (and so copy) every shared page
+    gc.collect()
+    gc.freeze()
+
+    # Both would silently misbehave with several workers, so refuse to start
+    if server.cfg.workers > 1 and settings.RATE_LIMIT_ENABLED and settings.RATE_LIMIT_STORAGE_URI.startswith("memory://"):
+        raise RuntimeError(
+            f"RATE_LIMIT_STORAGE_URI is memory:// with {server.cfg.workers} workers: each worker counts "
+            f"separately, so limits would be {server.cfg.workers}x higher. Use shm:// or redis://."
+        )
+    if server.cfg.workers > 1 and settings.NOTIFICATIONS_BROKER_URI.startswith("memory://"):
+        raise RuntimeError(
+            f"NOTIFICATIONS_BROKER_URI is memory:// with {server.cfg.workers} workers: a match event would "
+            "only reach streams open on the worker that handled the swipe. Use redis:// or WEB_CONCURRENCY=1."
+        )
+    logger.info("Preloaded app; forking %d workers (%s frozen objects shared)", server.cfg.workers, gc.get_freeze_count())
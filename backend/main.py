@@ -1,6 +1,7 @@
 """
-Entry point for Prom Matchmaking API
+Development entry point for Prom Matchmaking API (single process, auto-reload)
 Run with: python main.py
+In production run `gunicorn app.main:app` instead (see gunicorn.conf.py)
 """
 import uvicorn
 from dotenv import load_dotenv
@@ -0,0 +1,11 @@
+-- ============================================
+-- LOCAL DEVELOPMENT ONLY
+-- Minimal stand-ins for Supabase built-ins so schema.sql
+-- and the migrations can be applied to a plain Postgres + pgvector
+-- ============================================
+
+CREATE SCHEMA IF NOT EXISTS auth;
+
+-- RLS policies reference auth.uid(); the backend connects as a superuser and bypasses RLS
+CREATE OR REPLACE FUNCTION auth.uid() RETURNS UUID
+LANGUAGE sql STABLE AS $$ SELECT NULL::UUID $$;
@@ -0,0 +1,64 @@
+-- ============================================
+-- MIGRATION: Single-query match listing
+-- Run this in Supabase SQL Editor after migration_add_photos.sql
+-- ============================================
+-- Returns a user's matches joined with the other user's display columns
+-- in one round trip, ordered newest-first or by compatibility score,
+-- with keyset (cursor) pagination on (sort_key, match_id).
+--
+-- sort_key is returned as TEXT so the cursor survives JSON round trips
+-- without losing numeric precision.
+
+CREATE OR REPLACE FUNCTION get_user_matches(
+    p_user_id UUID,
+    p_order TEXT DEFAULT 'created_at',
+    p_limit INT DEFAULT NULL,
+    p_cursor_sort NUMERIC DEFAULT NULL,
+    p_cursor_id UUID DEFAULT NULL
+)
+RETURNS TABLE (
+    match_id UUID,
+    is_super_match BOOLEAN,
+    compatibility_score DECIMAL(5,2),
+    created_at TIMESTAMPTZ,
+    sort_key TEXT,
+    other_user_id UUID,
+    name TEXT,
+    bio TEXT,
+    gender TEXT,
+    grade TEXT,
+    school TEXT,
+    hobbies TEXT[],
+    socials JSONB,
+    profile_pic_url TEXT
+) AS $$
+    SELECT
+        t.match_id, t.is_super_match, t.compatibility_score, t.created_at,
+        t.sort_value::TEXT,
+        t.other_user_id, t.name, t.bio, t.gender, t.grade, t.school,
+        t.hobbies, t.socials, t.profile_pic_url
+    FROM (
+        SELECT
+            m.id AS match_id,
+            COALESCE(m.is_super_match, FALSE) AS is_super_match,
+            m.compatibility_score,
+            m.created_at,
+            CASE
+                WHEN p_order = 'compatibility_score' THEN COALESCE(m.compatibility_score, -1)::NUMERIC
+                ELSE COALESCE(EXTRACT(EPOCH FROM m.created_at), 0)::NUMERIC
+            END AS sort_value,
+            u.id AS other_user_id,
+            u.name, u.bio, u.gender, u.grade, u.school,
+            u.hobbies, u.socials, u.profile_pic_url
+        FROM matches m
+        JOIN users u
+          ON u.id = CASE WHEN m.user1_id = p_user_id THEN m.user2_id ELSE m.user1_id END
+        WHERE m.user1_id = p_user_id OR m.user2_id = p_user_id
+    ) t
+    WHERE p_cursor_sort IS NULL
+       OR (t.sort_value, t.match_id) < (p_cursor_sort, p_cursor_id)
+    ORDER BY t.sort_value DESC, t.match_id DESC
+    LIMIT p_limit;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION get_user_matches IS 'Paginated match list joined with the other user''s display columns';
@@ -0,0 +1,133 @@
+-- ============================================
+-- MIGRATION: HNSW vector index + tunable find_matches
+-- Run with psql after migration_process_swipes_batch.sql, NOT inside a
+-- transaction (the SQL Editor wraps scripts in one): CREATE/DROP INDEX
+-- CONCURRENTLY refuse to run in a transaction block
+-- Requires pgvector >= 0.5.0 (HNSW); iterative index scans need >= 0.8.0
+-- ============================================
+-- IVFFlat with a fixed lists = 100 loses recall as the table grows past
+-- what it was built for. HNSW needs no retraining and its recall/speed
+-- trade-off is tuned per query with hnsw.ef_search.
+
+-- The HNSW index is built CONCURRENTLY next to the IVFFlat one, so users
+-- stays writable and find_matches keeps an index during the build; the old
+-- index is only dropped once the new one is valid.
+
+-- A failed concurrent build leaves an INVALID index that IF NOT EXISTS would skip
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE c.relname = 'users_embedding_hnsw_idx' AND NOT i.indisvalid
+    ) THEN
+        DROP INDEX users_embedding_hnsw_idx;
+    END IF;
+END $$;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS users_embedding_hnsw_idx ON users
+USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64);
+
+DROP INDEX CONCURRENTLY IF EXISTS users_embedding_idx;
+
+-- Signature changes, so drop the old two-argument version to avoid an ambiguous overload
+DROP FUNCTION IF EXISTS find_matches(UUID, INT);
+
+-- ============================================
+-- VECTOR SIMILARITY SEARCH FUNCTION
+-- p_ef_search      HNSW candidate list size (higher = better recall, slower)
+-- p_probes         IVFFlat lists to probe; only used while the schema.sql
+--                  IVFFlat index is still the one in place (this migration not
+--                  yet run, or its HNSW build still running or failed)
+-- p_iterative_scan keep scanning the index until the filters have produced
+--                  p_limit rows (pgvector >= 0.8; silently ignored on older versions)
+-- ============================================
+CREATE OR REPLACE FUNCTION find_matches(
+    p_user_id UUID,
+    p_limit INT DEFAULT 10,
+    p_ef_search INT DEFAULT NULL,
+    p_probes INT DEFAULT NULL,
+    p_iterative_scan BOOLEAN DEFAULT TRUE
+)
+RETURNS TABLE (
+    user_id UUID,
+    name TEXT,
+    bio TEXT,
+    gender TEXT,
+    grade TEXT,
+    hobbies TEXT[],
+    personality TEXT,
+    question_answers JSONB,
+    socials JSONB,
+    profile_pic_url TEXT,
+    similarity FLOAT,
+    compatibility_percentage INT
+) AS $$
+DECLARE
+    v_user_embedding vector(384);
+    v_user_gender TEXT;
+    v_user_looking_for TEXT[];
+BEGIN
+    -- Get current user's data
+    SELECT u.embedding, u.gender, u.looking_for
+    INTO v_user_embedding, v_user_gender, v_user_looking_for
+    FROM users u
+    WHERE u.id = p_user_id;
+
+    -- If user has no embedding, return empty
+    IF v_user_embedding IS NULL THEN
+        RETURN;
+    END IF;
+
+    -- Search parameters are transaction-local (is_local = true)
+    IF p_ef_search IS NOT NULL THEN
+        PERFORM set_config('hnsw.ef_search', p_ef_search::TEXT, true);
+    END IF;
+
+    IF p_probes IS NOT NULL THEN
+        PERFORM set_config('ivfflat.probes', p_probes::TEXT, true);
+    END IF;
+
+    IF p_iterative_scan THEN
+        BEGIN
+            PERFORM set_config('hnsw.iterative_scan', 'strict_order', true);
+            -- Same IVFFlat-only window as p_probes
+            PERFORM set_config('ivfflat.iterative_scan', 'relaxed_order', true);
+        EXCEPTION WHEN OTHERS THEN
+            NULL;  -- pgvector < 0.8: no iterative scans, fall back to a single pass
+        END;
+    END IF;
+
+    RETURN QUERY
+    SELECT 
+        u.id AS user_id,
+        u.name,
+        u.bio,
+        u.gender,
+        u.grade,
+        u.hobbies,
+        u.personality,
+        u.question_answers,
+        u.socials,
+        u.profile_pic_url,
+        -- Cosine similarity (1 - cosine distance)
+        (1 - (u.embedding <=> v_user_embedding))::FLOAT AS similarity,
+        -- Convert to percentage (0-100)
+        LEAST(100, GREATEST(0, ((1 - (u.embedding <=> v_user_embedding) + 1) * 50)::INT)) AS compatibility_percentage
+    FROM users u
+    WHERE u.id != p_user_id
+      AND u.embedding IS NOT NULL
+      -- Gender preferences (both ways)
+      AND u.gender = ANY(v_user_looking_for)
+      AND v_user_gender = ANY(u.looking_for)
+      -- Exclude already swiped users
+      AND NOT EXISTS (
+          SELECT 1 FROM swipes s 
+          WHERE s.user_id = p_user_id AND s.target_user_id = u.id
+      )
+    ORDER BY u.embedding <=> v_user_embedding ASC
+    LIMIT p_limit;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION find_matches IS 'Vector similarity search for finding compatible matches';
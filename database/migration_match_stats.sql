@@ -0,0 +1,20 @@
+-- ============================================
+-- MIGRATION: Aggregate match stats
+-- Run this in Supabase SQL Editor after migration_get_user_matches.sql
+-- ============================================
+-- One index-backed aggregate for the dashboard's /stats poll instead of
+-- loading every match and profile just to count them.
+
+CREATE OR REPLACE FUNCTION get_user_match_stats(p_user_id UUID)
+RETURNS TABLE (
+    total_matches INT,
+    super_matches INT
+) AS $$
+    SELECT
+        COUNT(*)::INT AS total_matches,
+        COUNT(*) FILTER (WHERE m.is_super_match)::INT AS super_matches
+    FROM matches m
+    WHERE m.user1_id = p_user_id OR m.user2_id = p_user_id;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION get_user_match_stats IS 'Match counts for a user (total and super)';
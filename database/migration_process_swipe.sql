@@ -0,0 +1,77 @@
+-- ============================================
+-- MIGRATION: Atomic swipe processing
+-- Run this in Supabase SQL Editor after migration_match_stats.sql
+-- ============================================
+-- Records a swipe, checks reciprocity and creates the match in one
+-- transaction / one round trip. A transaction-scoped advisory lock on the
+-- (unordered) user pair serializes two users swiping on each other at the
+-- same moment, so the second swipe always sees the first and the mutual
+-- match cannot be missed.
+--
+-- When the swipe creates a match, the target's scoring fields are
+-- returned so the backend can compute the compatibility score without
+-- another lookup. Swiping again on someone already matched only updates
+-- the existing match and reports match_created = FALSE, so it is neither
+-- rescored nor announced twice.
+
+CREATE OR REPLACE FUNCTION process_swipe(
+    p_user_id UUID,
+    p_target_user_id UUID,
+    p_action TEXT
+)
+RETURNS TABLE (
+    match_created BOOLEAN,
+    match_id UUID,
+    is_super_match BOOLEAN,
+    target_question_answers JSONB,
+    target_personality TEXT
+) AS $$
+#variable_conflict use_column
+DECLARE
+    v_user1 UUID := LEAST(p_user_id, p_target_user_id);
+    v_user2 UUID := GREATEST(p_user_id, p_target_user_id);
+    v_target_action TEXT;
+    v_match_id UUID;
+    v_is_super BOOLEAN;
+    v_inserted BOOLEAN;
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtextextended(v_user1::TEXT || v_user2::TEXT, 0));
+
+    INSERT INTO swipes (user_id, target_user_id, action)
+    VALUES (p_user_id, p_target_user_id, p_action)
+    ON CONFLICT (user_id, target_user_id) DO UPDATE SET action = EXCLUDED.action;
+
+    IF p_action NOT IN ('yes', 'super') THEN
+        RETURN QUERY SELECT FALSE, NULL::UUID, FALSE, NULL::JSONB, NULL::TEXT;
+        RETURN;
+    END IF;
+
+    SELECT s.action INTO v_target_action
+    FROM swipes s
+    WHERE s.user_id = p_target_user_id AND s.target_user_id = p_user_id;
+
+    IF v_target_action IS NULL OR v_target_action NOT IN ('yes', 'super') THEN
+        RETURN QUERY SELECT FALSE, NULL::UUID, FALSE, NULL::JSONB, NULL::TEXT;
+        RETURN;
+    END IF;
+
+    INSERT INTO matches (user1_id, user2_id, is_super_match)
+    VALUES (v_user1, v_user2, p_action = 'super' OR v_target_action = 'super')
+    ON CONFLICT (user1_id, user2_id)
+    DO UPDATE SET is_super_match = matches.is_super_match OR EXCLUDED.is_super_match
+    -- xmax = 0 only on a freshly inserted row, not on one taken by DO UPDATE
+    RETURNING matches.id, matches.is_super_match, (matches.xmax = 0) INTO v_match_id, v_is_super, v_inserted;
+
+    IF NOT v_inserted THEN
+        RETURN QUERY SELECT FALSE, NULL::UUID, FALSE, NULL::JSONB, NULL::TEXT;
+        RETURN;
+    END IF;
+
+    RETURN QUERY
+    SELECT TRUE, v_match_id, v_is_super, u.question_answers, u.personality
+    FROM users u
+    WHERE u.id = p_target_user_id;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION process_swipe IS 'Record a swipe and create the mutual match atomically';
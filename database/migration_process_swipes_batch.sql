@@ -0,0 +1,121 @@
+-- ============================================
+-- MIGRATION: Batch swipe processing
+-- Run this in Supabase SQL Editor after migration_process_swipe.sql
+-- ============================================
+-- Same semantics as process_swipe for an ordered list of swipes:
+-- one bulk upsert, one reciprocity check, one match upsert, one round trip.
+-- If a target appears more than once the last action wins. Only matches
+-- this batch inserts are reported as match_created. Targets whose
+-- account no longer exists are skipped and left out of the result, so the
+-- caller reports them as not recorded instead of the batch failing.
+
+CREATE OR REPLACE FUNCTION process_swipes_batch(
+    p_user_id UUID,
+    p_target_user_ids UUID[],
+    p_actions TEXT[]
+)
+RETURNS TABLE (
+    target_user_id UUID,
+    action TEXT,
+    match_created BOOLEAN,
+    match_id UUID,
+    is_super_match BOOLEAN,
+    target_question_answers JSONB,
+    target_personality TEXT
+) AS $$
+#variable_conflict use_column
+DECLARE
+    v_targets UUID[];
+    v_actions TEXT[];
+BEGIN
+    -- Keep the targets' rows from being deleted until the swipes are in
+    PERFORM 1 FROM users WHERE id = ANY(p_target_user_ids) ORDER BY id FOR KEY SHARE;
+
+    -- Deduplicate (last action per target wins), drop self-swipes and
+    -- targets that no longer exist
+    SELECT array_agg(d.target_user_id), array_agg(d.action)
+    INTO v_targets, v_actions
+    FROM (
+        SELECT DISTINCT ON (b.target_user_id) b.target_user_id, b.action
+        FROM unnest(p_target_user_ids, p_actions) WITH ORDINALITY AS b(target_user_id, action, ord)
+        WHERE b.target_user_id <> p_user_id
+        ORDER BY b.target_user_id, b.ord DESC
+    ) d
+    JOIN users t ON t.id = d.target_user_id;
+
+    IF v_targets IS NULL THEN
+        RETURN;
+    END IF;
+
+    -- Lock every pair in a fixed order so concurrent batches cannot deadlock
+    PERFORM pg_advisory_xact_lock(k.lock_key)
+    FROM (
+        SELECT DISTINCT hashtextextended(
+            LEAST(p_user_id, t.target_user_id)::TEXT || GREATEST(p_user_id, t.target_user_id)::TEXT, 0
+        ) AS lock_key
+        FROM unnest(v_targets) AS t(target_user_id)
+        ORDER BY 1
+    ) k;
+
+    INSERT INTO swipes (user_id, target_user_id, action)
+    SELECT p_user_id, b.target_user_id, b.action
+    FROM unnest(v_targets, v_actions) AS b(target_user_id, action)
+    ON CONFLICT (user_id, target_user_id) DO UPDATE SET action = EXCLUDED.action;
+
+    RETURN QUERY
+    WITH batch AS (
+        SELECT b.target_user_id, b.action
+        FROM unnest(v_targets, v_actions) AS b(target_user_id, action)
+    ),
+    mutual AS (
+        SELECT
+            b.target_user_id,
+            (b.action = 'super' OR s.action = 'super') AS is_super
+        FROM batch b
+        JOIN swipes s
+          ON s.user_id = b.target_user_id
+         AND s.target_user_id = p_user_id
+        WHERE b.action IN ('yes', 'super')
+          AND s.action IN ('yes', 'super')
+    ),
+    upserted AS (
+        INSERT INTO matches (user1_id, user2_id, is_super_match)
+        SELECT LEAST(p_user_id, m.target_user_id), GREATEST(p_user_id, m.target_user_id), m.is_super
+        FROM mutual m
+        ON CONFLICT (user1_id, user2_id)
+        DO UPDATE SET is_super_match = matches.is_super_match OR EXCLUDED.is_super_match
+        -- xmax = 0 only on a freshly inserted row, not on one taken by DO UPDATE
+        RETURNING matches.id, matches.user1_id, matches.user2_id, matches.is_super_match,
+                  (matches.xmax = 0) AS inserted
+    )
+    SELECT
+        b.target_user_id,
+        b.action,
+        u.id IS NOT NULL,
+        u.id,
+        COALESCE(u.is_super_match, FALSE),
+        CASE WHEN u.id IS NOT NULL THEN t.question_answers END,
+        CASE WHEN u.id IS NOT NULL THEN t.personality END
+    FROM batch b
+    LEFT JOIN upserted u
+      ON u.inserted
+     AND b.target_user_id = CASE WHEN u.user1_id = p_user_id THEN u.user2_id ELSE u.user1_id END
+    LEFT JOIN users t
+      ON t.id = b.target_user_id;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Write back app-computed compatibility scores for several matches at once
+CREATE OR REPLACE FUNCTION set_match_scores(
+    p_match_ids UUID[],
+    p_scores NUMERIC[]
+)
+RETURNS VOID AS $$
+    UPDATE matches m
+    SET compatibility_score = v.score
+    FROM unnest(p_match_ids, p_scores) AS v(match_id, score)
+    WHERE m.id = v.match_id;
+$$ LANGUAGE sql;
+
+COMMENT ON FUNCTION process_swipes_batch IS 'Record many swipes and create mutual matches atomically';
+COMMENT ON FUNCTION set_match_scores IS 'Bulk update of match compatibility scores';
@@ -0,0 +1,121 @@
+-- ============================================
+-- MIGRATION: Caller-side swipe exclusion for find_matches
+-- Run this in Supabase SQL Editor after migration_find_matches_paging.sql
+-- ============================================
+-- The backend can keep each active user's swiped targets in memory and
+-- either pass them in as p_exclude or filter the candidates itself. Both
+-- modes set p_skip_swiped = FALSE to skip the per-candidate NOT EXISTS
+-- probe against swipes. Defaults keep the previous behaviour.
+
+-- New parameters change the signature, so drop the previous version
+DROP FUNCTION IF EXISTS find_matches(UUID, INT, INT, INT, BOOLEAN, FLOAT, UUID);
+
+CREATE OR REPLACE FUNCTION find_matches(
+    p_user_id UUID,
+    p_limit INT DEFAULT 10,
+    p_ef_search INT DEFAULT NULL,
+    p_probes INT DEFAULT NULL,
+    p_iterative_scan BOOLEAN DEFAULT TRUE,
+    p_after_distance FLOAT DEFAULT NULL,
+    p_after_id UUID DEFAULT NULL,
+    p_exclude UUID[] DEFAULT NULL,
+    p_skip_swiped BOOLEAN DEFAULT TRUE
+)
+RETURNS TABLE (
+    user_id UUID,
+    name TEXT,
+    bio TEXT,
+    gender TEXT,
+    grade TEXT,
+    hobbies TEXT[],
+    personality TEXT,
+    question_answers JSONB,
+    socials JSONB,
+    profile_pic_url TEXT,
+    similarity FLOAT,
+    compatibility_percentage INT,
+    distance FLOAT
+) AS $$
+DECLARE
+    v_user_embedding vector(384);
+    v_user_gender TEXT;
+    v_user_looking_for TEXT[];
+BEGIN
+    -- Get current user's data
+    SELECT u.embedding, u.gender, u.looking_for
+    INTO v_user_embedding, v_user_gender, v_user_looking_for
+    FROM users u
+    WHERE u.id = p_user_id;
+
+    -- If user has no embedding, return empty
+    IF v_user_embedding IS NULL THEN
+        RETURN;
+    END IF;
+
+    -- Search parameters are transaction-local (is_local = true)
+    IF p_ef_search IS NOT NULL THEN
+        PERFORM set_config('hnsw.ef_search', p_ef_search::TEXT, true);
+    END IF;
+
+    IF p_probes IS NOT NULL THEN
+        PERFORM set_config('ivfflat.probes', p_probes::TEXT, true);
+    END IF;
+
+    IF p_iterative_scan THEN
+        BEGIN
+            PERFORM set_config('hnsw.iterative_scan', 'strict_order', true);
+            -- IVFFlat only matters until migration_hnsw_index.sql has replaced that index
+            PERFORM set_config('ivfflat.iterative_scan', 'relaxed_order', true);
+        EXCEPTION WHEN OTHERS THEN
+            NULL;  -- pgvector < 0.8: no iterative scans, fall back to a single pass
+        END;
+    END IF;
+
+    RETURN QUERY
+    SELECT 
+        u.id AS user_id,
+        u.name,
+        u.bio,
+        u.gender,
+        u.grade,
+        u.hobbies,
+        u.personality,
+        u.question_answers,
+        u.socials,
+        u.profile_pic_url,
+        -- Cosine similarity (1 - cosine distance)
+        (1 - (u.embedding <=> v_user_embedding))::FLOAT AS similarity,
+        -- Convert to percentage (0-100)
+        LEAST(100, GREATEST(0, ((1 - (u.embedding <=> v_user_embedding) + 1) * 50)::INT)) AS compatibility_percentage,
+        -- Raw cosine distance: the keyset for the next page
+        (u.embedding <=> v_user_embedding)::FLOAT AS distance
+    FROM users u
+    WHERE u.id != p_user_id
+      AND u.embedding IS NOT NULL
+      -- Gender preferences (both ways)
+      AND u.gender = ANY(v_user_looking_for)
+      AND v_user_gender = ANY(u.looking_for)
+      -- Exclude already swiped users, unless the caller filters them itself
+      AND (
+          NOT p_skip_swiped
+          OR NOT EXISTS (
+              SELECT 1 FROM swipes s 
+              WHERE s.user_id = p_user_id AND s.target_user_id = u.id
+          )
+      )
+      -- Caller-supplied exclusions (the backend's cached swiped set)
+      AND (p_exclude IS NULL OR u.id != ALL(p_exclude))
+      -- Keyset paging: rows strictly after (p_after_distance, p_after_id), so
+      -- every page moves forward even through rows tied on distance.
+      -- (A secondary ORDER BY on id would stop the planner using the vector index.)
+      AND (
+          p_after_distance IS NULL
+          OR (u.embedding <=> v_user_embedding) > p_after_distance
+          OR ((u.embedding <=> v_user_embedding) = p_after_distance AND u.id > p_after_id)
+      )
+    ORDER BY u.embedding <=> v_user_embedding ASC
+    LIMIT p_limit;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION find_matches IS 'Vector similarity search for finding compatible matches (keyset-pageable)';
@@ -85,7 +85,7 @@ const MatchPopup = ({ isOpen, onClose, matchedUser, isSuperMatch, compatibilityS
                 }
               </div>
               <h3 className="text-lg font-bold text-white mt-2">{matchedUser.name}</h3>
-              <p className="text-white/50 text-xs capitalize mt-0.5">{matchedUser.grade} · {matchedUser.gender}</p>
+              <p className="text-white/50 text-xs capitalize mt-0.5">{[matchedUser.grade, matchedUser.gender].filter(Boolean).join(' · ')}</p>
               {compatibilityScore != null && (
                 <div className="mt-2 inline-flex items-center gap-1.5 px-3 py-1 rounded-full text-sm font-bold" style={{ background: 'rgba(255,26,145,0.15)', color: '#ff80be' }}>
                   <Heart className="w-3.5 h-3.5" fill="currentColor" />
@@ -0,0 +1,63 @@
+import { useEffect, useRef } from 'react';
+import { API_BASE_URL, getAuthHeaders } from '../config/api';
+
+// Reconnect delays after the stream drops (ms); the last one repeats
+const RETRY_DELAYS = [1000, 3000, 10000, 30000];
+
+/**
+ * Listens on /notifications/stream (NDJSON) while mounted and `enabled`.
+ * onMatch(event) runs for every new match; onReconnect() runs after the
+ * stream comes back, since events sent while disconnected are not replayed.
+ */
+export const useMatchNotifications = (enabled, getToken, { onMatch, onReconnect }) => {
+  // Latest callbacks without reopening the stream on every render
+  const handlers = useRef({ getToken, onMatch, onReconnect });
+  handlers.current = { getToken, onMatch, onReconnect };
+
+  useEffect(() => {
+    if (!enabled) return undefined;
+    const controller = new AbortController();
+    let attempt = 0;
+
+    const listen = async () => {
+      while (!controller.signal.aborted) {
+        try {
+          const token = handlers.current.getToken();
+          const res = await fetch(`${API_BASE_URL}/notifications/stream?format=ndjson`, {
+            headers: token ? getAuthHeaders(token) : {},
+            signal: controller.signal,
+          });
+          if (!res.ok) throw new Error(`HTTP ${res.status}`);
+
+          const reader = res.body.getReader();
+          const decoder = new TextDecoder();
+          let buffered = '';
+          for (;;) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            buffered += decoder.decode(value, { stream: true });
+            const lines = buffered.split('\n');
+            buffered = lines.pop();
+            lines.filter(Boolean).forEach((line) => {
+              const { event, data } = JSON.parse(line);
+              if (event === 'ready') {
+                if (attempt > 0) handlers.current.onReconnect?.();
+                attempt = 0;
+              } else if (event === 'match') {
+                handlers.current.onMatch?.(data);
+              }
+            });
+          }
+        } catch (e) {
+          if (controller.signal.aborted) return;
+        }
+        const delay = RETRY_DELAYS[Math.min(attempt, RETRY_DELAYS.length - 1)];
+        attempt += 1;
+        await new Promise((resolve) => setTimeout(resolve, delay));
+      }
+    };
+
+    listen();
+    return () => controller.abort();
+  }, [enabled]);
+};
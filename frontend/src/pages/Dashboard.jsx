@@ -1,6 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import { motion, AnimatePresence } from 'framer-motion';
 import { useAuth } from '../hooks/useAuth';
+import { useMatchNotifications } from '../hooks/useMatchNotifications';
 import { Heart, Sparkles, LogOut, ArrowRight, Star, Settings, Trash2, AlertTriangle, X, Zap } from 'lucide-react';
 import axios from 'axios';
 import toast from 'react-hot-toast';
@@ -34,6 +35,8 @@ const Dashboard = () => {
   const { user, signOut, getToken } = useAuth();
   const navigate = useNavigate();
   const [matches, setMatches] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [stats, setStats] = useState({ total_matches: 0, super_matches: 0, regular_matches: 0 });
   const [loading, setLoading] = useState(true);
   const [hasAnswers, setHasAnswers] = useState(true);
@@ -62,6 +65,7 @@ const Dashboard = () => {
         axios.get(`${API_BASE_URL}/stats`, { headers }),
       ]);
       setMatches(matchesRes.data.matches || []);
+      setNextCursor(matchesRes.data.next_cursor || null);
       setStats(statsRes.data);
       try {
         const profileRes = await axios.get(`${API_BASE_URL}/users/profile/${user.id}`);
@@ -77,6 +81,46 @@ const Dashboard = () => {
     }
   };
 
+  // New matches are pushed; only the new card is fetched. Declared after
+  // fetchData: the options object is built during render
+  useMatchNotifications(Boolean(user), getToken, {
+    onMatch: async (match) => {
+      setStats((prev) => ({
+        ...prev,
+        total_matches: prev.total_matches + 1,
+        super_matches: prev.super_matches + (match.is_super_match ? 1 : 0),
+        regular_matches: prev.regular_matches + (match.is_super_match ? 0 : 1),
+      }));
+      toast.success(match.is_super_match ? '💫 New SUPER MATCH!' : "💕 You've got a new match!");
+      try {
+        const token = getToken();
+        const headers = token ? getAuthHeaders(token) : {};
+        const res = await axios.get(`${API_BASE_URL}/matches`, { headers, params: { limit: 1 } });
+        const latest = res.data.matches || [];
+        setMatches((prev) => [...latest, ...prev.filter((m) => !latest.some((l) => l.match_id === m.match_id))]);
+      } catch (e) {}
+    },
+    onReconnect: fetchData,
+  });
+
+  // /matches is paginated; older pages are fetched on demand
+  const loadMoreMatches = async () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const token = getToken();
+      const headers = token ? getAuthHeaders(token) : {};
+      const res = await axios.get(`${API_BASE_URL}/matches`, { headers, params: { cursor: nextCursor } });
+      const page = res.data.matches || [];
+      setMatches((prev) => [...prev, ...page.filter((m) => !prev.some((p) => p.match_id === m.match_id))]);
+      setNextCursor(res.data.next_cursor || null);
+    } catch (e) {
+      toast.error('Error loading matches');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleSignOut = async () => {
     try { await signOut(); navigate('/'); }
     catch (e) { toast.error('Error signing out'); }
@@ -218,6 +262,11 @@ const Dashboard = () => {
           ) : (
             <div className="space-y-3">
               {matches.map((match, i) => <MatchCard key={match.match_id} match={match} index={i} />)}
+              {nextCursor && (
+                <button onClick={loadMoreMatches} disabled={loadingMore} className="w-full py-2.5 text-sm text-white/50 hover:text-white/80 transition-colors disabled:opacity-50">
+                  {loadingMore ? 'Loading…' : 'Load more matches'}
+                </button>
+              )}
             </div>
           )}
         </div>
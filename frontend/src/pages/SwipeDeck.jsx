@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { motion, AnimatePresence } from 'framer-motion';
 import { useAuth } from '../hooks/useAuth';
 import { Heart, X, RotateCcw, Star, ArrowLeft } from 'lucide-react';
@@ -10,6 +10,9 @@ import MatchPopup from '../components/MatchPopup';
 import toast from 'react-hot-toast';
 import { API_BASE_URL, getAuthHeaders } from '../config/api';
 
+// Upcoming cards requested with every swipe
+const PREFETCH_CARDS = 5;
+
 const SwipeDeck = () => {
   const { user, getToken } = useAuth();
   const navigate = useNavigate();
@@ -21,19 +24,65 @@ const SwipeDeck = () => {
   const [isSuperMatch, setIsSuperMatch] = useState(false);
   const [compatibilityScore, setCompatibilityScore] = useState(null);
   const [compatibilityStrengths, setCompatibilityStrengths] = useState([]);
+  // Read by the stream and swipe handlers, which outlive the render they started in
+  const indexRef = useRef(0);
+  // user_id of the newest match, so a slow details response can't replace it
+  const latestMatchRef = useRef(null);
+
+  useEffect(() => {
+    indexRef.current = currentIndex;
+  }, [currentIndex]);
 
   useEffect(() => {
     if (user) fetchRecommendations();
   }, [user]);
 
+  // Cards stream in as they are scored (NDJSON); the first one renders
+  // right away and the "done" event reorders the cards not yet shown
   const fetchRecommendations = async () => {
     setLoading(true);
+    setProfiles([]);
+    setCurrentIndex(0);
+    indexRef.current = 0;
     try {
       const token = getToken();
       const headers = token ? getAuthHeaders(token) : {};
-      const res = await axios.get(`${API_BASE_URL}/recommendations`, { headers });
-      setProfiles(res.data.recommendations || []);
-      setCurrentIndex(0);
+      const res = await fetch(`${API_BASE_URL}/recommendations/stream?view=compact`, { headers });
+      if (!res.ok) throw new Error(`HTTP ${res.status}`);
+
+      const reader = res.body.getReader();
+      const decoder = new TextDecoder();
+      let buffered = '';
+      const handle = ({ event, data }) => {
+        if (event === 'card') {
+          // A swipe's next_cards may already have delivered this card
+          setProfiles((prev) => (prev.some((p) => p.user_id === data.user_id) ? prev : [...prev, data]));
+          setLoading(false);
+        } else if (event === 'done') {
+          // Cards that came from next_cards aren't in `order`; keep them, last
+          const rank = new Map(data.order.map((id, i) => [id, i]));
+          const position = (p) => (rank.has(p.user_id) ? rank.get(p.user_id) : rank.size);
+          setProfiles((prev) => {
+            const shown = prev.slice(0, indexRef.current + 1);
+            const shownIds = new Set(shown.map((p) => p.user_id));
+            const rest = prev
+              .filter((p) => !shownIds.has(p.user_id))
+              .sort((a, b) => position(a) - position(b));
+            return [...shown, ...rest];
+          });
+        } else if (event === 'error') {
+          toast.error('Some profiles could not be loaded.');
+        }
+      };
+
+      for (;;) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffered += decoder.decode(value, { stream: true });
+        const lines = buffered.split('\n');
+        buffered = lines.pop();
+        lines.filter(Boolean).forEach((line) => handle(JSON.parse(line)));
+      }
     } catch (e) {
       toast.error('Error loading profiles. Please try again.');
     } finally {
@@ -52,18 +101,42 @@ const SwipeDeck = () => {
       const res = await axios.post(`${API_BASE_URL}/swipe`, {
         target_user_id: currentProfile.user_id,
         action,
+        prefetch: PREFETCH_CARDS,
+        view: 'compact',
       }, { headers });
 
+      // Server-side queue head replaces the cards after the one on screen now;
+      // read the index at response time, other swipes may have landed meanwhile
+      if (res.data.next_cards?.length) {
+        setProfiles((prev) => {
+          const seen = prev.slice(0, indexRef.current + 1);
+          const seenIds = new Set(seen.map((p) => p.user_id));
+          return [...seen, ...res.data.next_cards.filter((p) => !seenIds.has(p.user_id))];
+        });
+      }
+
+      setCurrentIndex((i) => i + 1);
+
       if (res.data.match_created) {
-        setMatchedUser(currentProfile.profile);
+        if (res.data.is_super_match) toast.success('💫 SUPER MATCH!', { duration: 3000 });
+        else toast.success("💕 It's a Match!", { duration: 3000 });
+
+        // Compact cards carry no socials or gender; load the full card before
+        // opening the popup, and drop it if a newer match got there first
+        const matchUserId = currentProfile.user_id;
+        latestMatchRef.current = matchUserId;
+        let matched = currentProfile.profile;
+        try {
+          const details = await axios.get(`${API_BASE_URL}/recommendations/${matchUserId}`, { headers });
+          matched = details.data.profile;
+        } catch (e) {}
+        if (latestMatchRef.current !== matchUserId) return;
+        setMatchedUser(matched);
         setIsSuperMatch(res.data.is_super_match);
         setCompatibilityScore(res.data.compatibility_score);
         setCompatibilityStrengths(res.data.compatibility_details?.strengths || []);
         setShowMatch(true);
-        if (res.data.is_super_match) toast.success('💫 SUPER MATCH!', { duration: 3000 });
-        else toast.success("💕 It's a Match!", { duration: 3000 });
       }
-      setCurrentIndex((i) => i + 1);
     } catch (e) {
       toast.error('Error recording swipe.');
     }